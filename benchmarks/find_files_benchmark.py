@@ -0,0 +1,134 @@
+"""
+Benchmark for DirectoryScanner.find_files on a synthetic monorepo.
+
+Builds a throwaway tree with many packages plus heavy `node_modules`, `.venv`
+and `.git` folders, and compares the current implementation with the previous
+`os.walk` based one: both must find the same files, apart from those the new
+walk prunes on purpose, and the timings are written to
+results/benchmark-find_files-<timestamp>.json. Run with:
+
+    uv run benchmarks/find_files_benchmark.py
+"""
+
+import fnmatch
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.constants.directories import SKIP_DIRS
+from src.utils.directory_index import is_skipped
+from src.utils.directory_scanning import DirectoryScanner
+
+RESULTS_DIR = Path(__file__).parent.parent / "results"
+
+
+def legacy_find_files(found_folder: Path) -> list:
+    """The os.walk implementation find_files used before it was rewritten."""
+    files = []
+    for root, _, filenames in os.walk(found_folder):
+        if any(fnmatch.fnmatch(root, f"*/{skip_dir}/*") for skip_dir in SKIP_DIRS):
+            continue
+        k = 0
+        for filename in filenames:
+            for skip_dir in SKIP_DIRS:
+                if skip_dir in filename:
+                    k = 1
+                    break
+            if k == 0:
+                if filename.endswith(".py") or filename.endswith(".ipynb"):
+                    files.append(str(Path(root) / filename))
+    return files
+
+
+def expected_from_legacy(root: Path, legacy_files: list) -> set:
+    """
+    The legacy result without the files the new walk leaves out on purpose.
+
+    The legacy walk only skipped the folders below a skipped directory and
+    never left out hidden ones; the new walk prunes both before entering them.
+    """
+    return {
+        path
+        for path in legacy_files
+        if not any(is_skipped(part) for part in Path(path).relative_to(root).parts[:-1])
+    }
+
+
+def build_monorepo(root: Path, packages: int = 60) -> None:
+    """Create packages with sources next to large dependency and VCS folders."""
+    for package in range(packages):
+        for module in range(4):
+            module_dir = (
+                root / "packages" / f"package_{package}" / "src" / f"mod_{module}"
+            )
+            module_dir.mkdir(parents=True)
+            for index in range(5):
+                (module_dir / f"file_{index}.py").write_text("")
+        (root / "packages" / f"package_{package}" / "README.md").write_text("")
+
+    for heavy, count in (
+        ("node_modules", 400),
+        (".venv/lib/python3.12", 300),
+        (".git/objects", 200),
+    ):
+        for index in range(count):
+            folder = root / heavy / f"dep_{index}" / "dist"
+            folder.mkdir(parents=True)
+            for name in ("index.js", "module.py", "types.d.ts"):
+                (folder / name).write_text("")
+
+    (root / ".gitignore").write_text("node_modules/\n")
+
+
+def best_of(function, repeats: int = 5) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir) / "monorepo"
+        build_monorepo(root)
+        scanner = DirectoryScanner(Path(temp_dir), use_index=False)
+
+        legacy = best_of(lambda: legacy_find_files(root))
+        sequential = best_of(lambda: scanner.find_files(root, max_workers=1))
+        parallel = best_of(lambda: scanner.find_files(root))
+
+        # .gitignore rules only remove more files, so compare without them.
+        expected = expected_from_legacy(root, legacy_find_files(root))
+        found = set(scanner.find_files(root, respect_gitignore=False))
+        if found != expected:
+            raise SystemExit(
+                f"find_files disagrees with the legacy walk: "
+                f"{len(found - expected)} extra, {len(expected - found)} missing"
+            )
+
+        results = {
+            "benchmark": "find_files",
+            "files_found": len(scanner.find_files(root)),
+            "matches_legacy": True,
+            "legacy_seconds": round(legacy, 4),
+            "sequential_seconds": round(sequential, 4),
+            "parallel_seconds": round(parallel, 4),
+            "speedup": round(legacy / parallel, 1),
+        }
+
+    print(json.dumps(results, indent=2))
+    RESULTS_DIR.mkdir(exist_ok=True)
+    output = RESULTS_DIR / f"benchmark-find_files-{datetime.now():%Y%m%d-%H%M%S}.json"
+    with open(output, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
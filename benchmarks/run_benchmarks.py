@@ -0,0 +1,311 @@
+"""
+Offline benchmarks for the agent pipelines.
+
+Every scenario in benchmarks/scenarios replays recorded model turns and recorded
+Google Calendar, OMDB, Open Library, YouTube and Substack payloads (see
+stand_ins.py), so no network access or API key is needed. For each scenario the
+wall time of the whole query and of every agent taking part, the tool calls,
+the peak traced allocation and the token usage are written to
+results/benchmark-<timestamp>.json.
+
+Usage:
+    uv run benchmarks/run_benchmarks.py [--repeats N] [--scenario NAME ...]
+        [--warm] [--compare results/benchmark-<earlier>.json]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import importlib
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.stand_ins import RecordedResponses, offline_environment
+from src.agents.agent_pool import get_agent_pool
+from src.utils.http_client import get_http_cache
+from src.utils.response_cache import get_response_cache
+from src.utils.tool_cache import get_process_tool_cache
+
+ROOT_DIR = Path(__file__).parent.parent
+SCENARIOS_DIR = Path(__file__).parent / "scenarios"
+RESULTS_DIR = ROOT_DIR / "results"
+
+# Agent class name -> module defining it.
+AGENT_MODULES = {
+    "BookAgent": "src.agents.books_agent",
+    "MoviesAgent": "src.agents.movies_agent",
+    "CalendarAgent": "src.agents.google_calendar_agent",
+    "RecommenderAgent": "src.agents.recommender_agent",
+    "HomeAgent": "src.agents.home_agent",
+    "TaskAgent": "src.agents.task_agent",
+}
+
+
+def load_scenarios(names: list = None) -> list:
+    """
+    Read the scenario files.
+
+    Args:
+        names (list): Only load these scenarios; all if empty or None.
+
+    Returns:
+        list: The scenarios, sorted by name.
+    """
+    scenarios = []
+    for path in sorted(SCENARIOS_DIR.glob("*.json")):
+        with open(path) as file:
+            scenario = json.load(file)
+        if not names or scenario["name"] in names:
+            scenarios.append(scenario)
+    return scenarios
+
+
+def clear_caches() -> None:
+    """Forget cached answers, tool results, HTTP responses and idle agents, so every run starts cold."""
+    get_response_cache().invalidate()
+    get_http_cache().clear()
+    get_process_tool_cache().invalidate()
+    get_agent_pool().clear()
+
+
+async def run_query(agent, question: str) -> dict:
+    """
+    Stream one query and collect per-agent timings, tool calls and tokens.
+
+    Returns:
+        dict: `wall_time_s`, and per agent name `agent_wall_time_s`, `tool_calls`
+            and `tokens`.
+    """
+    started_at = time.perf_counter()
+    first_event_at = {}
+    agent_wall_time = {}
+    tool_calls = defaultdict(lambda: defaultdict(int))
+    tokens = {}
+
+    async for event in agent.stream_query(question):
+        now = time.perf_counter()
+        name = event["agent"]
+        # The top-level agent starts with the query; sub-agents with their first event.
+        first_event_at.setdefault(name, started_at if event["depth"] == 0 else now)
+        if event["type"] == "tool_use":
+            tool_calls[name][event["name"]] += 1
+        elif event["type"] == "result":
+            agent_wall_time[name] = now - first_event_at[name]
+            usage = event["result"].metrics.accumulated_usage
+            tokens[name] = {
+                "input": usage["inputTokens"],
+                "output": usage["outputTokens"],
+            }
+
+    return {
+        "wall_time_s": time.perf_counter() - started_at,
+        "agent_wall_time_s": agent_wall_time,
+        "tool_calls": {name: dict(calls) for name, calls in tool_calls.items()},
+        "tokens": tokens,
+    }
+
+
+def run_scenario(scenario: dict, repeats: int, warm: bool) -> dict:
+    """
+    Run a scenario `repeats` times for timing and once more under tracemalloc.
+
+    Args:
+        scenario (dict): The scenario.
+        repeats (int): Number of timed runs.
+        warm (bool): Keep the response, tool and agent caches between runs.
+
+    Returns:
+        dict: The scenario's results.
+    """
+    module = importlib.import_module(AGENT_MODULES[scenario["agent"]])
+    agent_class = getattr(module, scenario["agent"])
+    recordings = RecordedResponses.load()
+
+    runs = []
+    with offline_environment(scenario["turns"], recordings):
+        clear_caches()
+
+        def run_once():
+            if not warm:
+                clear_caches()
+            agent = agent_class()
+            # strands prints the streamed answer; keep the report readable.
+            with contextlib.redirect_stdout(io.StringIO()):
+                return asyncio.run(run_query(agent, scenario["question"]))
+
+        for _ in range(repeats):
+            requests_before = len(recordings.requests)
+            runs.append(run_once())
+        # Requests of the last timed run only; with --warm earlier runs may
+        # have answered from the caches.
+        http_requests = len(recordings.requests) - requests_before
+
+        tracemalloc.start()
+        try:
+            run_once()
+            _, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    wall_times = [run["wall_time_s"] for run in runs]
+    agent_names = {name for run in runs for name in run["agent_wall_time_s"]}
+    last_run = runs[-1]
+    return {
+        "agent": scenario["agent"],
+        "wall_time_s": {
+            "median": statistics.median(wall_times),
+            "min": min(wall_times),
+            "max": max(wall_times),
+        },
+        "agent_wall_time_s": {
+            name: statistics.median(
+                run["agent_wall_time_s"][name]
+                for run in runs
+                if name in run["agent_wall_time_s"]
+            )
+            for name in sorted(agent_names)
+        },
+        "tool_calls": last_run["tool_calls"],
+        "tokens": last_run["tokens"],
+        "peak_traced_bytes": peak_bytes,
+        "http_requests": http_requests,
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _total_tokens(result: dict) -> int:
+    return sum(usage["input"] + usage["output"] for usage in result["tokens"].values())
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> list:
+    """
+    Compare results with an earlier run.
+
+    Wall time and memory are compared relative to the baseline; tool calls and
+    tokens are deterministic for recorded fixtures, so any change is reported.
+
+    Args:
+        results (dict): The current results.
+        baseline (dict): Results of an earlier run.
+        max_regression (float): Allowed relative increase of median wall time
+            and peak memory.
+
+    Returns:
+        list: Descriptions of the regressions found.
+    """
+    regressions = []
+    for name, result in results["scenarios"].items():
+        previous = baseline["scenarios"].get(name)
+        if previous is None:
+            continue
+        for label, current_value, previous_value in (
+            (
+                "median wall time",
+                result["wall_time_s"]["median"],
+                previous["wall_time_s"]["median"],
+            ),
+            (
+                "peak traced memory",
+                result["peak_traced_bytes"],
+                previous["peak_traced_bytes"],
+            ),
+        ):
+            change = current_value / previous_value - 1 if previous_value else 0.0
+            print(f"  {name}: {label} {change:+.1%}")
+            if change > max_regression:
+                regressions.append(f"{name}: {label} increased by {change:.1%}")
+        if result["tool_calls"] != previous["tool_calls"]:
+            regressions.append(
+                f"{name}: tool calls changed from {previous['tool_calls']} to {result['tool_calls']}"
+            )
+        if _total_tokens(result) != _total_tokens(previous):
+            regressions.append(
+                f"{name}: tokens changed from {_total_tokens(previous)} to {_total_tokens(result)}"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="Timed runs per scenario"
+    )
+    parser.add_argument("--scenario", nargs="*", help="Only run these scenarios")
+    parser.add_argument(
+        "--warm", action="store_true", help="Keep caches between runs of a scenario"
+    )
+    parser.add_argument("--compare", help="Earlier results file to compare with")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="Allowed relative increase of wall time and memory with --compare",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Show agent logs")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logger.remove()
+        logger.add(sys.stderr, level="WARNING")
+
+    results = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "repeats": args.repeats,
+        "warm": args.warm,
+        "scenarios": {},
+    }
+    for scenario in load_scenarios(args.scenario):
+        result = run_scenario(scenario, args.repeats, args.warm)
+        results["scenarios"][scenario["name"]] = result
+        tool_calls = sum(sum(calls.values()) for calls in result["tool_calls"].values())
+        print(
+            f"{scenario['name']:<28} {result['wall_time_s']['median'] * 1000:8.1f} ms"
+            f"  {tool_calls:3d} tool calls  {_total_tokens(result):6d} tokens"
+            f"  {result['peak_traced_bytes'] / 1024:8.0f} KiB peak"
+        )
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    output = RESULTS_DIR / f"benchmark-{datetime.now():%Y%m%d-%H%M%S}.json"
+    with open(output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        print(f"Compared with {args.compare}:")
+        regressions = compare(results, baseline, args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
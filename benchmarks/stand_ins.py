@@ -0,0 +1,246 @@
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Iterator
+from unittest import mock
+from urllib.parse import urlsplit
+
+import httplib2
+import requests
+from strands.models.model import Model
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.agents.agent import AgentAbstract
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class ReplayModel(Model):
+    """
+    Model that answers with the recorded turns of one agent.
+
+    The turn is chosen by the number of assistant messages in the conversation,
+    so a pooled agent that was reset replays its script from the start. Every
+    turn is a dict with `content` (blocks of `{"text": ...}` or
+    `{"tool": name, "input": {...}}`) and the recorded `usage`.
+
+    Args:
+        agent_name: Class name of the agent, used in error messages and tool use IDs.
+        turns: The recorded turns.
+    """
+
+    def __init__(self, agent_name: str, turns: list):
+        self.agent_name = agent_name
+        self.turns = turns
+
+    def update_config(self, **model_config):
+        pass
+
+    def get_config(self):
+        return {"model_id": f"replay/{self.agent_name}"}
+
+    async def structured_output(self, output_model, prompt, **kwargs):
+        raise NotImplementedError("Recorded fixtures contain no structured output")
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        turn_index = sum(1 for message in messages if message["role"] == "assistant")
+        if turn_index >= len(self.turns):
+            raise RuntimeError(
+                f"No recorded turn {turn_index + 1} for {self.agent_name}"
+            )
+        turn = self.turns[turn_index]
+
+        yield {"messageStart": {"role": "assistant"}}
+        uses_tools = False
+        for block_index, block in enumerate(turn["content"]):
+            if "text" in block:
+                # Recorded answers arrive in a few chunks, like a streamed response.
+                for chunk in re.findall(r".{1,64}", block["text"], re.DOTALL):
+                    yield {"contentBlockDelta": {"delta": {"text": chunk}}}
+            else:
+                uses_tools = True
+                start = {
+                    "toolUseId": f"{self.agent_name}-{turn_index}-{block_index}",
+                    "name": block["tool"],
+                }
+                yield {"contentBlockStart": {"start": {"toolUse": start}}}
+                delta = {"toolUse": {"input": json.dumps(block.get("input", {}))}}
+                yield {"contentBlockDelta": {"delta": delta}}
+            yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "tool_use" if uses_tools else "end_turn"}}
+
+        usage = turn.get("usage", {})
+        input_tokens = usage.get("inputTokens", 0)
+        output_tokens = usage.get("outputTokens", 0)
+        yield {
+            "metadata": {
+                "usage": {
+                    "inputTokens": input_tokens,
+                    "outputTokens": output_tokens,
+                    "totalTokens": input_tokens + output_tokens,
+                },
+                "metrics": {"latencyMs": turn.get("latency_ms", 0)},
+            }
+        }
+
+
+class RecordedResponses:
+    """
+    Recorded HTTP payloads, matched on host and path.
+
+    Query strings are ignored, so one payload answers every search against an
+    endpoint. A request without a recording raises ConnectionError instead of
+    reaching the network.
+    """
+
+    def __init__(self, recordings: list):
+        self.recordings = recordings
+        self.requests: list = []
+
+    @classmethod
+    def load(cls, path: Path = FIXTURES_DIR / "http_responses.json"):
+        with open(path) as file:
+            return cls(json.load(file))
+
+    def find(self, method: str, url: str) -> dict:
+        parts = urlsplit(url)
+        path = re.sub("/+", "/", parts.path) or "/"
+        self.requests.append(f"{method} {parts.hostname}{path}")
+        for recording in self.recordings:
+            if (
+                recording.get("method", "GET") == method
+                and recording["host"] == parts.hostname
+                and re.fullmatch(recording["path"], path)
+            ):
+                return recording
+        raise requests.ConnectionError(
+            f"No recorded response for {method} {parts.hostname}{path}"
+        )
+
+    def requests_send(self, request: requests.PreparedRequest) -> requests.Response:
+        """Answer a request sent with `requests`."""
+        recording = self.find(request.method, request.url)
+        response = requests.Response()
+        response.status_code = recording.get("status", 200)
+        response._content = json.dumps(recording["body"]).encode()
+        response.headers["Content-Type"] = "application/json"
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def httplib2_request(self, uri: str, method: str = "GET") -> tuple:
+        """Answer a request sent with `httplib2`, used by the Google API client."""
+        recording = self.find(method, uri)
+        response = httplib2.Response(
+            {
+                "status": str(recording.get("status", 200)),
+                "content-type": "application/json",
+            }
+        )
+        return response, json.dumps(recording["body"]).encode()
+
+
+def _offline_calendar_service():
+    from googleapiclient.discovery import build
+
+    return build("calendar", "v3", developerKey="offline", static_discovery=True)
+
+
+@contextmanager
+def offline_environment(
+    turns: dict, recordings: RecordedResponses
+) -> Iterator[RecordedResponses]:
+    """
+    Run agents against recorded model turns, HTTP payloads and data files.
+
+    Inside the block every AgentAbstract subclass gets a ReplayModel with the
+    turns recorded for its class name, `requests` and `httplib2` answer from the
+    recordings, Google Calendar needs no credentials, the book, movie,
+    newsletter and channel lists are fresh copies of the fixture files, and the
+    HTTP response cache starts empty.
+
+    Args:
+        turns (dict): Agent class name -> recorded turns.
+        recordings (RecordedResponses): The HTTP payloads.
+
+    Yields:
+        RecordedResponses: The recordings, with the requests made so far.
+    """
+    from src.utils import http_client, list_store
+    from src.utils.config_loader import load_config
+
+    models = {
+        name: ReplayModel(name, agent_turns) for name, agent_turns in turns.items()
+    }
+
+    def replay_model(agent):
+        name = type(agent).__name__
+        if name not in models:
+            raise RuntimeError(f"The scenario has no recorded turns for {name}")
+        return models[name]
+
+    recommender_config = load_config().recommender_agent
+    with ExitStack() as stack:
+        data_dir = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        shutil.copytree(FIXTURES_DIR / "data", data_dir, dirs_exist_ok=True)
+
+        patches = [
+            mock.patch.object(AgentAbstract, "_get_shared_model", replay_model),
+            mock.patch.object(
+                requests.adapters.HTTPAdapter,
+                "send",
+                lambda adapter, request, **kwargs: recordings.requests_send(request),
+            ),
+            mock.patch.object(
+                httplib2.Http,
+                "request",
+                lambda http, uri, method="GET", *args, **kwargs: (
+                    recordings.httplib2_request(uri, method)
+                ),
+            ),
+            mock.patch(
+                "src.tools.celander_tools.authenticate_calendar",
+                _offline_calendar_service,
+            ),
+            # The Substack client sleeps two seconds after every request.
+            mock.patch("substack_api.newsletter.sleep", lambda seconds: None),
+            # Cached OMDB and Open Library responses go to a fresh cache.
+            mock.patch.dict(http_client._caches, clear=True),
+            mock.patch.object(http_client, "HTTP_CACHE_DIR", data_dir / "http"),
+            # The stores import the copied JSON lists into fresh databases.
+            mock.patch.dict(list_store._stores, clear=True),
+            mock.patch.object(
+                list_store, "BOOK_DB_PATH", data_dir / "book_list.sqlite3"
+            ),
+            mock.patch.object(
+                list_store, "BOOK_LIST_PATH", data_dir / "book_list.json"
+            ),
+            mock.patch.object(
+                list_store, "MOVIE_DB_PATH", data_dir / "movie_and_show.sqlite3"
+            ),
+            mock.patch.object(
+                list_store, "MOVIE_LIST_PATH", data_dir / "movie_and_show.json"
+            ),
+            mock.patch.object(
+                recommender_config,
+                "substack_directory",
+                str(data_dir / "substack_newsletters.json"),
+            ),
+            mock.patch.object(
+                recommender_config,
+                "youtube_directory",
+                str(data_dir / "youtube_channels.json"),
+            ),
+            mock.patch.dict(
+                os.environ, {"OMDB_API_KEY": "offline", "YOUTUBE_API_KEY": "offline"}
+            ),
+        ]
+        for patch in patches:
+            stack.enter_context(patch)
+        yield recordings
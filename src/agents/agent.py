@@ -1,27 +1,55 @@
+import asyncio
+import contextvars
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from dotenv import load_dotenv
-from strands import Agent
-from strands.agent.conversation_manager import SlidingWindowConversationManager
-from strands.models import BedrockModel
-from strands.models.litellm import LiteLLMModel
+from opentelemetry import trace
 
-sys.path.append(str(Path(__file__).parent.parent))
-from typing import Optional
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from typing import AsyncIterator, Optional
 
 from src.utils.config_loader import load_config
+from src.utils.persistence import write_batch
+from src.utils.response_cache import data_fingerprint, get_response_cache
+from src.utils.tool_cache import request_scope
+from src.utils.tracing import (
+    ToolSpanHooks,
+    instrument_model,
+    setup_tracing,
+    start_query_span,
+    tracing_enabled,
+)
 
 from abc import ABC, abstractmethod
 
 load_dotenv()
 
+# Model clients are stateless between requests, so agents with the same model share one.
+_shared_models: dict = {}
+_shared_models_lock = threading.Lock()
+
+# (event loop, queue) of the stream_query call whose tools are currently running.
+# Sub-agents queried from those tools forward their events into the queue.
+_stream_sink: contextvars.ContextVar = contextvars.ContextVar(
+    "stream_sink", default=None
+)
+_STREAM_DONE = object()
+
 
 class AgentAbstract(ABC):
     """Abstract base class for agents that can be initialized with different model configurations
     and provides methods for running queries"""
 
+    # Seconds during which an answer of this agent may be served from the response
+    # cache; 0 disables caching for the agent.
+    response_cache_ttl: float = 0
+    # Tools that only read data. Answers that called any other tool are not cached.
+    cacheable_tools: frozenset = frozenset()
+
     def __init__(self, config: Optional[object] = None):
         """
         Initialize the agent with the necessary tools and configurations.
@@ -30,9 +58,10 @@ class AgentAbstract(ABC):
             config: Optional configuration object. If None, will load from load_config()
         """
         self.config = config or load_config()
+        setup_tracing(self.config.tracing)
         self.openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
         self.model_id = self.get_agent_config().model.model_id
-        self.model = self._initialize_model()
+        self.model = self._get_shared_model()
         self.agent = self._initialize_agent()
 
     @abstractmethod
@@ -65,9 +94,45 @@ class AgentAbstract(ABC):
         """
         pass
 
+    def get_data_sources(self) -> list:
+        """
+        Return the files this agent's answers are based on.
+
+        Returns:
+            list: Paths whose changes invalidate the agent's cached answers.
+        """
+        return []
+
+    def cache_fingerprint(self) -> tuple:
+        """
+        Describe the state of the data this agent's answers are based on.
+
+        Returns:
+            tuple: Part of the response cache key; a cached answer is only served
+                while the fingerprint is unchanged.
+        """
+        return data_fingerprint(self.get_data_sources())
+
+    def _get_shared_model(self):
+        """Return the model client for this agent's model ID, creating it on first use."""
+        with _shared_models_lock:
+            if self.model_id not in _shared_models:
+                model = self._initialize_model()
+                if tracing_enabled():
+                    instrument_model(model)
+                _shared_models[self.model_id] = model
+            return _shared_models[self.model_id]
+
     def _initialize_model(self):
-        """Initialize the appropriate model based on configuration."""
+        """
+        Initialize the appropriate model based on configuration.
+
+        The model clients are imported here: litellm alone takes seconds to import,
+        and only one of the two clients is needed.
+        """
         if self.model_id.startswith("openrouter"):
+            from strands.models.litellm import LiteLLMModel
+
             return LiteLLMModel(
                 model_id=self.model_id,
                 client_args={"api_key": self.openrouter_api_key},
@@ -75,6 +140,8 @@ class AgentAbstract(ABC):
                 streaming=True,
             )
         elif self.model_id.startswith("anthropic"):
+            from strands.models import BedrockModel
+
             return BedrockModel(
                 model_id=self.model_id,
                 client_args={"region_name": "us-east-1"},
@@ -84,23 +151,255 @@ class AgentAbstract(ABC):
 
     def _initialize_agent(self):
         """Initialize the agent with tools, model, and conversation manager."""
+        from strands import Agent
+        from strands.agent.conversation_manager import SlidingWindowConversationManager
+
         tools = self.get_tools()
+        agent_name = type(self).__name__
         self.agent = Agent(
             model=self.model,
             tools=tools,
             conversation_manager=SlidingWindowConversationManager(window_size=10),
             system_prompt=self.get_prompt(),
+            name=agent_name,
+            hooks=[ToolSpanHooks(agent_name)] if tracing_enabled() else None,
         )
         return self.agent
 
+    def reset(self):
+        """
+        Clear the conversation and state of the agent, so it can serve a new request
+        as if it was just created.
+        """
+        from strands.agent.state import AgentState
+        from strands.telemetry.metrics import EventLoopMetrics
+
+        self.agent.messages.clear()
+        self.agent.state = AgentState()
+        self.agent.event_loop_metrics = EventLoopMetrics()
+        self.agent.conversation_manager.removed_message_count = 0
+
+    def _lookup_response(self, question: str) -> tuple:
+        """
+        Look up a cached answer and capture what is needed to store a new one.
+
+        Returns:
+            tuple: (cached response or None, state for `_store_response` or None
+                if the answer must not be cached).
+        """
+        settings = self.config.response_cache
+        # Follow-up questions depend on the conversation, so only fresh ones are cached.
+        if self.response_cache_ttl <= 0 or not settings.enabled or self.agent.messages:
+            return None, None
+        cache = get_response_cache(settings.max_entries, settings.similarity_threshold)
+        fingerprint = self.cache_fingerprint()
+        response = cache.get(type(self).__name__, question, fingerprint)
+        if response is not None:
+            # Keep the exchange in the conversation, so follow-up questions have context.
+            self.agent.messages.append(
+                {"role": "user", "content": [{"text": question}]}
+            )
+            self.agent.messages.append(response.message)
+            return response, None
+
+        tool_calls = {
+            name: metrics.call_count
+            for name, metrics in self.agent.event_loop_metrics.tool_metrics.items()
+        }
+        return None, (cache, fingerprint, tool_calls)
+
+    def _store_response(self, question: str, state: Optional[tuple], response):
+        """Cache an answer unless it called a tool that is not in `cacheable_tools`."""
+        if state is None:
+            return
+        cache, fingerprint, tool_calls = state
+        used_tools = {
+            name
+            for name, metrics in self.agent.event_loop_metrics.tool_metrics.items()
+            if metrics.call_count > tool_calls.get(name, 0)
+        }
+        agent_name = type(self).__name__
+        if used_tools <= self.cacheable_tools:
+            cache.put(
+                agent_name, question, response, self.response_cache_ttl, fingerprint
+            )
+        else:
+            # A tool changed data, possibly data the fingerprint does not cover.
+            cache.invalidate(agent_name)
+
+    async def _prepare_query(self):
+        """Hook awaited before every query, e.g. to start services the tools need."""
+
+    def _query_failed(self, error: Exception):
+        """Hook called when a query raises."""
+
+    async def query_async(self, question: str):
+        """
+        Run a single query against the agent without blocking the event loop.
+
+        Agents with a `response_cache_ttl` answer repeated questions from the
+        response cache while their data sources are unchanged. Tools share
+        request-scoped cached results with the sub-agents of the same query.
+        When called from a tool of an agent that is being streamed with
+        `stream_query`, this agent's events are forwarded into that stream.
+
+        Args:
+            question: The question to ask the agent
+
+        Returns:
+            The agent's response
+        """
+        sink = _stream_sink.get()
+        if sink is None or sink[0] is not asyncio.get_running_loop():
+            span = start_query_span(type(self).__name__, question)
+            with trace.use_span(span, end_on_exit=True):
+                cached, cache_state = self._lookup_response(question)
+                span.set_attribute("charon.response_cache_hit", cached is not None)
+                if cached is not None:
+                    return cached
+                await self._prepare_query()
+                try:
+                    with request_scope(), write_batch():
+                        result = await self.agent.invoke_async(question)
+                except Exception as e:
+                    self._query_failed(e)
+                    raise
+                self._store_response(question, cache_state, result)
+                return result
+
+        result = None
+        async for event in self.stream_query(question):
+            if event["type"] == "result" and event["depth"] == 0:
+                result = event["result"]
+            sink[1].put_nowait({**event, "depth": event["depth"] + 1})
+        return result
+
+    async def stream_query(self, question: str) -> AsyncIterator[dict]:
+        """
+        Run a single query and yield its events as they arrive.
+
+        Every event is a dict with `type`, `agent` (the class name) and `depth`
+        (0 for this agent, 1 for sub-agents queried by its tools, and so on):
+            - text: a chunk of the model's answer in `text`
+            - tool_use: the model started calling tool `name` (`tool_use_id`)
+            - tool_result: tool call `tool_use_id` finished with `status`
+            - result: the final AgentResult in `result`
+
+        An answer from the response cache is yielded as one text and one result event.
+
+        Args:
+            question: The question to ask the agent
+
+        Yields:
+            dict: The events described above.
+        """
+        agent_name = type(self).__name__
+        # The span is only made current inside the producer task; a generator must
+        # not leave its context changed while it is suspended at a yield.
+        span = start_query_span(agent_name, question)
+        try:
+            cached, cache_state = self._lookup_response(question)
+            span.set_attribute("charon.response_cache_hit", cached is not None)
+            if cached is not None:
+                yield {
+                    "type": "text",
+                    "text": str(cached),
+                    "agent": agent_name,
+                    "depth": 0,
+                }
+                yield {
+                    "type": "result",
+                    "result": cached,
+                    "agent": agent_name,
+                    "depth": 0,
+                }
+                return
+
+            queue = asyncio.Queue()
+
+            async def produce():
+                _stream_sink.set((asyncio.get_running_loop(), queue))
+                try:
+                    with trace.use_span(span):
+                        await self._prepare_query()
+                        with request_scope(), write_batch():
+                            async for event in self.agent.stream_async(question):
+                                converted = _convert_stream_event(event)
+                                if converted is None:
+                                    continue
+                                if converted["type"] == "result":
+                                    self._store_response(
+                                        question, cache_state, converted["result"]
+                                    )
+                                queue.put_nowait(
+                                    {**converted, "agent": agent_name, "depth": 0}
+                                )
+                except Exception as e:
+                    self._query_failed(e)
+                    raise
+                finally:
+                    queue.put_nowait(_STREAM_DONE)
+
+            # The task gets its own copy of the context, so the sink is only visible
+            # to this agent's tools.
+            task = asyncio.create_task(produce())
+            try:
+                while (event := await queue.get()) is not _STREAM_DONE:
+                    yield event
+                await task
+            finally:
+                if not task.done():
+                    task.cancel()
+        finally:
+            span.end()
+
     def query(self, question: str):
         """
         Run a single query against the agent.
 
+        Synchronous wrapper around `query_async`; it runs in its own event loop on
+        a worker thread, so it can also be called from inside a running loop.
+
         Args:
             question: The question to ask the agent
 
         Returns:
             The agent's response
         """
-        return self.agent(question)
+        context = contextvars.copy_context()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(
+                context.run, asyncio.run, self.query_async(question)
+            ).result()
+
+
+def _convert_stream_event(event: dict) -> Optional[dict]:
+    """Map a strands stream event to a stream_query event, or None to skip it."""
+    if "data" in event:
+        return {"type": "text", "text": event["data"]}
+    if "result" in event:
+        return {"type": "result", "result": event["result"]}
+
+    tool_use = (
+        event.get("event", {})
+        .get("contentBlockStart", {})
+        .get("start", {})
+        .get("toolUse")
+    )
+    if tool_use:
+        return {
+            "type": "tool_use",
+            "name": tool_use["name"],
+            "tool_use_id": tool_use["toolUseId"],
+        }
+
+    message = event.get("message")
+    if message and message["role"] == "user":
+        for content in message["content"]:
+            if "toolResult" in content:
+                return {
+                    "type": "tool_result",
+                    "tool_use_id": content["toolResult"]["toolUseId"],
+                    "status": content["toolResult"]["status"],
+                }
+    return None
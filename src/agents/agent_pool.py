@@ -0,0 +1,147 @@
+import asyncio
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Iterator, Type
+
+from loguru import logger
+
+# Idle instances kept per agent class; concurrent requests beyond this get
+# temporary instances that are dropped after use.
+MAX_IDLE_AGENTS = 4
+
+
+class AgentPool:
+    """
+    A thread-safe pool of sub-agent instances, keyed by agent class.
+
+    Agents are created lazily on first use and returned to the pool after each
+    request with their conversation reset. A strands Agent handles one request at
+    a time, so concurrent requests for the same class each get their own instance.
+    """
+
+    def __init__(self, max_idle: int = MAX_IDLE_AGENTS):
+        self.max_idle = max_idle
+        self._idle: dict = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, agent_class: Type):
+        """
+        Take an idle agent of the given class from the pool, or create a new one.
+
+        Args:
+            agent_class (Type): An AgentAbstract subclass.
+
+        Returns:
+            AgentAbstract: An agent with an empty conversation.
+        """
+        with self._lock:
+            idle = self._idle.setdefault(agent_class, [])
+            if idle:
+                return idle.pop()
+        logger.info(f"Creating a new {agent_class.__name__} for the agent pool")
+        return agent_class()
+
+    def release(self, agent) -> None:
+        """
+        Reset an agent and return it to the pool.
+
+        Agents that fail to reset are discarded.
+
+        Args:
+            agent (AgentAbstract): An agent obtained from `acquire`.
+        """
+        try:
+            agent.reset()
+        except Exception as e:
+            logger.warning(
+                f"Discarding {type(agent).__name__} that failed to reset: {e}"
+            )
+            return
+        with self._lock:
+            idle = self._idle.setdefault(type(agent), [])
+            if len(idle) < self.max_idle:
+                idle.append(agent)
+
+    @contextmanager
+    def agent(self, agent_class: Type) -> Iterator:
+        """
+        Borrow an agent for the duration of a `with` block.
+
+        Args:
+            agent_class (Type): An AgentAbstract subclass.
+
+        Yields:
+            AgentAbstract: An agent with an empty conversation.
+        """
+        agent = self.acquire(agent_class)
+        try:
+            yield agent
+        finally:
+            self.release(agent)
+
+    def clear(self) -> None:
+        """Drop all idle agents, e.g. after the configuration changed."""
+        with self._lock:
+            self._idle.clear()
+
+
+_agent_pool = AgentPool()
+# Event loop -> semaphore capping the sub-agents queried concurrently from that loop.
+# strands runs every orchestrator request in its own loop, so the cap applies per request.
+_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_agent_pool() -> AgentPool:
+    """
+    Return the process-wide agent pool.
+
+    Returns:
+        AgentPool: The shared pool used by the delegation tools.
+    """
+    return _agent_pool
+
+
+async def query_sub_agent(
+    agent_class: Type, question: str, max_parallel: int, timeout: float
+):
+    """
+    Query a pooled sub-agent from an async tool of an orchestrator agent.
+
+    Tool calls emitted in the same model turn run as concurrent asyncio tasks, so
+    independent sub-agents answer in parallel; at most `max_parallel` of them run
+    at once per request.
+
+    Args:
+        agent_class (Type): The AgentAbstract subclass to query.
+        question (str): The question for the sub-agent.
+        max_parallel (int): Maximum number of sub-agents running at once.
+        timeout (float): Seconds after which the sub-agent call is cancelled.
+
+    Returns:
+        AgentResult: The sub-agent's response.
+
+    Raises:
+        TimeoutError: If the sub-agent did not answer within `timeout` seconds.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(max_parallel)
+
+    async def run():
+        async with semaphore:
+            # Creating an agent can block (e.g. starting an MCP server), so it
+            # must not stall the other sub-agents on this loop.
+            agent = await asyncio.to_thread(_agent_pool.acquire, agent_class)
+            try:
+                return await agent.query_async(question)
+            finally:
+                _agent_pool.release(agent)
+
+    try:
+        return await asyncio.wait_for(run(), timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError(
+            f"{agent_class.__name__} did not answer within {timeout:g} seconds"
+        ) from None
@@ -2,15 +2,9 @@ from pathlib import Path
 import sys
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.tools.books_tools import (
-    add_book_to_reading_list,
-    get_book_lists,
-    mark_book_read,
-    search_book,
-)
 from src.agents.agent import AgentAbstract
 from dotenv import load_dotenv
-from utils.prompts import BOOKS_AGENT_PROMPT
+from src.utils.prompts import BOOKS_AGENT_PROMPT
 
 load_dotenv()
 
@@ -21,6 +15,9 @@ class BookAgent(AgentAbstract):
     It can add books to a reading list, mark books as read, and search for books.
     """
 
+    response_cache_ttl = 3600
+    cacheable_tools = frozenset({"get_book_lists", "recommend_books", "search_book"})
+
     def get_agent_config(self):
         """Return the Books agent configuration."""
         return self.config.books_agent
@@ -31,9 +28,24 @@ class BookAgent(AgentAbstract):
 
     def get_tools(self):
         """Return the list of tools available for this agent."""
+        from src.tools.books_tools import (
+            add_book_to_reading_list,
+            get_book_lists,
+            mark_book_read,
+            recommend_books,
+            search_book,
+        )
+
         return [
             add_book_to_reading_list,
             get_book_lists,
             mark_book_read,
+            recommend_books,
             search_book,
         ]
+
+    def cache_fingerprint(self):
+        """Return the version of the reading list store, which changes with every write."""
+        from src.utils.list_store import get_book_store
+
+        return (get_book_store().version(),)
@@ -2,11 +2,8 @@ import sys
 from pathlib import Path
 
 from dotenv import load_dotenv
-from strands_tools import file_read
 
-sys.path.append(str(Path(__file__).parent.parent))
-
-from src.tools.file_search_tools import find_folder_from_name
+sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.agents.agent import AgentAbstract
 from src.utils.prompts import FILE_AGENT_PROMPT
 
@@ -26,8 +23,21 @@ class FileSearchAgent(AgentAbstract):
 
     def get_tools(self):
         """Return the list of tools available for this agent."""
+        from strands_tools import file_read
+
+        from src.tools.file_search_tools import (
+            find_folder_from_name,
+            find_symbols,
+            get_file_outline,
+            read_source_file,
+            search_code,
+        )
 
         return [
             file_read,
             find_folder_from_name,
+            find_symbols,
+            get_file_outline,
+            read_source_file,
+            search_code,
         ]
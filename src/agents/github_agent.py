@@ -1,14 +1,13 @@
-from strands import Agent
-from strands.tools.mcp import MCPClient
-from mcp import stdio_client, StdioServerParameters
 from dotenv import load_dotenv
+import asyncio
 import os
 from pathlib import Path
 import sys
 
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.utils.prompts import GITHUB_AGENT_PROMPT
 from src.agents.agent import AgentAbstract  # Import your abstract base class
+from src.utils.mcp_session import get_mcp_session, is_mcp_failure
 
 load_dotenv()
 
@@ -22,7 +21,7 @@ class GitHubAgent(AgentAbstract):
     def __init__(self, config=None):
         # Initialize GitHub-specific attributes before calling super()
         self.api_key = os.getenv("GITHUB_TOKEN")
-        self.github_client = self._initialize_github_client()
+        self.github_session = self._initialize_github_session()
 
         # Call parent constructor
         super().__init__(config)
@@ -34,36 +33,41 @@ class GitHubAgent(AgentAbstract):
     def get_tools(self):
         """
         Return the list of tools from the MCP client.
-        Note: This returns an empty list since tools are loaded dynamically in query().
+        Note: This starts the shared GitHub MCP server if it is not running yet.
         """
-        return []
+        return self.github_session.get_tools()
 
     def get_prompt(self):
         """Return the GitHub agent system prompt."""
         return GITHUB_AGENT_PROMPT
 
-    def _initialize_github_client(self):
-        """Initialize the GitHub client using MCP."""
-        return MCPClient(
+    def _initialize_github_session(self):
+        """Return the process-wide GitHub MCP session, shared by all GitHub agents."""
+        from mcp import stdio_client, StdioServerParameters
+
+        api_key = self.api_key
+        return get_mcp_session(
+            "github",
             lambda: stdio_client(
                 StdioServerParameters(
                     command="npx",
                     args=["-y", "@modelcontextprotocol/server-github"],
-                    env={"GITHUB_PERSONAL_ACCESS_TOKEN": self.api_key},
+                    env={"GITHUB_PERSONAL_ACCESS_TOKEN": api_key},
                 )
-            )
+            ),
         )
 
-    def query(self, user_input: str):
+    async def _prepare_query(self):
+        """
+        Make sure the MCP server is running before a query; the tools stay bound to
+        the same client when the server is restarted.
+        """
+        await asyncio.to_thread(self.github_session.get_tools)
+
+    def _query_failed(self, error: Exception):
         """
-        Run the agent with the provided user input.
-        This method overrides the parent's query method to handle MCP client context.
+        Restart the MCP server on the next query if it caused the error; a model
+        error leaves the shared server running.
         """
-        with self.github_client:
-            agent = Agent(
-                model=self.model,
-                tools=self.github_client.list_tools_sync(),
-                system_prompt=self.get_prompt(),
-            )
-            response = agent(user_input)
-            return response
+        if is_mcp_failure(error):
+            self.github_session.mark_failed()
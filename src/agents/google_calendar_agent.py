@@ -1,10 +1,10 @@
 import sys
+from datetime import date
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-sys.path.append(str(Path(__file__).parent.parent))
-from src.tools.celander_tools import create_event, get_events
+sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.utils.prompts import CALENDAR_AGENT_PROMPT
 from src.agents.agent import AgentAbstract
 
@@ -18,6 +18,11 @@ class CalendarAgent(AgentAbstract):
     and starts an interactive loop for user commands.
     """
 
+    # Events live in Google Calendar, so only a short TTL keeps answers current;
+    # events created from this process invalidate the cached answers right away.
+    response_cache_ttl = 300
+    cacheable_tools = frozenset({"get_events"})
+
     def get_agent_config(self):
         """Return the Google Calendar agent configuration."""
         return self.config.calendar_agent
@@ -27,7 +32,14 @@ class CalendarAgent(AgentAbstract):
         return CALENDAR_AGENT_PROMPT
 
     def get_tools(self):
+        """Return the list of tools available for this agent."""
+        from src.tools.celander_tools import create_event, get_events
+
         return [
             create_event,
             get_events,
         ]
+
+    def cache_fingerprint(self):
+        """Include the date, so questions like "what's on today" are not answered for yesterday."""
+        return (date.today().isoformat(),)
@@ -3,12 +3,6 @@ import sys
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.agents.agent import AgentAbstract
-from src.tools.home_agent_tools import (
-    book_agent_query,
-    movies_agent_query,
-    recommender_agent_query,
-)
-from src.tools.celander_tools import get_events, create_event
 from src.utils.prompts import HOME_AGENT_PROMPT
 
 
@@ -28,6 +22,13 @@ class HomeAgent(AgentAbstract):
 
     def get_tools(self):
         """Return the list of tools available for this agent."""
+        from src.tools.home_agent_tools import (
+            book_agent_query,
+            movies_agent_query,
+            recommender_agent_query,
+        )
+        from src.tools.celander_tools import get_events, create_event
+
         return [
             book_agent_query,
             movies_agent_query,
@@ -2,15 +2,9 @@ from pathlib import Path
 import sys
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.tools.books_and_movies_tools import (
-    add_movie_or_show_to_watchlist,
-    get_movies_and_show_list,
-    mark_movie_or_show_watched,
-    search_omdb_movie_or_show,
-)
 from src.agents.agent import AgentAbstract
 from dotenv import load_dotenv
-from utils.prompts import MOVIES_AGENT_PROMPT
+from src.utils.prompts import MOVIES_AGENT_PROMPT
 
 load_dotenv()
 
@@ -21,6 +15,11 @@ class MoviesAgent(AgentAbstract):
     It can add movies or shows to a watchlist, mark them as watched, and search for them.
     """
 
+    response_cache_ttl = 3600
+    cacheable_tools = frozenset(
+        {"get_movies_and_show_list", "recommend_movies", "search_omdb_movie_or_show"}
+    )
+
     def get_agent_config(self):
         """Return the Movies agent configuration."""
         return self.config.movies_agent
@@ -31,9 +30,24 @@ class MoviesAgent(AgentAbstract):
 
     def get_tools(self):
         """Return the list of tools available for this agent."""
+        from src.tools.movies_tools import (
+            add_movie_or_show_to_watchlist,
+            get_movies_and_show_list,
+            mark_movie_or_show_watched,
+            recommend_movies,
+            search_omdb_movie_or_show,
+        )
+
         return [
             add_movie_or_show_to_watchlist,
             get_movies_and_show_list,
             mark_movie_or_show_watched,
+            recommend_movies,
             search_omdb_movie_or_show,
         ]
+
+    def cache_fingerprint(self):
+        """Return the version of the watchlist store, which changes with every write."""
+        from src.utils.list_store import get_movie_store
+
+        return (get_movie_store().version(),)
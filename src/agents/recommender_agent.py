@@ -1,15 +1,7 @@
 from pathlib import Path
 import sys
 
-sys.path.append(str(Path(__file__).parent.parent))
-from src.tools.recommender_agent_tools import (
-    add_substack_newsletter_to_monitor,
-    get_all_newsletters,
-    get_recent_posts_from_newsletter,
-    get_recent_youtube_videos,
-    get_all_monitored_youtube_channels,
-    add_youtube_channel_to_monitor,
-)
+sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.agents.agent import AgentAbstract
 from dotenv import load_dotenv
 from src.utils.prompts import RECOMMENDER_AGENT_PROMPT
@@ -24,6 +16,17 @@ class RecommenderAgent(AgentAbstract):
     It can add newsletters and channels to a monitoring list, retrieve metadata, and get recent videos.
     """
 
+    # Recent posts and videos are fetched live, so answers expire sooner.
+    response_cache_ttl = 900
+    cacheable_tools = frozenset(
+        {
+            "get_all_newsletters",
+            "get_recent_posts_from_newsletter",
+            "get_recent_youtube_videos",
+            "get_all_monitored_youtube_channels",
+        }
+    )
+
     def get_agent_config(self):
         """Return the Recommender agent configuration."""
         return self.config.recommender_agent
@@ -34,6 +37,15 @@ class RecommenderAgent(AgentAbstract):
 
     def get_tools(self):
         """Return the list of tools available for this agent."""
+        from src.tools.recommender_agent_tools import (
+            add_substack_newsletter_to_monitor,
+            get_all_newsletters,
+            get_recent_posts_from_newsletter,
+            get_recent_youtube_videos,
+            get_all_monitored_youtube_channels,
+            add_youtube_channel_to_monitor,
+        )
+
         return [
             add_substack_newsletter_to_monitor,
             get_all_newsletters,
@@ -42,3 +54,8 @@ class RecommenderAgent(AgentAbstract):
             get_all_monitored_youtube_channels,
             add_youtube_channel_to_monitor,
         ]
+
+    def get_data_sources(self):
+        """Return the newsletter and channel lists the answers are based on."""
+        agent_config = self.get_agent_config()
+        return [agent_config.substack_directory, agent_config.youtube_directory]
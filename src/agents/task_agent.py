@@ -6,11 +6,6 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from dotenv import load_dotenv
 
-from src.tools.task_agent_tools import (
-    file_search_agent_query,
-    google_calendar_agent_query,
-    github_agent_query,
-)
 from src.agents.agent import AgentAbstract
 from src.utils.prompts import TASK_AGENT_PROMPT
 
@@ -33,6 +28,12 @@ class TaskAgent(AgentAbstract):
 
     def get_tools(self):
         """Return the list of tools available for this agent."""
+        from src.tools.task_agent_tools import (
+            file_search_agent_query,
+            google_calendar_agent_query,
+            github_agent_query,
+        )
+
         return [
             file_search_agent_query,
             google_calendar_agent_query,
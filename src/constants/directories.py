@@ -1,3 +1,6 @@
+import os
+from pathlib import Path
+
 SKIP_DIRS = {
     "__pycache__",
     ".venv",
@@ -20,3 +23,26 @@ SKIP_DIRS = {
     "media",
     "data",
 }
+
+# Local cache for indexes and other derived data, kept out of the project tree.
+CACHE_DIR = Path(os.getenv("CHARON_CACHE_DIR", Path.home() / ".cache" / "charon"))
+
+# Minimum number of seconds between two incremental refreshes of the folder index.
+INDEX_REFRESH_INTERVAL = 30
+
+# Upper bound for the stripped notebook and source texts kept in CACHE_DIR/sources.
+SOURCE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# On-disk cache of the OMDB and Open Library responses.
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+
+# Unix socket the Charon daemon listens on.
+DAEMON_SOCKET_PATH = Path(os.getenv("CHARON_SOCKET", CACHE_DIR / "charon.sock"))
+
+# Personal data files read and written by the book and movie tools.
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+BOOK_DB_PATH = DATA_DIR / "book_list.sqlite3"
+MOVIE_DB_PATH = DATA_DIR / "movie_and_show.sqlite3"
+# The JSON files the lists were kept in before; imported into the stores on first use.
+BOOK_LIST_PATH = DATA_DIR / "book_list.json"
+MOVIE_LIST_PATH = DATA_DIR / "movie_and_show.json"
@@ -0,0 +1,101 @@
+import argparse
+import sys
+import uuid
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.constants.directories import DAEMON_SOCKET_PATH
+from src.utils.daemon_client import request_daemon
+
+
+def ask(socket_path: Path, agent: str, question: str, session: str, verbose: bool):
+    """
+    Stream the answer of one question to stdout.
+
+    Returns:
+        bool: False if the daemon reported an error.
+    """
+    request = {"op": "query", "agent": agent, "question": question}
+    if session:
+        request["session"] = session
+    for event in request_daemon(request, socket_path):
+        if event["type"] == "text" and event["depth"] == 0:
+            print(event["text"], end="", flush=True)
+        elif event["type"] == "tool_use" and verbose:
+            print(f"\n[{event['agent']} -> {event['name']}]", file=sys.stderr)
+        elif event["type"] == "error":
+            print(f"Error: {event['error']}", file=sys.stderr)
+            return False
+    print()
+    return True
+
+
+def interactive(socket_path: Path, agent: str, verbose: bool):
+    """Chat with the daemon; one conversation per agent lasts until /reset or exit."""
+    session = uuid.uuid4().hex
+    print("Connected to the Charon daemon. Commands: /agent NAME, /reset, exit")
+    while True:
+        try:
+            line = input(f"{agent}> ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            break
+        if not line:
+            continue
+        if line.lower() == "exit":
+            break
+        if line.startswith("/agent"):
+            _, _, name = line.partition(" ")
+            agent = name.strip() or agent
+        elif line == "/reset":
+            list(request_daemon({"op": "reset", "session": session}, socket_path))
+        else:
+            ask(socket_path, agent, line, session, verbose)
+    list(request_daemon({"op": "reset", "session": session}, socket_path))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Ask the agents hosted by the Charon daemon."
+    )
+    parser.add_argument(
+        "agent",
+        nargs="?",
+        default="home",
+        help="home, task, books, movies, calendar, recommender, files or github",
+    )
+    parser.add_argument(
+        "question", nargs="?", help="Ask a single question instead of chatting"
+    )
+    parser.add_argument("--session", help="Continue the conversation of this session")
+    parser.add_argument(
+        "--socket", type=Path, default=DAEMON_SOCKET_PATH, help="The daemon's socket"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Show tool calls")
+    parser.add_argument("--ping", action="store_true", help="Show the daemon status")
+    parser.add_argument("--stop", action="store_true", help="Stop the daemon")
+    args = parser.parse_args()
+
+    try:
+        if args.ping:
+            for event in request_daemon({"op": "ping"}, args.socket):
+                print(event)
+        elif args.stop:
+            list(request_daemon({"op": "shutdown"}, args.socket))
+        elif args.question is not None:
+            if not ask(
+                args.socket, args.agent, args.question, args.session, args.verbose
+            ):
+                sys.exit(1)
+        else:
+            interactive(args.socket, args.agent, args.verbose)
+    except ConnectionError as e:
+        print(
+            f"{e}. Start it with: uv run src/pipelines/running_charon_daemon.py",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
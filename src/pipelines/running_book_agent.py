@@ -1,16 +1,20 @@
 from pathlib import Path
 import sys
 
-sys.path.append(str(Path(__file__).parent.parent))
-from agents.books_agent import BookAgent
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.agents.books_agent import BookAgent
+from src.utils.warm_start import build_in_background
 
 
 def main():
+    pending_agent = build_in_background(BookAgent)
     while True:
-        book_agent = BookAgent()
         user_query = input("Enter your query for the Book Agent (or 'exit' to quit): ")
         if user_query.lower() == "exit":
             break
+        book_agent = pending_agent.result()
+        # Every query starts a new conversation.
+        book_agent.reset()
         response = book_agent.query(user_query)
         print(f"Response from Book Agent: {response}")
 
@@ -1,8 +1,9 @@
 import sys
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
-from agents.google_calendar_agent import CalendarAgent
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.agents.google_calendar_agent import CalendarAgent
+from src.utils.warm_start import build_in_background
 
 
 def main():
@@ -10,7 +11,7 @@ def main():
     Main function to run the Google Calendar agent.
     It initializes the agent with the necessary tools and configurations,
     """
-    calendar_agent = CalendarAgent()
+    pending_agent = build_in_background(CalendarAgent)
 
     print("Welcome to the Google Calendar Agent!")
     print("You can ask me to retrieve events or create new events.")
@@ -21,7 +22,7 @@ def main():
         if user_input.lower() == "exit":
             break
 
-        response = calendar_agent.query(user_input)
+        response = pending_agent.result().query(user_input)
         print(
             f"Agent: {response.message if hasattr(response, 'message') else response}"
         )
@@ -0,0 +1,44 @@
+import argparse
+import signal
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from loguru import logger
+
+from src.constants.directories import DAEMON_SOCKET_PATH
+from src.utils.config_loader import load_config, watch_config
+from src.utils.daemon import CharonDaemon
+
+
+def main():
+    """
+    Run all agents in one long-lived process, answering charon_client.py over a Unix socket.
+    """
+    parser = argparse.ArgumentParser(description="Run the Charon daemon.")
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=DAEMON_SOCKET_PATH,
+        help="Unix socket to listen on",
+    )
+    args = parser.parse_args()
+
+    # Config edits apply to agents created after the change, without a restart.
+    watch_config()
+    daemon = CharonDaemon(args.socket)
+    daemon.preload(load_config().daemon.preload_agents)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    logger.info(f"Charon daemon listening on {args.socket}")
+    try:
+        daemon.serve_forever()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        daemon.server_close()
+        logger.info("Charon daemon stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 import sys
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
-from agents.file_search_agent import FileSearchAgent
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.agents.file_search_agent import FileSearchAgent
 
 
 def main():
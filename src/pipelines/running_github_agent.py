@@ -3,6 +3,7 @@ import sys
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.agents.github_agent import GitHubAgent
+from src.utils.warm_start import build_in_background
 
 
 def main():
@@ -11,7 +12,8 @@ def main():
     It initializes the agent with the necessary tools and configurations,
     and starts an interactive loop for user commands.
     """
-    github_agent = GitHubAgent()
+    # Also starts the GitHub MCP server while the user types.
+    pending_agent = build_in_background(GitHubAgent)
 
     print("Welcome to the GitHub Agent!")
     print("You can ask me to manage your repositories, issues, and pull requests.")
@@ -22,7 +24,7 @@ def main():
         if user_input.lower() == "exit":
             break
 
-        response = github_agent.query(user_input)
+        response = pending_agent.result().query(user_input)
         print(
             f"Agent: {response.message if hasattr(response, 'message') else response}"
         )
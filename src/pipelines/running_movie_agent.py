@@ -1,8 +1,8 @@
 from pathlib import Path
 import sys
 
-sys.path.append(str(Path(__file__).parent.parent))
-from agents.movies_agent import MoviesAgent
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.agents.movies_agent import MoviesAgent
 
 
 def main():
@@ -1,8 +1,8 @@
 import sys
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
-from agents.task_agent import TaskAgent
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.agents.task_agent import TaskAgent
 
 
 def main():
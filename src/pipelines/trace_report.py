@@ -0,0 +1,27 @@
+import argparse
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.utils.config_loader import load_config
+from src.utils.tracing import format_trace_report, load_spans
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Show where time and tokens went in recent agent queries."
+    )
+    parser.add_argument(
+        "trace_file", nargs="?", help="JSON lines trace file (default: from config)"
+    )
+    parser.add_argument(
+        "--last", type=int, default=1, help="Number of most recent traces to show"
+    )
+    args = parser.parse_args()
+
+    trace_file = args.trace_file or load_config().tracing.trace_file
+    print(format_trace_report(load_spans(trace_file), args.last))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,11 @@
-from pydantic import BaseModel, Field
+import sys
+from pathlib import Path
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.constants.directories import CACHE_DIR
 
 
 class ModelConfig(BaseModel):
@@ -15,6 +22,14 @@ class FilesAgentConfig(BaseModel):
     root_directory: str = Field(
         ..., description="Root directory to search for projects"
     )
+    watch_root_directory: bool = Field(
+        False,
+        description="Keep the folder list current with a background file system watcher",
+    )
+    response_token_budget: int = Field(
+        2000,
+        description="Approximate token budget for the response of find_folder_from_name",
+    )
     model: ModelConfig = Field(..., description="Model configuration")
 
 
@@ -52,6 +67,12 @@ class TaskAgentConfig(BaseModel):
         ...,
         description="Model configuration for task agent (e.g., 'openrouter/deepseek/deepseek-r1')",
     )
+    max_parallel_agents: int = Field(
+        3, description="Maximum number of sub-agents queried at the same time"
+    )
+    agent_timeout: float = Field(
+        300, description="Seconds after which a sub-agent query is cancelled"
+    )
 
 
 class GitHubAgentConfig(BaseModel):
@@ -69,16 +90,21 @@ class GitHubAgentConfig(BaseModel):
 class RecommenderAgentConfig(BaseModel):
     """Configuration for the recommender agent."""
 
+    # The YAML file uses the `*_file` keys, code uses the `*_directory` names.
+    model_config = ConfigDict(populate_by_name=True)
+
     model: ModelConfig = Field(
         ...,
         description="Model configuration for recommender agent (e.g., 'openrouter/deepseek/deepseek-r1')",
     )
     substack_directory: str = Field(
         ...,
+        alias="substack_newsletters_file",
         description="Directory where Substack newsletters are stored",
     )
     youtube_directory: str = Field(
         ...,
+        alias="youtube_channels_file",
         description="Directory where YouTube channels are stored",
     )
 
@@ -90,6 +116,56 @@ class HomeAgentConfig(BaseModel):
         ...,
         description="Model configuration for home agent (e.g., 'openrouter/deepseek/deepseek-r1')",
     )
+    max_parallel_agents: int = Field(
+        3, description="Maximum number of sub-agents queried at the same time"
+    )
+    agent_timeout: float = Field(
+        300, description="Seconds after which a sub-agent query is cancelled"
+    )
+
+
+class ResponseCacheConfig(BaseModel):
+    """Configuration for the cache of repeated agent answers."""
+
+    enabled: bool = Field(True, description="Answer repeated questions from the cache")
+    max_entries: int = Field(256, description="Number of answers kept in memory")
+    similarity_threshold: Optional[float] = Field(
+        None,
+        description="Minimum word-vector cosine similarity for reusing the answer to a "
+        "differently phrased question; exact matches only if not set",
+    )
+
+
+class TracingConfig(BaseModel):
+    """Configuration for OpenTelemetry tracing of agent queries."""
+
+    enabled: bool = Field(
+        False, description="Record spans for queries, tools, model and HTTP calls"
+    )
+    exporter: Literal["file", "console", "otlp"] = Field(
+        "file",
+        description="Where spans go: a JSON lines file, the console, or the OTLP endpoint from OTEL_EXPORTER_OTLP_ENDPOINT",
+    )
+    trace_file: str = Field(
+        str(CACHE_DIR / "traces.jsonl"),
+        description="File the `file` exporter appends spans to",
+    )
+
+
+class DaemonConfig(BaseModel):
+    """Configuration for the long-running Charon daemon."""
+
+    preload_agents: List[str] = Field(
+        default_factory=lambda: ["home", "task"],
+        description="Agents created when the daemon starts, so the first query is warm",
+    )
+    max_sessions: int = Field(
+        32,
+        description="Conversations kept open; the least recently used is closed first",
+    )
+    session_idle_timeout: float = Field(
+        1800, description="Seconds after which an unused conversation is closed"
+    )
 
 
 class Config(BaseModel):
@@ -112,3 +188,13 @@ class Config(BaseModel):
         ..., description="Recommender agent configuration"
     )
     home_agent: HomeAgentConfig = Field(..., description="Home agent configuration")
+    response_cache: ResponseCacheConfig = Field(
+        default_factory=ResponseCacheConfig,
+        description="Response cache configuration",
+    )
+    tracing: TracingConfig = Field(
+        default_factory=TracingConfig, description="Tracing configuration"
+    )
+    daemon: DaemonConfig = Field(
+        default_factory=DaemonConfig, description="Daemon configuration"
+    )
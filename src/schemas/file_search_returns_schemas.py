@@ -3,6 +3,13 @@ from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
+class FolderMatch(BaseModel):
+    """A candidate folder returned by DirectoryScanner.find_folders."""
+
+    path: str = Field(..., description="Full path to the candidate folder")
+    score: float = Field(..., description="Match score, higher is better")
+
+
 class FolderSearchResponse(BaseModel):
     """Response schema for find_folder_from_name tool."""
 
@@ -14,9 +21,80 @@ class FolderSearchResponse(BaseModel):
         None, description="Full path to the found folder"
     )
     files: List[str] = Field(
-        default_factory=list, description="List of all Python file paths in the project"
+        default_factory=list,
+        description="List of Python file paths in the project, most important first when summarized",
+    )
+    total_files: int = Field(0, description="Number of Python files in the project")
+    notebooks: List[str] = Field(
+        default_factory=list,
+        description="Jupyter notebook paths in the project, read them with read_source_file",
+    )
+    alternatives: List[str] = Field(
+        default_factory=list,
+        description="Other close matches, best first, in case the found folder is not the intended one",
     )
     tree_structure: str = Field(
         ..., description="Tree representation of the project structure"
     )
     message: str = Field(..., description="Status message describing the result")
+
+
+class SymbolInfo(BaseModel):
+    """A module, class, function or method found in the symbol index."""
+
+    file_path: str = Field(..., description="Full path to the file defining the symbol")
+    qualified_name: str = Field(
+        ..., description="Dotted name, e.g. `src.utils.config_loader.load_config`"
+    )
+    kind: str = Field(..., description="One of module, class, function, method")
+    signature: str = Field("", description="Definition line of a class or function")
+    docstring: str = Field("", description="First lines of the docstring")
+    start_line: int = Field(..., description="First line of the definition (1-based)")
+    end_line: int = Field(..., description="Last line of the definition (inclusive)")
+
+
+class SymbolSearchResponse(BaseModel):
+    """Response schema for the find_symbols and get_file_outline tools."""
+
+    success: bool = Field(..., description="Whether any symbols were found")
+    symbols: List[SymbolInfo] = Field(
+        default_factory=list, description="Matching symbols, best match first"
+    )
+    message: str = Field(..., description="Status message describing the result")
+
+
+class SourceFileResponse(BaseModel):
+    """Response schema for read_source_file tool."""
+
+    success: bool = Field(..., description="Whether the file could be read")
+    file_path: str = Field(..., description="Full path to the file")
+    content: str = Field(
+        "", description="Requested lines; notebooks contain only their cell sources"
+    )
+    start_line: int = Field(0, description="First returned line (1-based)")
+    end_line: int = Field(0, description="Last returned line (inclusive)")
+    total_lines: int = Field(0, description="Number of lines of the whole text")
+    message: str = Field(..., description="Status message describing the result")
+
+
+class CodeMatch(BaseModel):
+    """A line matching a search_code query."""
+
+    file_path: str = Field(..., description="Full path to the file")
+    line_number: int = Field(..., description="Line number of the match (1-based)")
+    line: str = Field(..., description="The matching line, truncated to 200 characters")
+
+
+class CodeSearchResponse(BaseModel):
+    """Response schema for search_code tool."""
+
+    success: bool = Field(..., description="Whether any lines matched")
+    folder_path: Optional[str] = Field(None, description="The project folder searched")
+    matches: List[CodeMatch] = Field(
+        default_factory=list, description="Matching lines, grouped by file"
+    )
+    total_matches: int = Field(0, description="Number of matching lines in the project")
+    files_scanned: int = Field(
+        0, description="Files the trigram index could not rule out"
+    )
+    message: str = Field(..., description="Status message describing the result")
@@ -3,46 +3,108 @@ from pathlib import Path
 
 from strands import tool
 
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
 import json
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-import requests
 from dotenv import load_dotenv
 from loguru import logger
 
+from src.utils.http_client import get_json
+from src.utils.list_store import format_entries, get_book_store
+from src.utils.recommender import format_recommendations, get_book_recommender
+from src.utils.tool_cache import invalidates, is_found, memoize
+
 
 load_dotenv()
 
+# Book metadata rarely changes; searches are answered from disk for a week.
+SEARCH_CACHE_TTL = 7 * 24 * 3600
+
 
 @tool
-def get_book_lists() -> str:
+@memoize(ttl=60, scope="request", resources=("books",))
+def get_book_lists(
+    status: Optional[str] = None,
+    genre: Optional[str] = None,
+    author: Optional[str] = None,
+    min_rating: Optional[float] = None,
+    max_rating: Optional[float] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    sort: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> str:
     """
-    Get the complete book reading list and reading history.
+    Get books from the reading list and reading history, filtered to what is needed.
     The agent will analyze this data to make personalized recommendations.
 
+    Args:
+        status: "to_read" or "read"; both lists by default
+        genre: Only books whose genre contains this text
+        author: Only books whose author contains this text
+        min_rating: Only books rated at least this (out of 10)
+        max_rating: Only books rated at most this (out of 10)
+        date_from: Only books read (or, if unread, added) on or after this YYYY-MM-DD date
+        date_to: Only books read (or, if unread, added) on or before this YYYY-MM-DD date
+        fields: Only include these fields, e.g. ["title", "author", "rating"]
+        sort: Field to sort by, e.g. "rating" or "-read_date" for newest first
+        limit: Maximum number of books to return
+        offset: Number of matching books to skip, to page through the results
+
     Returns:
-        str: JSON string containing full book data
+        str: The number of books per list, then one JSON object per matching book
     """
-    book_paths = "/home/petar/Documents/project-charon/data/book_list.json"
     try:
-        with open(book_paths) as f:
-            books = json.load(f)
+        store = get_book_store()
+        books = store.query(
+            status,
+            contains={"genre": genre, "author": author},
+            min_rating=min_rating,
+            max_rating=max_rating,
+            date_fields=("read_date", "added_date"),
+            date_from=date_from,
+            date_to=date_to,
+            sort=sort,
+        )
+        counts = store.counts()
+
+        header = f"BOOK DATA (To Read: {counts['to_read']}, Read: {counts['read']})"
+        return format_entries(header, books, fields, limit, offset)
+    except Exception as e:
+        return f"Error reading book data: {str(e)}"
 
-        total_to_read = len(books.get("to_read", []))
-        total_read = len(books.get("read", []))
 
-        result = f"BOOK DATA (To Read: {total_to_read}, Read: {total_read})\n"
-        result += "=" * 50 + "\n\n"
-        result += json.dumps(books, indent=2)
+@tool
+@memoize(ttl=60, scope="request", resources=("books",))
+def recommend_books(k: int = 3) -> str:
+    """
+    Rank the books on the reading list by how well they match the books the user rated highly.
+    Matches on genre, author and the words of titles and notes; takes milliseconds.
+
+    Args:
+        k: Number of books to recommend
 
-        return result
+    Returns:
+        str: The best k books to read next, each with the read book it is most like
+    """
+    try:
+        recommender = get_book_recommender()
+        header = (
+            f"BOOK RECOMMENDATIONS (from {len(recommender.candidates)} books to read, "
+            f"based on {len(recommender.history)} books read)"
+        )
+        return format_recommendations(header, recommender.recommend(k))
     except Exception as e:
-        return f"Error reading book data: {str(e)}"
+        logger.error(f"Error recommending books: {str(e)}")
+        return f"Error recommending books: {str(e)}"
 
 
 @tool
+@invalidates("books")
 def add_book_to_reading_list(
     title: str,
     author: str,
@@ -63,25 +125,7 @@ def add_book_to_reading_list(
     Returns:
         str: Confirmation message
     """
-    book_paths = "/home/petar/Documents/project-charon/data/book_list.json"
-
     try:
-        with open(book_paths) as f:
-            books = json.load(f)
-
-        # Check if book already exists
-        existing = next(
-            (
-                b
-                for b in books["to_read"]
-                if b["title"].lower() == title.lower()
-                and b["author"].lower() == author.lower()
-            ),
-            None,
-        )
-        if existing:
-            return f"'{title}' by {author} is already in your reading list!"
-
         new_book = {
             "title": title,
             "author": author,
@@ -91,10 +135,8 @@ def add_book_to_reading_list(
             "added_date": datetime.now().isoformat()[:10],
         }
 
-        books["to_read"].append(new_book)
-
-        with open(book_paths, "w") as f:
-            json.dump(books, f, indent=2)
+        if not get_book_store().add("to_read", new_book):
+            return f"'{title}' by {author} is already in your reading list!"
 
         logger.success(f"Added '{title}' by {author} to your reading list!")
 
@@ -106,6 +148,7 @@ def add_book_to_reading_list(
 
 
 @tool
+@invalidates("books")
 def mark_book_read(
     title: str, author: str, rating: Optional[float] = None, notes: Optional[str] = None
 ) -> str:
@@ -121,38 +164,16 @@ def mark_book_read(
     Returns:
         str: Confirmation message
     """
-    book_paths = "/home/petar/Documents/project-charon/data/book_list.json"
-
     try:
-        with open(book_paths) as f:
-            books = json.load(f)
-
-        # Find book in to_read list
-        book_index = None
-        for i, book in enumerate(books["to_read"]):
-            if (
-                book["title"].lower() == title.lower()
-                and book["author"].lower() == author.lower()
-            ):
-                book_index = i
-                break
-
-        if book_index is None:
-            return f"'{title}' by {author} not found in your reading list. Make sure both title and author match exactly."
-
-        # Move book to read list
-        read_book = books["to_read"].pop(book_index)
-        read_book["read_date"] = datetime.now().isoformat()[:10]
-
+        updates = {"read_date": datetime.now().isoformat()[:10]}
         if rating is not None:
-            read_book["rating"] = rating
+            updates["rating"] = rating
         if notes:
-            read_book["notes"] = notes
-
-        books["read"].append(read_book)
+            updates["notes"] = notes
 
-        with open(book_paths, "w") as f:
-            json.dump(books, f, indent=2)
+        # Move book from the to_read list to the read list
+        if get_book_store().move("to_read", "read", title, author, updates) is None:
+            return f"'{title}' by {author} not found in your reading list. Make sure both title and author match exactly."
 
         logger.success(
             f"Marked '{title}' by {author} as read! {f'Rated {rating}/10. ' if rating else ''}Nice work!"
@@ -165,6 +186,7 @@ def mark_book_read(
 
 
 @tool
+@memoize(ttl=3600, cache_if=is_found)
 def search_book(title: str, author: str = "") -> str:
     """
     Search for book information using the Open Library API.
@@ -183,8 +205,12 @@ def search_book(title: str, author: str = "") -> str:
         params["author"] = author
 
     try:
-        response = requests.get(api_url, params=params)
-        data = response.json()
+        data = get_json(
+            api_url,
+            params,
+            ttl=SEARCH_CACHE_TTL,
+            cache_if=lambda data: data.get("numFound", 0) > 0,
+        )
 
         if data.get("numFound", 0) > 0:
             logger.success(f"Open Library returned the following books {data}")
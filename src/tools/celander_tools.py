@@ -5,7 +5,7 @@ from pathlib import Path
 import pytz
 from strands import tool
 
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
 from loguru import logger
 
 from src.schemas.calendar_agent_returns_schema import (
@@ -15,6 +15,7 @@ from src.schemas.calendar_agent_returns_schema import (
     CalendarEventsListResponse,
 )
 from src.utils.google_calendar_auth import authenticate_calendar
+from src.utils.tool_cache import invalidates, memoize
 
 
 # Function calling to get calendar events within a specified duration
@@ -22,6 +23,7 @@ from src.utils.google_calendar_auth import authenticate_calendar
     name="get_events",
     description="Retrieve events from Google Calendar within a specified time period",
 )
+@memoize(ttl=60, scope="request", resources=("calendar",))
 def get_events(duration: str = "") -> CalendarEventsListResponse:
     """
     Retrieves events from Google Calendar within a specified time period.
@@ -107,6 +109,7 @@ def get_events(duration: str = "") -> CalendarEventsListResponse:
     description="Create a new event in Google Calendar",
     inputSchema=CalendarEventInput.model_json_schema(),
 )
+@invalidates("calendar")
 def create_event(
     title: str,
     start_time: str,
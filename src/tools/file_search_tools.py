@@ -1,31 +1,55 @@
+import re
 import sys
 from pathlib import Path
 
 from strands import tool
 
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
 from loguru import logger
 
-from schemas.file_search_returns_schemas import FolderSearchResponse
-from utils.config_loader import load_config
-from utils.directory_scanning import DirectoryScanner
+from src.schemas.file_search_returns_schemas import (
+    CodeMatch,
+    CodeSearchResponse,
+    FolderSearchResponse,
+    SourceFileResponse,
+    SymbolInfo,
+    SymbolSearchResponse,
+)
+from src.utils.code_search import get_code_index
+from src.utils.config_loader import load_config
+from src.utils.directory_scanning import get_scanner
+from src.utils.project_summary import estimate_tokens, summarize_project
+from src.utils.source_cache import get_source_cache
+from src.utils.symbol_index import get_symbol_index
+
+# Notebooks listed next to the ranked files when a project is summarized.
+MAX_SUMMARIZED_NOTEBOOKS = 20
 
 
 @tool
-def find_folder_from_name(folder_name: str) -> FolderSearchResponse:
+def find_folder_from_name(
+    folder_name: str, summarize: bool = True
+) -> FolderSearchResponse:
     """
     Find a folder by its name in the project root directory, and all python files in it.
     This function searches for a folder matching the provided name, retrieves all Python files within it,
     and returns a structured response including the project name, folder path, and a tree structure of the directory.
+    Large projects are summarized: the tree only shows directories with their file counts and
+    only the most important files are listed, so the response stays within the configured token budget.
 
     Args:
         folder_name (str): The name of the project and folder to find.
+        summarize (bool): Summarize projects that do not fit into the token budget. Set to False
+            only if the full file list is really needed.
 
     Returns:
         dict: A dictionary containing:
             - project_name: The name of the found project directory
             - folder_path: The full path to the found folder
-            - files: List of all Python file paths in the project
+            - files: List of Python file paths in the project, most important first when summarized
+            - total_files: Number of Python files in the project
+            - notebooks: Jupyter notebook paths in the project
+            - alternatives: Other close matches, in case the best match is the wrong project
             - tree_structure: Tree representation of the project structure
             - success: Boolean indicating if the folder was found
     """
@@ -36,10 +60,13 @@ def find_folder_from_name(folder_name: str) -> FolderSearchResponse:
         f"Searching for folder: {folder_name} in {config.files_agent.root_directory}"
     )
 
-    scanner = DirectoryScanner(root_dir=Path(config.files_agent.root_directory))
-    found_folder = scanner.find_folder(folder_name)
+    scanner = get_scanner(
+        root_dir=Path(config.files_agent.root_directory),
+        watch=config.files_agent.watch_root_directory,
+    )
+    matches = scanner.find_folders(folder_name, k=5)
 
-    if not found_folder:
+    if not matches:
         logger.warning(
             f'Folder "{folder_name}" not found in {config.files_agent.root_directory}'
         )
@@ -52,21 +79,274 @@ def find_folder_from_name(folder_name: str) -> FolderSearchResponse:
             tree_structure=f'Folder "{folder_name}" not found in {config.files_agent.root_directory}',
             message=f'No folder named "{folder_name}" was found.',
         )
+    found_folder = matches[0].path
     folder_path = Path(found_folder)
     project_name = folder_path.name
-    found_files = scanner.find_files(folder_path)
+    # Filled by find_files and reused for the tree, so the folder is listed once.
+    listing: dict = {}
+    found_files = scanner.find_files(folder_path, listing=listing)
 
     logger.info(f"Found folder {found_folder} with folder path: {folder_path}")
 
     file_paths = [
         str(file_path) for file_path in found_files if str(file_path).endswith(".py")
     ]
-    tree_structure = scanner.generate_tree_structure(folder_path)
+    notebooks = [
+        str(file_path) for file_path in found_files if str(file_path).endswith(".ipynb")
+    ]
+    total_files = len(file_paths)
+    tree_structure = scanner.generate_tree_structure(folder_path, listing=listing)
+    message = f'Found project "{project_name}" with {total_files} Python files.'
+    alternatives = [match.path for match in matches[1:]]
+
+    def paths_tokens(paths: list) -> int:
+        return sum(estimate_tokens(path) + 2 for path in paths)
+
+    token_budget = config.files_agent.response_token_budget
+    full_tokens = (
+        estimate_tokens(tree_structure)
+        + estimate_tokens(message)
+        + paths_tokens(file_paths + notebooks + alternatives)
+    )
+    if summarize and full_tokens > token_budget:
+        notebooks = notebooks[:MAX_SUMMARIZED_NOTEBOOKS]
+        summary_note = (
+            " Showing the {} most important files and a directory-level tree;"
+            " use file_read on any path from the tree to look further."
+        )
+        # The notebooks, alternatives and message are sent as they are; the
+        # tree and the file list share what is left of the budget.
+        fixed_tokens = estimate_tokens(message + summary_note) + paths_tokens(
+            notebooks + alternatives
+        )
+        tree_structure, file_paths = summarize_project(
+            folder_path, file_paths, listing, max(token_budget - fixed_tokens, 0)
+        )
+        message += summary_note.format(len(file_paths))
+        logger.info(
+            f"Summarized {project_name} from ~{full_tokens} to a {token_budget} token budget"
+        )
+
     return FolderSearchResponse(
         success=True,
         project_name=project_name,
         folder_path=str(folder_path),
         files=file_paths,
+        total_files=total_files,
+        notebooks=notebooks,
+        alternatives=alternatives,
         tree_structure=tree_structure,
-        message=f'Found project "{project_name}" with {len(file_paths)} Python files.',
+        message=message,
+    )
+
+
+def _refreshed_symbol_index(folder_path: str):
+    """Return the symbol index of a project folder after indexing new and changed files."""
+    config = load_config()
+    scanner = get_scanner(
+        root_dir=Path(config.files_agent.root_directory),
+        watch=config.files_agent.watch_root_directory,
+    )
+    files = scanner.find_files(Path(folder_path), extensions=(".py",))
+    index = get_symbol_index(Path(folder_path))
+    index.refresh(files)
+    return index
+
+
+@tool
+def find_symbols(
+    folder_path: str, name: str, kind: str = "", limit: int = 20
+) -> SymbolSearchResponse:
+    """
+    Look up where modules, classes, functions and methods are defined in a project.
+    Use this instead of reading whole files: every result has the file path, signature,
+    docstring summary and line range of the definition, so only those lines need to be
+    read with file_read (mode "lines" with start_line and end_line).
+
+    Args:
+        folder_path (str): The project folder, as returned by find_folder_from_name.
+        name (str): Symbol name or part of it (case-insensitive), e.g. "load_config",
+            "Scanner" or a dotted name like "DirectoryScanner.find_files".
+        kind (str): Optional filter: "module", "class", "function" or "method".
+        limit (int): Maximum number of results.
+
+    Returns:
+        dict: A dictionary containing:
+            - success: Boolean indicating if any symbols matched
+            - symbols: Matching definitions, best match first
+            - message: Status message
+    """
+    logger.info(f'Searching symbols matching "{name}" in {folder_path}')
+    if not Path(folder_path).is_dir():
+        return SymbolSearchResponse(
+            success=False, message=f"{folder_path} is not a folder."
+        )
+
+    index = _refreshed_symbol_index(folder_path)
+    symbols = [
+        SymbolInfo(**row) for row in index.search(name, kind=kind or None, limit=limit)
+    ]
+    if not symbols:
+        return SymbolSearchResponse(
+            success=False, message=f'No symbols matching "{name}" in {folder_path}.'
+        )
+    return SymbolSearchResponse(
+        success=True,
+        symbols=symbols,
+        message=f'Found {len(symbols)} symbols matching "{name}".',
+    )
+
+
+@tool
+def get_file_outline(folder_path: str, file_path: str) -> SymbolSearchResponse:
+    """
+    List the classes, functions and methods defined in a Python file, with their
+    signatures, docstring summaries and line ranges, without reading the file.
+
+    Args:
+        folder_path (str): The project folder the file belongs to.
+        file_path (str): Full path to the Python file.
+
+    Returns:
+        dict: A dictionary containing:
+            - success: Boolean indicating if the file has indexed symbols
+            - symbols: The module followed by its definitions in source order
+            - message: Status message
+    """
+    logger.info(f"Outlining {file_path}")
+    if not Path(folder_path).is_dir():
+        return SymbolSearchResponse(
+            success=False, message=f"{folder_path} is not a folder."
+        )
+
+    index = _refreshed_symbol_index(folder_path)
+    symbols = [SymbolInfo(**row) for row in index.outline(file_path)]
+    if not symbols:
+        return SymbolSearchResponse(
+            success=False,
+            message=f"{file_path} is not an indexed Python file of {folder_path}.",
+        )
+    return SymbolSearchResponse(
+        success=True,
+        symbols=symbols,
+        message=f"{file_path} defines {len(symbols) - 1} classes, functions and methods.",
+    )
+
+
+@tool
+def read_source_file(
+    file_path: str, start_line: int = 1, end_line: int = 0
+) -> SourceFileResponse:
+    """
+    Read a Python file or Jupyter notebook, optionally only a range of lines.
+    Always use this instead of file_read for .ipynb files: notebooks are returned as their
+    code and markdown cells only (`# %%` separated), without outputs or metadata, which is
+    a fraction of the raw file size. Unchanged files are served from a local cache.
+
+    Args:
+        file_path (str): Full path to the file.
+        start_line (int): First line to return (1-based).
+        end_line (int): Last line to return (inclusive); 0 reads to the end.
+
+    Returns:
+        dict: A dictionary containing:
+            - success: Boolean indicating if the file could be read
+            - file_path: The file that was read
+            - content: The requested lines
+            - start_line / end_line: The returned line range
+            - total_lines: Number of lines of the whole (stripped) file
+            - message: Status message
+    """
+    logger.info(f"Reading {file_path} lines {start_line}-{end_line or 'end'}")
+    try:
+        text = get_source_cache().read(file_path)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not read {file_path}: {e}")
+        return SourceFileResponse(
+            success=False, file_path=file_path, message=f"Could not read file: {e}"
+        )
+
+    lines = text.splitlines()
+    start_line = max(start_line, 1)
+    end_line = min(end_line, len(lines)) if end_line > 0 else len(lines)
+    return SourceFileResponse(
+        success=True,
+        file_path=file_path,
+        content="\n".join(lines[start_line - 1 : end_line]),
+        start_line=start_line,
+        end_line=end_line,
+        total_lines=len(lines),
+        message=f"Read lines {start_line}-{end_line} of {len(lines)}.",
+    )
+
+
+@tool
+def search_code(
+    project: str,
+    pattern: str,
+    regex: bool = False,
+    case_sensitive: bool = False,
+    max_results: int = 50,
+) -> CodeSearchResponse:
+    """
+    Search the Python files and notebooks of a project for a text or regular expression,
+    like grep, and return the matching lines with their line numbers.
+    Use this to find usages, call sites, config keys or error messages instead of reading
+    files one by one. Matches in notebooks refer to the lines returned by read_source_file.
+
+    Args:
+        project (str): The project folder path, or a project name to look up like
+            find_folder_from_name does.
+        pattern (str): Text to search for, or a regular expression if regex is True.
+        regex (bool): Interpret the pattern as a Python regular expression.
+        case_sensitive (bool): Match upper and lower case exactly.
+        max_results (int): Maximum number of matching lines to return.
+
+    Returns:
+        dict: A dictionary containing:
+            - success: Boolean indicating if any lines matched
+            - folder_path: The project folder that was searched
+            - matches: file_path, line_number and line of each match
+            - total_matches: Number of matching lines, including those beyond max_results
+            - files_scanned: Number of files that had to be scanned
+            - message: Status message
+    """
+    config = load_config()
+    scanner = get_scanner(
+        root_dir=Path(config.files_agent.root_directory),
+        watch=config.files_agent.watch_root_directory,
+    )
+    folder_path = project if Path(project).is_dir() else scanner.find_folder(project)
+    if not folder_path:
+        return CodeSearchResponse(
+            success=False, message=f'No project named "{project}" was found.'
+        )
+
+    logger.info(f'Searching "{pattern}" in {folder_path}')
+    index = get_code_index(Path(folder_path))
+    index.refresh(scanner.find_files(Path(folder_path)))
+    try:
+        matches, total, scanned = index.search(
+            pattern, regex=regex, case_sensitive=case_sensitive, max_results=max_results
+        )
+    except re.error as e:
+        return CodeSearchResponse(
+            success=False,
+            folder_path=str(folder_path),
+            message=f"Invalid regular expression: {e}",
+        )
+
+    message = f'{total} lines match "{pattern}" in {folder_path}.'
+    if total > len(matches):
+        message += f" Showing the first {len(matches)}; narrow the pattern to see more."
+    return CodeSearchResponse(
+        success=bool(matches),
+        folder_path=str(folder_path),
+        matches=[
+            CodeMatch(file_path=path, line_number=line_number, line=line)
+            for path, line_number, line in matches
+        ],
+        total_matches=total,
+        files_scanned=scanned,
+        message=message,
     )
@@ -1,16 +1,26 @@
 from pathlib import Path
 import sys
 
-sys.path.append(str(Path(__file__).parent.parent))
-from agents.books_agent import BookAgent
-from agents.movies_agent import MoviesAgent
-from agents.recommender_agent import RecommenderAgent
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.agents.books_agent import BookAgent
+from src.agents.movies_agent import MoviesAgent
+from src.agents.recommender_agent import RecommenderAgent
+from src.agents.agent_pool import query_sub_agent
+from src.utils.config_loader import load_config
 from strands import tool
 from loguru import logger
 
 
+async def _query(agent_class, question: str):
+    """Query a pooled sub-agent, in parallel with the other tool calls of the same turn."""
+    config = load_config().home_agent
+    return await query_sub_agent(
+        agent_class, question, config.max_parallel_agents, config.agent_timeout
+    )
+
+
 @tool
-def book_agent_query(query: str) -> str:
+async def book_agent_query(query: str) -> str:
     """
     Query the Book Agent with a specific request.
     Args:
@@ -21,8 +31,7 @@ def book_agent_query(query: str) -> str:
     logger.info(f"Querying Book Agent with: {query}")
 
     try:
-        agent = BookAgent()
-        response = agent.query(query)
+        response = await _query(BookAgent, query)
         logger.success("Book Agent responded successfully.")
         return response
     except Exception as e:
@@ -31,7 +40,7 @@ def book_agent_query(query: str) -> str:
 
 
 @tool
-def movies_agent_query(query: str) -> str:
+async def movies_agent_query(query: str) -> str:
     """
     Query the Movies Agent with a specific request.
     Args:
@@ -42,8 +51,7 @@ def movies_agent_query(query: str) -> str:
     logger.info(f"Querying Movies Agent with: {query}")
 
     try:
-        agent = MoviesAgent()
-        response = agent.query(query)
+        response = await _query(MoviesAgent, query)
         logger.success("Movies Agent responded successfully.")
         return response
     except Exception as e:
@@ -52,7 +60,7 @@ def movies_agent_query(query: str) -> str:
 
 
 @tool
-def recommender_agent_query(query: str) -> str:
+async def recommender_agent_query(query: str) -> str:
     """
     Query the Recommender Agent with a specific request.
     Args:
@@ -63,8 +71,7 @@ def recommender_agent_query(query: str) -> str:
     logger.info(f"Querying Recommender Agent with: {query}")
 
     try:
-        agent = RecommenderAgent()
-        response = agent.query(query)
+        response = await _query(RecommenderAgent, query)
         logger.success("Recommender Agent responded successfully.")
         return response
     except Exception as e:
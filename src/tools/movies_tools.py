@@ -3,50 +3,111 @@ from pathlib import Path
 
 from strands import tool
 
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
 import json
 import os
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-import requests
 from dotenv import load_dotenv
 from loguru import logger
 
+from src.utils.http_client import get_json
+from src.utils.list_store import format_entries, get_movie_store
+from src.utils.recommender import format_recommendations, get_movie_recommender
+from src.utils.tool_cache import invalidates, is_found, memoize
+
 
 load_dotenv()
 
+# Movie metadata rarely changes; searches are answered from disk for a week.
+SEARCH_CACHE_TTL = 7 * 24 * 3600
+
 
 @tool
-def get_movies_and_show_list() -> str:
+@memoize(ttl=60, scope="request", resources=("movies",))
+def get_movies_and_show_list(
+    status: Optional[str] = None,
+    genre: Optional[str] = None,
+    director: Optional[str] = None,
+    min_rating: Optional[float] = None,
+    max_rating: Optional[float] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    sort: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> str:
     """
-    Get the complete movie/show watchlist and watch history.
+    Get movies/shows from the watchlist and watch history, filtered to what is needed.
     The agent will analyze this data to make personalized recommendations.
 
+    Args:
+        status: "to_watch" or "watched"; both lists by default
+        genre: Only movies/shows whose genre contains this text
+        director: Only movies/shows whose director/showrunner contains this text
+        min_rating: Only movies/shows rated at least this (out of 10)
+        max_rating: Only movies/shows rated at most this (out of 10)
+        date_from: Only movies/shows watched (or, if unwatched, added) on or after this YYYY-MM-DD date
+        date_to: Only movies/shows watched (or, if unwatched, added) on or before this YYYY-MM-DD date
+        fields: Only include these fields, e.g. ["title", "year", "rating"]
+        sort: Field to sort by, e.g. "rating" or "-watched_date" for newest first
+        limit: Maximum number of movies/shows to return
+        offset: Number of matching movies/shows to skip, to page through the results
+
     Returns:
-        str: JSON string containing full movie/show data
+        str: The number of movies/shows per list, then one JSON object per match
     """
-    # config=load_config()
+    try:
+        store = get_movie_store()
+        movies = store.query(
+            status,
+            contains={"genre": genre, "director": director},
+            min_rating=min_rating,
+            max_rating=max_rating,
+            date_fields=("watched_date", "added_date"),
+            date_from=date_from,
+            date_to=date_to,
+            sort=sort,
+        )
+        counts = store.counts()
 
-    list_path = "/home/petar/Documents/project-charon/data/movie_and_show.json"
+        header = (
+            f"MOVIE DATA (To Watch: {counts['to_watch']}, Watched: {counts['watched']})"
+        )
+        return format_entries(header, movies, fields, limit, offset)
+    except Exception as e:
+        return f"Error reading movie data: {str(e)}"
 
-    try:
-        with open(list_path) as f:
-            movies = json.load(f)
 
-        total_to_watch = len(movies.get("to_watch", []))
-        total_watched = len(movies.get("watched", []))
+@tool
+@memoize(ttl=60, scope="request", resources=("movies",))
+def recommend_movies(k: int = 3) -> str:
+    """
+    Rank the movies/shows on the watchlist by how well they match the ones the user rated highly.
+    Matches on genre, director, decade and the words of titles and notes; takes milliseconds.
 
-        result = f"MOVIE DATA (To Watch: {total_to_watch}, Watched: {total_watched})\n"
-        result += "=" * 50 + "\n\n"
-        result += json.dumps(movies, indent=2)
+    Args:
+        k: Number of movies/shows to recommend
 
-        return result
+    Returns:
+        str: The best k movies/shows to watch next, each with the watched title it is most like
+    """
+    try:
+        recommender = get_movie_recommender()
+        header = (
+            f"MOVIE RECOMMENDATIONS (from {len(recommender.candidates)} to watch, "
+            f"based on {len(recommender.history)} watched)"
+        )
+        return format_recommendations(header, recommender.recommend(k), "directed by")
     except Exception as e:
-        return f"Error reading movie data: {str(e)}"
+        logger.error(f"Error recommending movies: {str(e)}")
+        return f"Error recommending movies: {str(e)}"
 
 
 @tool
+@invalidates("movies")
 def add_movie_or_show_to_watchlist(
     title: str,
     year: Optional[int] = None,
@@ -67,18 +128,7 @@ def add_movie_or_show_to_watchlist(
     Returns:
         str: Confirmation message
     """
-    list_path = "/home/petar/Documents/project-charon/data/movie_and_show.json"
     try:
-        with open(list_path) as f:
-            movies = json.load(f)
-
-        # Check if movie already exists
-        existing = next(
-            (m for m in movies["to_watch"] if m["title"].lower() == title.lower()), None
-        )
-        if existing:
-            return f"'{title}' is already in your watchlist!"
-
         new_movie = {
             "title": title,
             "year": year,
@@ -88,10 +138,8 @@ def add_movie_or_show_to_watchlist(
             "added_date": datetime.now().isoformat()[:10],
         }
 
-        movies["to_watch"].append(new_movie)
-
-        with open(list_path, "w") as f:
-            json.dump(movies, f, indent=2)
+        if not get_movie_store().add("to_watch", new_movie):
+            return f"'{title}' is already in your watchlist!"
 
         return f"Added '{title}' to your watchlist!"
     except Exception as e:
@@ -99,6 +147,7 @@ def add_movie_or_show_to_watchlist(
 
 
 @tool
+@invalidates("movies")
 def mark_movie_or_show_watched(
     title: str, rating: Optional[float] = None, notes: Optional[str] = None
 ) -> str:
@@ -113,35 +162,19 @@ def mark_movie_or_show_watched(
     Returns:
         str: Confirmation message
     """
-    list_path = "/home/petar/Documents/project-charon/data/movie_and_show.json"
-
     try:
-        with open(list_path) as f:
-            movies = json.load(f)
-
-        # Find movie in to_watch list
-        movie_index = None
-        for i, movie in enumerate(movies["to_watch"]):
-            if movie["title"].lower() == title.lower():
-                movie_index = i
-                break
-
-        if movie_index is None:
-            return f"'{title}' not found in your watchlist. Make sure the title matches exactly."
-
-        # Move movie to watched list
-        watched_movie = movies["to_watch"].pop(movie_index)
-        watched_movie["watched_date"] = datetime.now().isoformat()[:10]
-
+        updates = {"watched_date": datetime.now().isoformat()[:10]}
         if rating is not None:
-            watched_movie["rating"] = rating
+            updates["rating"] = rating
         if notes:
-            watched_movie["notes"] = notes
-
-        movies["watched"].append(watched_movie)
+            updates["notes"] = notes
 
-        with open(list_path, "w") as f:
-            json.dump(movies, f, indent=2)
+        # Move movie from the to_watch list to the watched list
+        if (
+            get_movie_store().move("to_watch", "watched", title, updates=updates)
+            is None
+        ):
+            return f"'{title}' not found in your watchlist. Make sure the title matches exactly."
 
         return f"Marked '{title}' as watched! {f'Rated {rating}/10. ' if rating else ''}Great job!"
     except Exception as e:
@@ -149,6 +182,7 @@ def mark_movie_or_show_watched(
 
 
 @tool
+@memoize(ttl=3600, cache_if=is_found)
 def search_omdb_movie_or_show(title: str, year: str = "", type="") -> str:
     """
     Search for movie/show information and metadata using the free OMDB API.
@@ -173,8 +207,12 @@ def search_omdb_movie_or_show(title: str, year: str = "", type="") -> str:
         params["type"] = type
 
     try:
-        response = requests.get(url, params=params)
-        data = response.json()
+        data = get_json(
+            url,
+            params,
+            ttl=SEARCH_CACHE_TTL,
+            cache_if=lambda data: data.get("Response") == "True",
+        )
 
         if data.get("Response") == "True":
             logger.success(f"OMDB returned the following movies {data}")
@@ -1,19 +1,21 @@
 from pathlib import Path
 import sys
 
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.utils.substack_api_utils import (
     get_recent_posts,
     get_post_metadata,
 )
 from src.utils.youtube_api_utils import YouTubeMonitor
 from strands import tool
-import json
 from loguru import logger
 from src.utils.config_loader import load_config
+from src.utils.persistence import read_json, update_json
+from src.utils.tool_cache import invalidates, memoize
 
 
 @tool
+@invalidates("substack_newsletters")
 def add_substack_newsletter_to_monitor(
     newsletter_url: str, note_about_newsletter: str
 ) -> str:
@@ -34,23 +36,20 @@ def add_substack_newsletter_to_monitor(
         )
         return "Substack newsletters directory is not configured in the project config."
     path_url = config.recommender_agent.substack_directory
-    try:
-        with open(path_url) as file:
-            newsletters = json.load(file)
-    except FileNotFoundError:
-        logger.error(f"File {path_url} not found")
-        newsletters = []
 
-    if newsletter_url in newsletters:
+    def add(newsletters: list) -> bool:
+        # Entries are {url: note} dicts.
+        if any(newsletter_url in entry for entry in newsletters):
+            return False
+        newsletters.append({newsletter_url: note_about_newsletter})
+        return True
+
+    if not update_json(path_url, add):
         logger.warning(
             f"Newsletter {newsletter_url} is already in the monitoring list."
         )
         return f"Newsletter {newsletter_url} is already in the monitoring list."
 
-    newsletters.append({newsletter_url: note_about_newsletter})
-
-    with open(path_url, "w") as file:
-        json.dump(newsletters, file)
     logger.success(
         f"Newsletter {newsletter_url} has been added to the monitoring list."
     )
@@ -59,6 +58,7 @@ def add_substack_newsletter_to_monitor(
 
 
 @tool
+@memoize(ttl=60, scope="request", resources=("substack_newsletters",))
 def get_all_newsletters() -> list:
     """
     Retrieve all Substack newsletters from the monitoring list.
@@ -76,19 +76,13 @@ def get_all_newsletters() -> list:
         ]
     path_url = config.recommender_agent.substack_directory
 
-    try:
-        with open(path_url) as file:
-            newsletters = json.load(file)
-        logger.info(
-            f"Retrieved {len(newsletters)} newsletters from the monitoring list."
-        )
-        return newsletters
-    except FileNotFoundError:
-        logger.error(f"File {path_url} not found")
-        return []
+    newsletters = read_json(path_url, default=list)
+    logger.info(f"Retrieved {len(newsletters)} newsletters from the monitoring list.")
+    return newsletters
 
 
 @tool
+@memoize(ttl=900)
 def get_recent_posts_from_newsletter(newsletter_url: str, limit: int = 5) -> list:
     """
     Get recent posts from a Substack newsletter.
@@ -113,6 +107,7 @@ def get_recent_posts_from_newsletter(newsletter_url: str, limit: int = 5) -> lis
 
 
 @tool
+@memoize(ttl=900)
 def get_recent_youtube_videos(channel_url: str, limit: int = 10) -> list:
     """
     Get recent videos from a YouTube channel.
@@ -134,6 +129,7 @@ def get_recent_youtube_videos(channel_url: str, limit: int = 10) -> list:
 
 
 @tool
+@memoize(ttl=60, scope="request", resources=("youtube_channels",))
 def get_all_monitored_youtube_channels() -> list:
     """
     Retrieve all monitored YouTube channels.
@@ -149,17 +145,13 @@ def get_all_monitored_youtube_channels() -> list:
         return ["YouTube channels directory is not configured in the project config."]
     path_url = config.recommender_agent.youtube_directory
 
-    try:
-        with open(path_url) as file:
-            channels = json.load(file)
-        logger.info(f"Retrieved {len(channels)} monitored YouTube channels.")
-        return channels
-    except FileNotFoundError:
-        logger.error(f"File {path_url} not found")
-        return []
+    channels = read_json(path_url, default=list)
+    logger.info(f"Retrieved {len(channels)} monitored YouTube channels.")
+    return channels
 
 
 @tool
+@invalidates("youtube_channels")
 def add_youtube_channel_to_monitor(channel_url: str, note_about_channel: str) -> str:
     """
     Add a YouTube channel to the monitoring list.
@@ -180,21 +172,17 @@ def add_youtube_channel_to_monitor(channel_url: str, note_about_channel: str) ->
 
     path_url = config.recommender_agent.youtube_directory
 
-    try:
-        with open(path_url) as file:
-            channels = json.load(file)
-    except FileNotFoundError:
-        logger.error(f"File {path_url} not found")
-        channels = []
+    def add(channels: list) -> bool:
+        # Entries are {url: note} dicts.
+        if any(channel_url in entry for entry in channels):
+            return False
+        channels.append({channel_url: note_about_channel})
+        return True
 
-    if channel_url in channels:
+    if not update_json(path_url, add):
         logger.warning(f"Channel {channel_url} is already in the monitoring list.")
         return f"Channel {channel_url} is already in the monitoring list."
 
-    channels.append({channel_url: note_about_channel})
-
-    with open(path_url, "w") as file:
-        json.dump(channels, file)
     logger.success(f"Channel {channel_url} has been added to the monitoring list.")
 
     return f"Channel {channel_url} has been added to your monitoring list."
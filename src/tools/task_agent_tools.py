@@ -1,20 +1,30 @@
 import sys
 from pathlib import Path
 
-sys.path.append(Path(__file__).parent.parent)
+sys.path.append(str(Path(__file__).parent.parent.parent))
 from loguru import logger
 from strands import tool
 
-from agents.file_search_agent import FileSearchAgent
-from agents.google_calendar_agent import CalendarAgent
-from agents.github_agent import GitHubAgent
+from src.agents.file_search_agent import FileSearchAgent
+from src.agents.google_calendar_agent import CalendarAgent
+from src.agents.github_agent import GitHubAgent
+from src.agents.agent_pool import query_sub_agent
+from src.utils.config_loader import load_config
+
+
+async def _query(agent_class, question: str):
+    """Query a pooled sub-agent, in parallel with the other tool calls of the same turn."""
+    config = load_config().task_agent
+    return await query_sub_agent(
+        agent_class, question, config.max_parallel_agents, config.agent_timeout
+    )
 
 
 @tool(
     name="file_search_agent_query",
     description="Query the file search agent to find and analyze files in a project. Useful for understanding project structure, finding specific files, or analyzing code for implementation tasks.",
 )
-def file_search_agent_query(question: str) -> str:
+async def file_search_agent_query(question: str) -> str:
     """
     Query the file search agent with a specific question about files or project structure.
 
@@ -30,8 +40,7 @@ def file_search_agent_query(question: str) -> str:
     logger.info(f"Querying file search agent with question: {question}")
 
     try:
-        agent = FileSearchAgent()
-        response = agent.query(question)
+        response = await _query(FileSearchAgent, question)
         logger.success("File search agent query completed successfully")
         return response
 
@@ -45,7 +54,7 @@ def file_search_agent_query(question: str) -> str:
     name="google_calendar_agent_query",
     description="Query the Google Calendar agent to manage calendar events. Can retrieve events, create new events, and provide scheduling assistance.",
 )
-def google_calendar_agent_query(query: str) -> str:
+async def google_calendar_agent_query(query: str) -> str:
     """
     Query the Google Calendar agent with a calendar-related request.
 
@@ -61,8 +70,7 @@ def google_calendar_agent_query(query: str) -> str:
     """
     try:
         logger.info(f"Querying calendar agent with: {query}")
-        agent = CalendarAgent()
-        response = agent.query(query)
+        response = await _query(CalendarAgent, query)
         logger.success("Calendar agent query completed successfully")
         return str(response)
     except Exception as e:
@@ -75,7 +83,7 @@ def google_calendar_agent_query(query: str) -> str:
     name="github_agent_query",
     description="Query the GitHub agent to manage GitHub repositories and issues. Can retrieve repository information, create issues, and manage pull requests.",
 )
-def github_agent_query(query: str) -> str:
+async def github_agent_query(query: str) -> str:
     """
     Query the GitHub agent with a GitHub-related request.
 
@@ -91,8 +99,7 @@ def github_agent_query(query: str) -> str:
     """
     try:
         logger.info(f"Querying GitHub agent with: {query}")
-        agent = GitHubAgent()
-        response = agent.query(query)
+        response = await _query(GitHubAgent, query)
         logger.success("GitHub agent query completed successfully")
         return str(response)
     except Exception as e:
@@ -0,0 +1,406 @@
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.constants.directories import CACHE_DIR
+from src.utils.source_cache import SourceCache, get_source_cache
+
+REGEX_METACHARACTERS = set(".^$*+?{}[]()|")
+# Escapes that stand for a single literal character.
+LITERAL_ESCAPES = {"n": "\n", "t": "\t", "r": "\r"}
+# Number of characters following an escape that belong to it, e.g. the digits of \x41.
+ESCAPE_ARGUMENT_LENGTHS = {"x": 2, "u": 4, "U": 8}
+# Inline flags such as (?i) or (?x: ...) change what the literal runs match.
+INLINE_FLAGS = re.compile(r"\(\?[aiLmsux-]+[:)]")
+MAX_LINE_LENGTH = 200
+
+
+def default_code_index_path(project_dir: Path) -> Path:
+    """
+    Return the location of the on-disk code search index for a project.
+
+    Args:
+        project_dir (Path): The project folder that is being indexed.
+
+    Returns:
+        Path: Path to the SQLite file inside the Charon cache directory.
+    """
+    digest = hashlib.sha1(str(Path(project_dir).resolve()).encode()).hexdigest()[:16]
+    return CACHE_DIR / "code_index" / f"{digest}.sqlite3"
+
+
+def text_trigrams(text: str) -> set:
+    """
+    Return the trigrams of a text as integers, case-insensitively.
+
+    Trigrams are taken over the UTF-8 bytes of the lowercased text, so every
+    trigram fits into a 24-bit integer key.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        set: The distinct trigram keys.
+    """
+    data = text.lower().encode("utf-8")
+    return {
+        int.from_bytes(trigram, "big")
+        for trigram in {data[i : i + 3] for i in range(len(data) - 2)}
+    }
+
+
+def required_literals(pattern: str, regex: bool) -> list:
+    """
+    Return substrings that every match of a search pattern must contain.
+
+    For regular expressions only the plain literal runs are used; a pattern with
+    alternation (`|`) yields no literals, since none of them is required, and
+    neither does one with inline flags, which may change what the runs match.
+
+    Args:
+        pattern (str): The search pattern.
+        regex (bool): Whether the pattern is a regular expression.
+
+    Returns:
+        list: Required literal substrings (possibly empty).
+    """
+    if not regex:
+        return [pattern]
+    if "|" in pattern or INLINE_FLAGS.search(pattern):
+        return []
+
+    literals = []
+    current = ""
+    # Literals inside groups may be optional or repeated, so only top-level runs count.
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            i += 2
+            if escaped in LITERAL_ESCAPES or not escaped.isalnum():
+                current += LITERAL_ESCAPES.get(escaped, escaped)
+                continue
+            # Any other escape (a class, an anchor, a code point, a group
+            # reference) ends the run, and its argument is not literal text.
+            if escaped in ESCAPE_ARGUMENT_LENGTHS:
+                i += ESCAPE_ARGUMENT_LENGTHS[escaped]
+            elif escaped == "N" and pattern.startswith("{", i):
+                end = pattern.find("}", i)
+                i = end + 1 if end != -1 else len(pattern)
+            elif escaped.isdigit():
+                # Octal escapes and group references take up to three digits.
+                while i < len(pattern) and pattern[i].isdigit():
+                    i += 1
+            if depth == 0:
+                literals.append(current)
+            current = ""
+            continue
+
+        if char not in REGEX_METACHARACTERS:
+            current += char
+            i += 1
+            continue
+
+        if char in "*?{" and current:
+            # The quantified character is optional or repeated, so it ends the run.
+            current = current[:-1]
+        if depth == 0:
+            literals.append(current)
+        current = ""
+
+        if char == "[":
+            end = pattern.find("]", i + 2)
+            i = end if end != -1 else len(pattern)
+        elif char == "{":
+            end = pattern.find("}", i)
+            i = end if end != -1 else len(pattern)
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth = max(depth - 1, 0)
+        i += 1
+    if depth == 0:
+        literals.append(current)
+    return [literal for literal in literals if len(literal) >= 3]
+
+
+def _matching_lines(compiled: re.Pattern, text: str):
+    """
+    Yield (line number, line) for every line of a text containing a match.
+
+    The whole text is searched at once and lines are only located around matches,
+    which is much faster than running the pattern on every line.
+    """
+    line_number = 1
+    counted_up_to = 0
+    position = 0
+    while True:
+        match = compiled.search(text, position)
+        if match is None:
+            return
+        line_start = text.rfind("\n", 0, match.start()) + 1
+        line_end = text.find("\n", match.start())
+        if line_end == -1:
+            line_end = len(text)
+
+        line_number += text.count("\n", counted_up_to, line_start)
+        counted_up_to = line_start
+        yield line_number, text[line_start:line_end]
+
+        # Continue on the next line, so every line is reported once.
+        position = line_end + 1
+        if position > len(text):
+            return
+
+
+class CodeSearchIndex:
+    """
+    A persistent trigram index for full-text search over the files of a project.
+
+    Every distinct trigram of every file is stored as a (trigram, file) row, so
+    the candidate files for a pattern are the intersection of the postings of
+    its trigrams and only those files are scanned. Files are re-indexed only when
+    their size and mtime change and their content hash differs.
+
+    Notebooks are indexed and searched through their stripped cell text (see
+    `utils.source_cache`), so line numbers match `read_source_file`.
+
+    Args:
+        project_dir (Path): The project folder.
+        index_path (Optional[Path]): The SQLite index; one per project in the
+            cache directory by default.
+        source_cache (Optional[SourceCache]): Cache of the stripped file texts;
+            the process-wide one by default.
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        index_path: Optional[Path] = None,
+        source_cache: Optional[SourceCache] = None,
+    ):
+        self.project_dir = str(Path(project_dir))
+        self.source_cache = source_cache or get_source_cache()
+        self.index_path = Path(index_path or default_code_index_path(project_dir))
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(self.index_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL UNIQUE,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha1 TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS trigrams (
+                trigram INTEGER NOT NULL,
+                file_id INTEGER NOT NULL,
+                PRIMARY KEY (trigram, file_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS trigrams_file ON trigrams(file_id);
+            """
+        )
+        self.connection.commit()
+
+    def refresh(self, files: list) -> int:
+        """
+        Bring the index up to date with the given files.
+
+        Files missing from the list are dropped from the index.
+
+        Args:
+            files (list): Absolute paths of all files that should be searchable.
+
+        Returns:
+            int: Number of files that were indexed again.
+        """
+        with self._lock:
+            stored = {
+                path: (file_id, size, mtime_ns, sha1)
+                for file_id, path, size, mtime_ns, sha1 in self.connection.execute(
+                    "SELECT id, path, size, mtime_ns, sha1 FROM files"
+                )
+            }
+
+            indexed = 0
+            for path in files:
+                path = str(path)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                previous = stored.pop(path, None)
+                if previous and previous[1:3] == (stat.st_size, stat.st_mtime_ns):
+                    continue
+
+                try:
+                    with open(path, "rb") as file:
+                        sha1 = hashlib.sha1(file.read()).hexdigest()
+                    if previous and previous[3] == sha1:
+                        self.connection.execute(
+                            "UPDATE files SET size = ?, mtime_ns = ? WHERE id = ?",
+                            (stat.st_size, stat.st_mtime_ns, previous[0]),
+                        )
+                        continue
+                    text = self.source_cache.read(path)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Could not index {path}: {e}")
+                    continue
+
+                if previous:
+                    self._delete_file(previous[0])
+                cursor = self.connection.execute(
+                    "INSERT INTO files (path, size, mtime_ns, sha1) VALUES (?, ?, ?, ?)",
+                    (path, stat.st_size, stat.st_mtime_ns, sha1),
+                )
+                self.connection.executemany(
+                    "INSERT INTO trigrams (trigram, file_id) VALUES (?, ?)",
+                    ((trigram, cursor.lastrowid) for trigram in text_trigrams(text)),
+                )
+                indexed += 1
+
+            for file_id, *_ in stored.values():
+                self._delete_file(file_id)
+
+            self.connection.commit()
+
+        if indexed:
+            logger.info(
+                f"Indexed {indexed} files for code search in {self.project_dir}"
+            )
+        return indexed
+
+    def _delete_file(self, file_id: int) -> None:
+        self.connection.execute("DELETE FROM trigrams WHERE file_id = ?", (file_id,))
+        self.connection.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    def candidates(self, literals: list) -> list:
+        """
+        Return the files that contain every trigram of the given literals.
+
+        Args:
+            literals (list): Substrings every match must contain.
+
+        Returns:
+            list: Paths of the candidate files, sorted. All indexed files if no
+                literal is long enough to have trigrams.
+        """
+        query_trigrams = set()
+        for literal in literals:
+            query_trigrams |= text_trigrams(literal)
+
+        with self._lock:
+            if not query_trigrams:
+                rows = self.connection.execute(
+                    "SELECT path FROM files ORDER BY path"
+                ).fetchall()
+                return [row[0] for row in rows]
+
+            postings = []
+            for trigram in query_trigrams:
+                file_ids = {
+                    row[0]
+                    for row in self.connection.execute(
+                        "SELECT file_id FROM trigrams WHERE trigram = ?", (trigram,)
+                    )
+                }
+                if not file_ids:
+                    return []
+                postings.append(file_ids)
+
+            postings.sort(key=len)
+            file_ids = set.intersection(*postings)
+            paths = [
+                self.connection.execute(
+                    "SELECT path FROM files WHERE id = ?", (file_id,)
+                ).fetchone()[0]
+                for file_id in file_ids
+            ]
+        return sorted(paths)
+
+    def search(
+        self,
+        pattern: str,
+        regex: bool = False,
+        case_sensitive: bool = False,
+        max_results: int = 50,
+    ) -> tuple:
+        """
+        Find the lines matching a pattern.
+
+        Args:
+            pattern (str): Literal text or regular expression to search for.
+            regex (bool): Interpret the pattern as a regular expression.
+            case_sensitive (bool): Match case exactly.
+            max_results (int): Maximum number of matching lines to return.
+
+        Returns:
+            tuple: (list of (path, line number, line) tuples, total number of
+                matching lines, number of files scanned).
+
+        Raises:
+            re.error: If the regular expression is invalid.
+        """
+        flags = re.MULTILINE | (0 if case_sensitive else re.IGNORECASE)
+        compiled = re.compile(pattern if regex else re.escape(pattern), flags)
+
+        matches = []
+        total = 0
+        literals = required_literals(pattern, regex)
+        lowered_literals = [literal.lower() for literal in literals]
+        paths = self.candidates(literals)
+        for path in paths:
+            try:
+                text = self.source_cache.read(path)
+            except (OSError, ValueError):
+                continue
+            # Trigrams only prove the parts of a literal occur somewhere in the file; a
+            # substring check rules out most remaining files before the slower regex.
+            lowered = text.lower()
+            if not all(literal in lowered for literal in lowered_literals):
+                continue
+            for line_number, line in _matching_lines(compiled, text):
+                total += 1
+                if len(matches) < max_results:
+                    matches.append((path, line_number, line[:MAX_LINE_LENGTH]))
+        return matches, total, len(paths)
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self.connection.close()
+
+
+_code_indexes: dict = {}
+_code_indexes_lock = threading.Lock()
+
+
+def get_code_index(project_dir: Path) -> CodeSearchIndex:
+    """
+    Return the process-wide code search index of a project, opening it on first use.
+
+    Args:
+        project_dir (Path): The project folder.
+
+    Returns:
+        CodeSearchIndex: The (not yet refreshed) index.
+    """
+    key = str(Path(project_dir))
+    with _code_indexes_lock:
+        if key not in _code_indexes:
+            _code_indexes[key] = CodeSearchIndex(project_dir)
+        return _code_indexes[key]
@@ -1,27 +1,80 @@
+import os
 import sys
+import threading
+import time
 from pathlib import Path
+from typing import Optional
 
 import yaml
+from loguru import logger
 
-sys.path.append(str(Path(__file__).parent.parent))
-from schemas.config_schema import (
-    CalendarAgentConfig,
-    Config,
-    FilesAgentConfig,
-    HomeAgentConfig,
-    ModelConfig,
-    RecommenderAgentConfig,
-    TaskAgentConfig,
-    GitHubAgentConfig,
-    BooksAgentConfig,
-    MoviesAgentConfig,
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.schemas.config_schema import Config
+
+DEFAULT_CONFIG_PATH = (
+    Path(__file__).parent.parent.parent / "config" / "project-config.yaml"
 )
 
+# Seconds during which a cached config is returned without checking the file's mtime.
+CONFIG_RECHECK_INTERVAL = 1.0
+
+# Resolved path -> (mtime_ns, time of the last mtime check, Config)
+_config_cache: dict = {}
+_config_lock = threading.Lock()
+_config_watchers: dict = {}
+# Config path as passed by callers -> resolved path, so lookups skip the file system.
+_resolved_paths: dict = {}
+
+
+def _resolve(config_path: str) -> str:
+    path = _resolved_paths.get(config_path)
+    if path is None:
+        path = str(Path(config_path or DEFAULT_CONFIG_PATH).resolve())
+        _resolved_paths[config_path] = path
+    return path
+
+
+def _read_config(path: str) -> Config:
+    """
+    Parse a YAML config file and validate it into a Config model.
+
+    Raises:
+        ValidationError: If configuration is invalid
+        FileNotFoundError: If config file doesn't exist
+        yaml.YAMLError: If YAML is malformed
+    """
+    with open(path) as file:
+        raw_config = yaml.safe_load(file)
+    return Config.model_validate(raw_config)
+
+
+def _reload(path: str, mtime_ns: int) -> Config:
+    """Load a changed config file, keeping the previous version if the new one is invalid."""
+    cached = _config_cache.get(path)
+    try:
+        config = _read_config(path)
+    except Exception as e:
+        if cached is None:
+            raise
+        logger.error(f"Could not reload {path}, keeping the previous config: {e}")
+        config = cached[2]
+    else:
+        if cached is not None:
+            logger.info(f"Reloaded configuration from {path}")
+    _config_cache[path] = (mtime_ns, time.monotonic(), config)
+    return config
+
 
 def load_config(config_path: str = "") -> Config:
     """
     Load configuration from YAML file and return validated Pydantic model.
 
+    The parsed config is cached per file. Within CONFIG_RECHECK_INTERVAL seconds
+    of the last check, or while a watcher started with `watch_config` is running,
+    the cached object is returned without touching the file; afterwards the file
+    is only parsed again if its mtime changed. The returned object is shared, so
+    treat it as read-only.
+
     Args:
         config_path: Path to config file. If None, uses default location.
 
@@ -33,73 +86,109 @@ def load_config(config_path: str = "") -> Config:
         FileNotFoundError: If config file doesn't exist
         yaml.YAMLError: If YAML is malformed
     """
-    if config_path == "":
-        config_path = (
-            Path(__file__).parent.parent.parent / "config" / "project-config.yaml"
+    path = _resolve(config_path)
+    cached = _config_cache.get(path)
+    if cached is not None and (
+        path in _config_watchers
+        or time.monotonic() - cached[1] < CONFIG_RECHECK_INTERVAL
+    ):
+        return cached[2]
+
+    with _config_lock:
+        cached = _config_cache.get(path)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            if cached is None:
+                raise
+            logger.error(f"Config file {path} disappeared, keeping the previous config")
+            mtime_ns = cached[0]
+
+        if cached is not None and cached[0] == mtime_ns:
+            _config_cache[path] = (mtime_ns, time.monotonic(), cached[2])
+            return cached[2]
+        return _reload(path, mtime_ns)
+
+
+def clear_config_cache() -> None:
+    """Forget all cached configs, so the next `load_config` reads the file again."""
+    with _config_lock:
+        _config_cache.clear()
+        _resolved_paths.clear()
+
+
+class ConfigWatcher:
+    """
+    Background thread that reloads a config file as soon as its mtime changes.
+
+    While it runs, `load_config` for that file is a plain dictionary lookup.
+    """
+
+    def __init__(self, config_path: str = "", interval: float = 1.0):
+        self.path = _resolve(config_path)
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Load the config once and start polling its mtime in a daemon thread."""
+        load_config(self.path)
+        self._thread = threading.Thread(
+            target=self._run, name="ConfigWatcher", daemon=True
         )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the watcher thread and wait for it to finish."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                mtime_ns = os.stat(self.path).st_mtime_ns
+            except OSError:
+                continue
+            with _config_lock:
+                cached = _config_cache.get(self.path)
+                if cached is None or cached[0] != mtime_ns:
+                    try:
+                        _reload(self.path, mtime_ns)
+                    except Exception as e:
+                        logger.error(f"Could not load {self.path}: {e}")
+
+
+def watch_config(config_path: str = "", interval: float = 1.0) -> ConfigWatcher:
+    """
+    Start hot reloading a config file, or return the watcher that already does.
 
-    with open(config_path) as file:
-        raw_config = yaml.safe_load(file)
+    Args:
+        config_path: Path to config file. If empty, uses default location.
+        interval: Seconds between two mtime checks.
 
-    files_model_config = ModelConfig(
-        model_id=raw_config["files_agent"]["model"]["model_id"],
-    )
-    files_agent_config = FilesAgentConfig(
-        model=files_model_config,
-        root_directory=raw_config["files_agent"]["root_directory"],
-    )
-
-    calendar_model_config = ModelConfig(
-        model_id=raw_config["calendar_agent"]["model"]["model_id"],
-    )
-
-    calendar_agent_config = CalendarAgentConfig(model=calendar_model_config)
-
-    movie_model_config = ModelConfig(
-        model_id=raw_config["movies_agent"]["model"]["model_id"]
-    )
-
-    movie_agent_config = MoviesAgentConfig(model=movie_model_config)
-
-    book_model_config = ModelConfig(
-        model_id=raw_config["books_agent"]["model"]["model_id"]
-    )
-
-    book_agent_config = BooksAgentConfig(model=book_model_config)
-    task_model_config = ModelConfig(
-        model_id=raw_config["task_agent"]["model"]["model_id"],
-    )
-    task_agent_config = TaskAgentConfig(model=task_model_config)
-
-    github_model_config = ModelConfig(
-        model_id=raw_config["github_agent"]["model"]["model_id"],
-    )
-    github_agent_config = GitHubAgentConfig(
-        model=github_model_config,
-        github_username=raw_config["github_agent"]["github_username"],
-    )
-
-    recommender_model_config = ModelConfig(
-        model_id=raw_config["recommender_agent"]["model"]["model_id"],
-    )
-    recommender_agent_config = RecommenderAgentConfig(
-        model=recommender_model_config,
-        youtube_directory=raw_config["recommender_agent"]["youtube_channels_file"],
-        substack_directory=raw_config["recommender_agent"]["substack_newsletters_file"],
-    )
-
-    home_model_config = ModelConfig(
-        model_id=raw_config["home_agent"]["model"]["model_id"],
-    )
-    home_agent_config = HomeAgentConfig(model=home_model_config)
-
-    return Config(
-        files_agent=files_agent_config,
-        calendar_agent=calendar_agent_config,
-        task_agent=task_agent_config,
-        github_agent=github_agent_config,
-        movies_agent=movie_agent_config,
-        books_agent=book_agent_config,
-        recommender_agent=recommender_agent_config,
-        home_agent=home_agent_config,
-    )
+    Returns:
+        ConfigWatcher: The running watcher.
+    """
+    path = _resolve(config_path)
+    with _config_lock:
+        watcher = _config_watchers.get(path)
+        if watcher is not None:
+            return watcher
+        watcher = ConfigWatcher(path, interval)
+    watcher.start()
+    with _config_lock:
+        _config_watchers[path] = watcher
+    return watcher
+
+
+def stop_watching_config(config_path: str = "") -> None:
+    """Stop hot reloading a config file; `load_config` goes back to throttled mtime checks."""
+    with _config_lock:
+        watcher = _config_watchers.pop(_resolve(config_path), None)
+    if watcher is not None:
+        watcher.stop()
@@ -0,0 +1,369 @@
+import asyncio
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from loguru import logger
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.agents.agent_pool import get_agent_pool
+from src.constants.directories import DAEMON_SOCKET_PATH
+from src.utils.config_loader import load_config
+from src.utils.warm_start import build_in_background
+
+# Agent name used in requests -> "module:class", imported on first use.
+AGENTS = {
+    "home": "src.agents.home_agent:HomeAgent",
+    "task": "src.agents.task_agent:TaskAgent",
+    "books": "src.agents.books_agent:BookAgent",
+    "movies": "src.agents.movies_agent:MoviesAgent",
+    "calendar": "src.agents.google_calendar_agent:CalendarAgent",
+    "recommender": "src.agents.recommender_agent:RecommenderAgent",
+    "files": "src.agents.file_search_agent:FileSearchAgent",
+    "github": "src.agents.github_agent:GitHubAgent",
+}
+
+
+class _Session:
+    """An open conversation with one agent."""
+
+    def __init__(self, agent):
+        self.agent = agent
+        # A strands Agent handles one request at a time.
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+        # Set under the store lock once the session is closed, expired or evicted.
+        self.closed = False
+
+
+class SessionStore:
+    """
+    Conversations kept open between requests, keyed by session ID and agent class.
+
+    Agents come from the agent pool and go back to it, reset, when their session
+    is closed, expires or is evicted as the least recently used.
+
+    Args:
+        max_sessions: Number of conversations kept open.
+        idle_timeout: Seconds after which an unused conversation is closed.
+    """
+
+    def __init__(self, max_sessions: int, idle_timeout: float):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._sessions: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str, agent_class) -> _Session:
+        """
+        Return the session's conversation with `agent_class`, opening it if needed.
+
+        Args:
+            session_id (str): ID chosen by the client.
+            agent_class: The AgentAbstract subclass to talk to.
+
+        Returns:
+            _Session: The session. Use `checkout` to query its agent, since the
+                session can be closed before its lock is taken.
+        """
+        key = (session_id, agent_class)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+                session.last_used = time.monotonic()
+                return session
+
+        # Creating an agent can be slow, so it happens outside the lock.
+        session = _Session(get_agent_pool().acquire(agent_class))
+        with self._lock:
+            existing = self._sessions.get(key)
+            if existing is not None:
+                get_agent_pool().release(session.agent)
+                return existing
+            self._sessions[key] = session
+            self._expire()
+            return session
+
+    @contextmanager
+    def checkout(self, session_id: str, agent_class) -> Iterator[_Session]:
+        """
+        Hold a session's lock for the duration of a `with` block.
+
+        A session closed between `get` and taking its lock may already be back in
+        the agent pool, so a fresh session is opened instead.
+
+        Args:
+            session_id (str): ID chosen by the client.
+            agent_class: The AgentAbstract subclass to talk to.
+
+        Yields:
+            _Session: The locked, open session.
+        """
+        while True:
+            session = self.get(session_id, agent_class)
+            with session.lock:
+                if not session.closed:
+                    yield session
+                    return
+
+    def close(self, session_id: str) -> int:
+        """
+        Close all conversations of a session.
+
+        Returns:
+            int: The number of conversations closed.
+        """
+        with self._lock:
+            keys = [key for key in self._sessions if key[0] == session_id]
+            for key in keys:
+                self._release(self._sessions.pop(key))
+        return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _expire(self) -> None:
+        """Close idle and surplus sessions. Called with the lock held."""
+        deadline = time.monotonic() - self.idle_timeout
+        for key, session in list(self._sessions.items()):
+            if session.last_used < deadline:
+                self._release(self._sessions.pop(key))
+        while len(self._sessions) > self.max_sessions:
+            _, session = self._sessions.popitem(last=False)
+            self._release(session)
+
+    @staticmethod
+    def _release(session: _Session) -> None:
+        session.closed = True
+        # A session still answering a request is dropped instead of pooled.
+        if session.lock.acquire(blocking=False):
+            try:
+                get_agent_pool().release(session.agent)
+            finally:
+                session.lock.release()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads one JSON request line and writes the response events as JSON lines."""
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line.strip():
+            return
+
+        def send(event: dict) -> None:
+            self.wfile.write((json.dumps(event) + "\n").encode())
+            self.wfile.flush()
+
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("the request must be a JSON object")
+        except ValueError as e:
+            send({"type": "error", "error": f"Invalid request: {e}"})
+            return
+
+        try:
+            self.server.handle_request_message(request, send)
+        except (BrokenPipeError, ConnectionResetError):
+            logger.info("Client disconnected before the response was complete")
+
+
+class CharonDaemon(socketserver.ThreadingUnixStreamServer):
+    """
+    One process hosting all agents behind a Unix socket JSON API.
+
+    Agents, the model clients, the agent pool, response and tool caches and MCP
+    sessions live as long as the daemon, so every request hits a warm process.
+    A client sends one JSON object per connection and reads JSON lines until the
+    daemon closes the connection:
+
+        {"op": "query", "agent": "books", "question": "...", "session": "id"}
+            -> the stream_query events (`text`, `tool_use`, `tool_result`), each
+               `result` as `{"type": "result", "text": ...}`, or an `error`
+        {"op": "reset", "session": "id"} -> {"type": "ok", "closed": n}
+        {"op": "ping"} -> {"type": "pong", "pid": ..., "agents": [...], ...}
+        {"op": "shutdown"} -> {"type": "ok"}
+
+    Queries with a `session` continue that session's conversation with the
+    agent; without one they get a pooled agent with an empty conversation.
+
+    Args:
+        socket_path: Path of the Unix socket to listen on.
+        agents: Agent name -> AgentAbstract subclass or "module:class".
+        config: The project config; loaded if None.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: Path = DAEMON_SOCKET_PATH,
+        agents: Optional[dict] = None,
+        config: Optional[object] = None,
+    ):
+        config = config or load_config()
+        self.socket_path = Path(socket_path)
+        self.agents = dict(AGENTS if agents is None else agents)
+        self.config = config
+        self.sessions = SessionStore(
+            config.daemon.max_sessions, config.daemon.session_idle_timeout
+        )
+        self.started_at = time.time()
+
+        _remove_stale_socket(self.socket_path)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(self.socket_path), _RequestHandler)
+
+    def server_bind(self):
+        # Agents can read the calendar and write the reading lists, so the socket
+        # is created owner-only rather than restricted after it is already open.
+        previous_umask = os.umask(0o077)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(previous_umask)
+        os.chmod(self.socket_path, 0o600)
+
+    def server_close(self):
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def preload(self, names: list) -> None:
+        """
+        Create agents in the background, so their imports and model clients are ready.
+
+        Args:
+            names (list): Agent names, e.g. from `daemon.preload_agents` in the config.
+        """
+        for name in names:
+            if name not in self.agents:
+                logger.warning(f"Cannot preload unknown agent {name}")
+                continue
+            build_in_background(self._preload, name)
+
+    def _preload(self, name: str) -> None:
+        try:
+            pool = get_agent_pool()
+            pool.release(pool.acquire(self.agent_class(name)))
+            logger.info(f"Preloaded the {name} agent")
+        except Exception as e:
+            logger.error(f"Could not preload the {name} agent: {e}")
+
+    def agent_class(self, name: str):
+        """
+        Return the agent class registered under `name`, importing it if needed.
+
+        Raises:
+            KeyError: If no agent is registered under `name`.
+        """
+        target = self.agents[name]
+        if isinstance(target, str):
+            module_name, class_name = target.split(":")
+            target = getattr(importlib.import_module(module_name), class_name)
+            self.agents[name] = target
+        return target
+
+    def handle_request_message(self, request: dict, send: Callable) -> None:
+        """
+        Answer one request, writing its events with `send`.
+
+        Args:
+            request (dict): The decoded request.
+            send (Callable): Writes one event to the client.
+        """
+        op = request.get("op", "query")
+        if op == "query":
+            self._query(request, send)
+        elif op == "reset":
+            closed = self.sessions.close(str(request.get("session", "")))
+            send({"type": "ok", "closed": closed})
+        elif op == "ping":
+            send(
+                {
+                    "type": "pong",
+                    "pid": os.getpid(),
+                    "uptime": time.time() - self.started_at,
+                    "agents": sorted(self.agents),
+                    "sessions": len(self.sessions),
+                }
+            )
+        elif op == "shutdown":
+            send({"type": "ok"})
+            # shutdown() blocks until serve_forever returns; let this connection close first.
+            threading.Thread(target=self.shutdown, daemon=True).start()
+        else:
+            send({"type": "error", "error": f"Unknown op {op!r}"})
+
+    def _query(self, request: dict, send: Callable) -> None:
+        name = request.get("agent", "home")
+        question = request.get("question", "")
+        if not isinstance(question, str) or not question.strip():
+            send({"type": "error", "error": "The request has no question"})
+            return
+        try:
+            agent_class = self.agent_class(name)
+        except KeyError:
+            send(
+                {
+                    "type": "error",
+                    "error": f"Unknown agent {name!r}; choose from {', '.join(sorted(self.agents))}",
+                }
+            )
+            return
+
+        session_id = request.get("session")
+        logger.info(f"{name} agent query (session {session_id}): {question}")
+        try:
+            if session_id:
+                with self.sessions.checkout(str(session_id), agent_class) as session:
+                    asyncio.run(_stream(session.agent, question, send))
+            else:
+                with get_agent_pool().agent(agent_class) as agent:
+                    asyncio.run(_stream(agent, question, send))
+        except (BrokenPipeError, ConnectionResetError):
+            raise
+        except Exception as e:
+            logger.error(f"The {name} agent failed: {e}")
+            send({"type": "error", "error": str(e)})
+
+
+async def _stream(agent, question: str, send: Callable) -> None:
+    """Forward the events of `stream_query` to the client as JSON-serializable dicts."""
+    async for event in agent.stream_query(question):
+        if event["type"] == "result":
+            result = event["result"]
+            event = {key: value for key, value in event.items() if key != "result"}
+            event["text"] = str(result)
+        send(event)
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    """
+    Remove a socket file left behind by a daemon that did not shut down cleanly.
+
+    Raises:
+        RuntimeError: If another daemon is listening on the socket.
+    """
+    if not socket_path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()
+            return
+    raise RuntimeError(f"A Charon daemon is already listening on {socket_path}")
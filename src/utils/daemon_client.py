@@ -0,0 +1,39 @@
+import json
+import socket
+import sys
+from pathlib import Path
+from typing import Iterator
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.constants.directories import DAEMON_SOCKET_PATH
+
+# Kept free of agent, config and logging imports, so the CLI client starts instantly.
+
+
+def request_daemon(
+    request: dict, socket_path: Path = DAEMON_SOCKET_PATH
+) -> Iterator[dict]:
+    """
+    Send a request to the daemon and yield the events of its response.
+
+    Args:
+        request (dict): The request, see `CharonDaemon`.
+        socket_path (Path): The daemon's socket.
+
+    Yields:
+        dict: The response events, as they arrive.
+
+    Raises:
+        ConnectionError: If no daemon is listening on `socket_path`.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise ConnectionError(
+                f"No Charon daemon is listening on {socket_path}"
+            ) from e
+        client.sendall((json.dumps(request) + "\n").encode())
+        with client.makefile("r", encoding="utf-8") as reader:
+            for line in reader:
+                yield json.loads(line)
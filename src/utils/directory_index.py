@@ -0,0 +1,269 @@
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.constants.directories import CACHE_DIR, SKIP_DIRS
+
+
+def is_skipped(name: str) -> bool:
+    """
+    Check whether a folder name is excluded from scanning.
+
+    Args:
+        name (str): The base name of the folder.
+
+    Returns:
+        bool: True for hidden folders and folders listed in SKIP_DIRS.
+    """
+    return name.startswith(".") or name in SKIP_DIRS
+
+
+def default_index_path(root_dir: Path) -> Path:
+    """
+    Return the location of the on-disk index for a root directory.
+
+    Args:
+        root_dir (Path): The root directory that is being indexed.
+
+    Returns:
+        Path: Path to the SQLite file inside the Charon cache directory.
+    """
+    digest = hashlib.sha1(str(Path(root_dir).resolve()).encode()).hexdigest()[:16]
+    return CACHE_DIR / "folder_index" / f"{digest}.sqlite3"
+
+
+class DirectoryIndex:
+    """
+    A persistent SQLite index of all subfolders below a root directory.
+
+    The index is built with a single full walk and afterwards kept up to date
+    incrementally: every indexed folder stores its mtime, and only folders whose
+    mtime changed (i.e. entries were created, deleted or renamed inside them) are
+    listed again on refresh.
+    """
+
+    def __init__(self, root_dir: Path, index_path: Optional[Path] = None):
+        self.root_dir = str(Path(root_dir))
+        self.index_path = Path(index_path or default_index_path(root_dir))
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(self.index_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS folders (
+                path TEXT PRIMARY KEY,
+                parent TEXT,
+                name TEXT NOT NULL,
+                depth INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                is_link INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS folders_parent ON folders(parent);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+        self.connection.commit()
+
+    def refresh(self, max_age: float = 0) -> bool:
+        """
+        Bring the index up to date with the file system.
+
+        The first call builds the index from scratch. Later calls only re-list the
+        folders whose mtime changed since they were indexed.
+
+        Args:
+            max_age (float): Skip the refresh if the index was refreshed less than
+                this many seconds ago.
+
+        Returns:
+            bool: True if the set of indexed folders may have changed.
+        """
+        with self._lock:
+            refreshed_at = self._get_meta("refreshed_at")
+            if refreshed_at is None or self._get_meta("root") != self.root_dir:
+                self._build()
+                changed = True
+            elif time.time() - float(refreshed_at) < max_age:
+                return False
+            else:
+                changed = self._update()
+
+            self._set_meta("refreshed_at", str(time.time()))
+            self.connection.commit()
+        return changed
+
+    def subfolders(self) -> list:
+        """
+        Return all indexed subfolders, shallowest first.
+
+        Returns:
+            list: Paths of every folder below the root directory.
+        """
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT path FROM folders WHERE parent IS NOT NULL ORDER BY depth, path"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def subfolder_mtimes(self) -> list:
+        """
+        Return all indexed subfolders with their modification times, shallowest first.
+
+        Returns:
+            list: (path, mtime_ns) tuples for every folder below the root directory.
+        """
+        with self._lock:
+            return self.connection.execute(
+                "SELECT path, mtime_ns FROM folders WHERE parent IS NOT NULL "
+                "ORDER BY depth, path"
+            ).fetchall()
+
+    def _build(self) -> None:
+        """Drop the current contents and index the whole tree again."""
+        self.connection.execute("DELETE FROM folders")
+        self.connection.execute("DELETE FROM meta")
+        try:
+            root_mtime = os.stat(self.root_dir).st_mtime_ns
+        except OSError:
+            return
+
+        self._insert(
+            [(self.root_dir, None, Path(self.root_dir).name, 0, root_mtime, 0)]
+        )
+        self._insert(self._walk(self.root_dir, depth=0))
+        self._set_meta("root", self.root_dir)
+
+    def _update(self) -> bool:
+        """Re-list only the folders whose mtime differs from the indexed one."""
+        rows = self.connection.execute(
+            "SELECT path, depth, mtime_ns FROM folders WHERE is_link = 0"
+        ).fetchall()
+
+        changed = []
+        removed = False
+        for path, depth, mtime_ns in rows:
+            try:
+                current_mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                self._delete_subtree(path)
+                removed = True
+                continue
+            if current_mtime != mtime_ns:
+                changed.append((path, depth, current_mtime))
+
+        for path, depth, mtime_ns in changed:
+            self._rescan(path, depth, mtime_ns)
+
+        return removed or bool(changed)
+
+    def _rescan(self, directory: str, depth: int, mtime_ns: int) -> None:
+        """Diff the children of a changed folder against the index."""
+        stored = {
+            row[0]
+            for row in self.connection.execute(
+                "SELECT path FROM folders WHERE parent = ?", (directory,)
+            )
+        }
+        children = self._list_children(directory, depth)
+        current = {child[0] for child in children}
+
+        for removed in stored - current:
+            self._delete_subtree(removed)
+
+        for child in children:
+            if child[0] in stored:
+                continue
+            self._insert([child])
+            if not child[5]:
+                self._insert(self._walk(child[0], depth=child[3]))
+
+        self.connection.execute(
+            "UPDATE folders SET mtime_ns = ? WHERE path = ?", (mtime_ns, directory)
+        )
+
+    def _walk(self, directory: str, depth: int) -> Iterator[tuple]:
+        """Yield index rows for every folder below the given directory."""
+        stack = [(directory, depth)]
+        while stack:
+            current, current_depth = stack.pop()
+            for child in self._list_children(current, current_depth):
+                yield child
+                if not child[5]:
+                    stack.append((child[0], child[3]))
+
+    def _list_children(self, directory: str, depth: int) -> list:
+        """
+        List the direct subfolders of a directory, applying the scanner skip rules.
+
+        Symlinked folders are listed but never descended into, like `os.walk`.
+        """
+        children = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if is_skipped(entry.name):
+                        continue
+                    try:
+                        if not entry.is_dir():
+                            continue
+                        is_link = entry.is_symlink()
+                        mtime_ns = 0 if is_link else entry.stat().st_mtime_ns
+                    except OSError:
+                        continue
+                    children.append(
+                        (
+                            entry.path,
+                            directory,
+                            entry.name,
+                            depth + 1,
+                            mtime_ns,
+                            int(is_link),
+                        )
+                    )
+        except OSError:
+            pass
+        return children
+
+    def _insert(self, rows) -> None:
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO folders (path, parent, name, depth, mtime_ns, is_link) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def _delete_subtree(self, path: str) -> None:
+        # Everything below `path` sorts between "path/" and "path0" ("0" follows "/").
+        self.connection.execute(
+            "DELETE FROM folders WHERE path = ? OR (path >= ? AND path < ?)",
+            (path, path + os.sep, path + chr(ord(os.sep) + 1)),
+        )
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self.connection.close()
@@ -1,11 +1,20 @@
-import fnmatch
 import os
-import subprocess
+import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator, Optional
 
-sys.path.append(str(Path(__file__).parent.parent))
-from constants.directories import SKIP_DIRS
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.constants.directories import INDEX_REFRESH_INTERVAL, SKIP_DIRS
+from src.utils.directory_index import DirectoryIndex, is_skipped
+from src.utils.folder_matching import FolderMatcher
+from src.utils.folder_watcher import FolderWatcher, create_folder_watcher
+from src.utils.gitignore import GitIgnore, is_ignored
+
+# File names containing any skipped directory name are left out, as before.
+SKIP_FILE_PATTERN = re.compile("|".join(re.escape(name) for name in sorted(SKIP_DIRS)))
 
 
 class DirectoryScanner:
@@ -13,9 +22,93 @@ class DirectoryScanner:
     A class to scan directories and find folders based on a given name.
     """
 
-    def __init__(self, root_dir: Path):
+    def __init__(self, root_dir: Path, use_index: bool = True):
         self.root_dir = root_dir
-        self.subfolders = self.fast_scandir(root_dir)
+        self.index = DirectoryIndex(root_dir) if use_index else None
+        self.watcher: Optional[FolderWatcher] = None
+        self.matcher = FolderMatcher(root_dir)
+        self._lock = threading.RLock()
+        # Insertion-ordered set of folder paths, kept in sync by the watcher.
+        self.subfolders: dict = {}
+        self.refresh(force=True)
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Reload the subfolders from the index (or a full walk without an index).
+
+        Only the difference to the current subfolders is applied to the matcher,
+        so a refresh after a few changes stays cheap.
+
+        Args:
+            force (bool): Reload even if the index reports no changes.
+        """
+        if self.index is None:
+            folders = dict.fromkeys(self.fast_scandir(self.root_dir))
+        elif (
+            self.index.refresh(max_age=0 if force else INDEX_REFRESH_INTERVAL) or force
+        ):
+            folders = dict(self.index.subfolder_mtimes())
+        else:
+            return
+
+        with self._lock:
+            for path in self.subfolders.keys() - folders.keys():
+                self.matcher.remove(path)
+            for path in folders.keys() - self.subfolders.keys():
+                self.matcher.add(path, folders[path])
+            self.subfolders = dict.fromkeys(folders)
+
+    def _scan_folders(self) -> list:
+        if self.index is None:
+            return self.fast_scandir(self.root_dir)
+        self.index.refresh()
+        return self.index.subfolders()
+
+    def add_folder(self, path: str) -> None:
+        """Add a newly created folder to the in-memory subfolders."""
+        with self._lock:
+            self.subfolders[path] = None
+            self.matcher.add(path)
+
+    def remove_folder(self, path: str) -> None:
+        """Remove a deleted folder and everything below it from the in-memory subfolders."""
+        prefix = path + os.sep
+        with self._lock:
+            removed = [f for f in self.subfolders if f.startswith(prefix)]
+            removed.append(path)
+            for folder in removed:
+                self.subfolders.pop(folder, None)
+                self.matcher.remove(folder)
+
+    def start_watching(self, poll_interval: float = 5.0) -> FolderWatcher:
+        """
+        Keep the subfolders up to date from a background file system watcher.
+
+        Args:
+            poll_interval (float): Seconds between scans when inotify is unavailable.
+
+        Returns:
+            FolderWatcher: The running watcher.
+        """
+        if self.watcher is None or not self.watcher.running:
+            with self._lock:
+                folders = list(self.subfolders)
+            self.watcher = create_folder_watcher(
+                self.root_dir,
+                folders=folders,
+                on_created=self.add_folder,
+                on_deleted=self.remove_folder,
+                on_resync=lambda: self.refresh(force=True),
+                scan=self._scan_folders,
+                poll_interval=poll_interval,
+            )
+        return self.watcher
+
+    def stop_watching(self) -> None:
+        """Stop the background watcher, if any."""
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
 
     def fast_scandir(self, directory: Path) -> list:
         subfolders = []
@@ -28,90 +121,314 @@ class DirectoryScanner:
 
         return subfolders
 
+    def find_folders(self, query: str, k: int = 5) -> list:
+        """
+        Ranks the subfolders by how well their name matches the query.
+
+        Args:
+            query (str): The name of the folder or project to find.
+            k (int): The maximum number of candidates to return.
+
+        Returns:
+            list: Up to k FolderMatch objects, best match first. Empty if nothing
+                matches well enough.
+        """
+        with self._lock:
+            return self.matcher.search(query, k)
+
     def find_folder(self, folder_name: str) -> str:
         """
         Searches for a folder with the specified name within the root directory and its subdirectories.
 
         Args:
-            root_dir (Path): The root directory to start the search.
             folder_name (str): The name of the folder to find.
 
         Returns:
-            str: The path to the found folder, or an empty string if not found.
-        """
-
-        match_score = {}
-        found_folder = None
-        for folder in self.subfolders:
-            splits = folder.split("/")
-            last_folder = splits[-1]
-            name_parts = folder_name.split(" ")
-            match_score[folder] = 0
-
-            if len(name_parts) == 1:
-                if folder_name.lower() in last_folder.lower():
-                    print(f"Found folder: {folder}")
-                    found_folder = folder
-                    break
-
-            if len(name_parts) > 1:
-                if all(part.lower() in last_folder.lower() for part in name_parts):
-                    print(f"Found folder: {folder}")
-                    found_folder = folder
-                    break
-                for part in name_parts:
-                    if part.lower() in last_folder.lower():
-                        match_score[folder] += 1
-
-        if found_folder is None:
-            best_match = max(match_score, key=match_score.get)
-            print(f"Best match: {best_match} with score {match_score[best_match]}")
-            found_folder = best_match
-
-        if found_folder is not None:
-            return found_folder
-        else:
+            str: The path to the best matching folder, or an empty string if not found.
+        """
+        matches = self.find_folders(folder_name, k=1)
+        if not matches:
             print(f"Folder '{folder_name}' not found in {self.root_dir}")
             return ""
 
-    def find_files(self, found_folder: Path) -> list:
+        print(f"Best match: {matches[0].path} with score {matches[0].score}")
+        return matches[0].path
+
+    def find_files(
+        self,
+        found_folder: Path,
+        extensions: tuple = (".py", ".ipynb"),
+        respect_gitignore: bool = True,
+        max_workers: int = 8,
+        listing: Optional[dict] = None,
+    ) -> list:
         """
         Finds all Python files in the specified folder and its subdirectories.
+
+        Skipped and git-ignored directories are pruned before they are entered, and
+        the top-level subdirectories are walked in parallel.
+
         Args:
             found_folder (Path): The path to the folder to search for Python files.
+            extensions (tuple): File extensions to collect.
+            respect_gitignore (bool): Leave out files and folders matched by .gitignore files.
+            max_workers (int): Number of threads walking the top-level subdirectories.
+            listing (Optional[dict]): Filled with {directory: (directory names,
+                file names)} for every directory walked, so the caller can render
+                the folder without listing it again.
+
         Returns:
-            list: A list of paths to Python files found in the folder.
+            list: A sorted list of paths to Python files found in the folder.
         """
+        root = str(found_folder)
+        if listing is None:
+            listing = {}
+        gitignores = self._load_gitignores(root, [], respect_gitignore)
+        files, subdirectories = self._scan_directory(
+            root, gitignores, extensions, respect_gitignore, listing
+        )
 
-        files = []
-        for root, _, filenames in os.walk(found_folder):
-            if any(fnmatch.fnmatch(root, f"*/{skip_dir}/*") for skip_dir in SKIP_DIRS):
-                continue
-            k = 0
-            for filename in filenames:
-                for skip_dir in SKIP_DIRS:
-                    if skip_dir in filename:
-                        k = 1
-                        break
-                if k == 0:
-                    if filename.endswith(".py") or filename.endswith(".ipynb"):
-                        files.append(str(Path(root) / filename))
+        def walk(subdirectory: str) -> list:
+            return self._walk_files(
+                subdirectory, gitignores, extensions, respect_gitignore, listing
+            )
 
+        if len(subdirectories) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for subdirectory_files in executor.map(walk, subdirectories):
+                    files.extend(subdirectory_files)
+        else:
+            for subdirectory in subdirectories:
+                files.extend(walk(subdirectory))
+
+        return sorted(files)
+
+    def _walk_files(
+        self,
+        directory: str,
+        gitignores: list,
+        extensions: tuple,
+        respect_gitignore: bool,
+        listing: dict,
+    ) -> list:
+        """Collect matching files below a directory with an explicit stack."""
+        files = []
+        stack = [(directory, gitignores)]
+        while stack:
+            current, parent_gitignores = stack.pop()
+            current_gitignores = self._load_gitignores(
+                current, parent_gitignores, respect_gitignore
+            )
+            current_files, subdirectories = self._scan_directory(
+                current, current_gitignores, extensions, respect_gitignore, listing
+            )
+            files.extend(current_files)
+            stack.extend(
+                (subdirectory, current_gitignores) for subdirectory in subdirectories
+            )
         return files
 
-    def generate_tree_structure(self, folder_path: Path) -> str:
+    def _scan_directory(
+        self,
+        directory: str,
+        gitignores: list,
+        extensions: tuple,
+        respect_gitignore: bool,
+        listing: dict,
+    ) -> tuple:
+        """
+        List one directory and record its visible entries in `listing`.
+
+        Returns:
+            tuple: The matching files and the subdirectories that still need to be walked.
+        """
+        files, subdirectories, file_names = [], [], []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir and is_skipped(entry.name):
+                        continue
+                    if gitignores and is_ignored(gitignores, entry.path, is_dir):
+                        continue
+
+                    if is_dir:
+                        subdirectories.append(entry.path)
+                        continue
+                    file_names.append(entry.name)
+                    if entry.name.endswith(extensions) and not SKIP_FILE_PATTERN.search(
+                        entry.name
+                    ):
+                        files.append(entry.path)
+        except OSError:
+            pass
+
+        listing[directory] = (
+            [os.path.basename(subdirectory) for subdirectory in subdirectories],
+            file_names,
+        )
+        return files, subdirectories
+
+    @staticmethod
+    def _load_gitignores(
+        directory: str, gitignores: list, respect_gitignore: bool
+    ) -> list:
+        """Return the parent .gitignore files plus the one in this directory, if any."""
+        if not respect_gitignore:
+            return gitignores
+        gitignore = GitIgnore.from_directory(directory)
+        return gitignores + [gitignore] if gitignore else gitignores
+
+    def iter_tree_lines(
+        self,
+        folder_path: Path,
+        max_depth: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        respect_gitignore: bool = True,
+        listing: Optional[dict] = None,
+    ) -> Iterator[str]:
+        """
+        Lazily renders the directory as `tree`-style lines.
+
+        Uses the listing recorded by a find_files call for this folder if one is
+        given, and otherwise lists directories on demand with the same skip and
+        .gitignore rules. Symlinks are shown but never followed.
+
+        Args:
+            folder_path (Path): The folder to render.
+            max_depth (Optional[int]): Deepest directory level to expand.
+            max_entries (Optional[int]): Maximum number of entries to render.
+            max_bytes (Optional[int]): Maximum size of the rendered output in bytes.
+            respect_gitignore (bool): Leave out paths matched by .gitignore files.
+            listing (Optional[dict]): Listing filled by find_files with the same
+                `respect_gitignore`; directories missing from it are listed on demand.
+
+        Yields:
+            str: One line of the tree at a time, ending with a summary line.
+        """
+        root = str(folder_path)
+        if listing is None:
+            listing = {}
+
+        counts = {"directories": 0, "files": 0, "bytes": 0}
+
+        def fits(line: str) -> bool:
+            rendered = counts["directories"] + counts["files"]
+            if max_entries is not None and rendered >= max_entries:
+                return False
+            size = len(line.encode()) + 1
+            if max_bytes is not None and counts["bytes"] + size > max_bytes:
+                return False
+            counts["bytes"] += size
+            return True
+
+        def walk(directory: str, gitignores: list, prefix: str, depth: int):
+            gitignores = self._load_gitignores(directory, gitignores, respect_gitignore)
+            if directory not in listing:
+                self._scan_directory(
+                    directory, gitignores, (), respect_gitignore, listing
+                )
+            directory_names, file_names = listing[directory]
+            entries = sorted(
+                [(name, True) for name in directory_names]
+                + [(name, False) for name in file_names],
+                key=lambda entry: entry[0].lower(),
+            )
+
+            for position, (name, is_dir) in enumerate(entries):
+                last = position == len(entries) - 1
+                line = f"{prefix}{'└── ' if last else '├── '}{name}"
+                expand = is_dir and (max_depth is None or depth < max_depth)
+                if is_dir and not expand:
+                    line += "/ [...]"
+                if not fits(line):
+                    yield f"{prefix}... (truncated)"
+                    return False
+                yield line
+                counts["directories" if is_dir else "files"] += 1
+
+                if expand:
+                    complete = yield from walk(
+                        os.path.join(directory, name),
+                        gitignores,
+                        prefix + ("    " if last else "│   "),
+                        depth + 1,
+                    )
+                    if not complete:
+                        return False
+            return True
+
+        yield os.path.basename(root.rstrip(os.sep)) or root
+        yield from walk(root, [], "", 1)
+        yield ""
+        yield f"{counts['directories']} directories, {counts['files']} files"
+
+    def generate_tree_structure(
+        self,
+        folder_path: Path,
+        max_depth: Optional[int] = 6,
+        max_entries: Optional[int] = 1000,
+        max_bytes: Optional[int] = 32_000,
+        listing: Optional[dict] = None,
+    ) -> str:
         """
         Generates a tree structure representation of the directory.
 
         Args:
             folder_path (Path): The path to the folder to generate the tree structure for.
+            max_depth (Optional[int]): Deepest directory level to expand.
+            max_entries (Optional[int]): Maximum number of entries to render.
+            max_bytes (Optional[int]): Maximum size of the result in bytes.
+            listing (Optional[dict]): Listing filled by find_files, see iter_tree_lines.
 
         Returns:
             str: A string representation of the tree structure.
         """
-        result = subprocess.run(
-            ["tree", "-l", str(folder_path)],
-            capture_output=True,
-            text=True,
+        return "\n".join(
+            self.iter_tree_lines(
+                folder_path,
+                max_depth=max_depth,
+                max_entries=max_entries,
+                max_bytes=max_bytes,
+                listing=listing,
+            )
         )
-        return result.stdout
+
+
+_scanners: dict = {}
+_scanners_lock = threading.Lock()
+
+
+def get_scanner(root_dir: Path, watch: bool = False) -> DirectoryScanner:
+    """
+    Return a process-wide DirectoryScanner for a root directory.
+
+    Without a watcher the scanner is refreshed incrementally from its index on
+    every call; with a watcher it is kept current in the background and the
+    request path never touches the disk.
+
+    Args:
+        root_dir (Path): The root directory to scan.
+        watch (bool): Start a background file system watcher for the root.
+
+    Returns:
+        DirectoryScanner: The shared scanner instance.
+    """
+    key = str(root_dir)
+    with _scanners_lock:
+        scanner = _scanners.get(key)
+        if scanner is None:
+            scanner = _scanners[key] = DirectoryScanner(root_dir=Path(root_dir))
+            if watch:
+                scanner.start_watching()
+            return scanner
+
+    if watch:
+        scanner.start_watching()
+    elif scanner.watcher is None:
+        scanner.refresh()
+    return scanner
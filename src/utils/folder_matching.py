@@ -0,0 +1,211 @@
+import heapq
+import math
+import os
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Optional
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.schemas.file_search_returns_schemas import FolderMatch
+
+SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+# Weights of the individual similarity signals, summing to 1.
+TRIGRAM_WEIGHT = 0.35
+TOKEN_WEIGHT = 0.3
+EDIT_WEIGHT = 0.2
+SUBSTRING_WEIGHT = 0.15
+
+DEPTH_PENALTY = 0.01
+RECENCY_BOOST = 0.05
+RECENCY_HALF_LIFE_DAYS = 30
+
+MIN_SCORE = 0.3
+# Only the best trigram candidates (at least this many, or 4 * k) are scored
+# with the (slower) edit distance.
+RESCORE_LIMIT = 16
+
+
+def normalize(name: str) -> str:
+    """Lowercase a folder name and collapse separators (`-`, `_`, `.`, spaces) to single spaces."""
+    return SEPARATORS.sub(" ", name.lower()).strip()
+
+
+def trigrams(text: str) -> set:
+    """Return the set of character trigrams of a normalized name, padded at the ends."""
+    padded = f" {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_similarity(a: str, b: str) -> float:
+    """Return 1 - (Levenshtein distance / length of the longer string)."""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        previous = current
+    return 1 - previous[-1] / max(len(a), len(b))
+
+
+class FolderMatcher:
+    """
+    An inverted index over folder base names for ranked fuzzy lookups.
+
+    Folders sharing a base name (`src`, `tests`, ...) share one index entry, and
+    candidates are generated from the rarest trigrams of the query, so a lookup
+    only touches the folders that can plausibly match.
+    """
+
+    def __init__(self, root_dir: Path):
+        self.root_depth = str(root_dir).rstrip(os.sep).count(os.sep)
+        self._paths_by_name: dict = defaultdict(set)
+        self._names_by_trigram: dict = defaultdict(set)
+        self._tokens_by_name: dict = {}
+        self._trigram_counts: dict = {}
+        self._mtimes: dict = {}
+
+    def __len__(self) -> int:
+        return len(self._mtimes)
+
+    def add(self, path: str, mtime_ns: Optional[int] = None) -> None:
+        """
+        Add a folder to the index.
+
+        Args:
+            path (str): Absolute path of the folder.
+            mtime_ns (Optional[int]): Modification time used for the recency boost;
+                now if None, and no boost if 0 (unknown).
+        """
+        name = normalize(os.path.basename(path))
+        self._mtimes[path] = time.time_ns() if mtime_ns is None else mtime_ns
+        if not name:
+            return
+
+        if name not in self._tokens_by_name:
+            name_trigrams = trigrams(name)
+            self._tokens_by_name[name] = frozenset(name.split())
+            self._trigram_counts[name] = len(name_trigrams)
+            for trigram in name_trigrams:
+                self._names_by_trigram[trigram].add(name)
+        self._paths_by_name[name].add(path)
+
+    def remove(self, path: str) -> None:
+        """Remove a folder from the index."""
+        if self._mtimes.pop(path, None) is None:
+            return
+        name = normalize(os.path.basename(path))
+        paths = self._paths_by_name.get(name)
+        if paths is None:
+            return
+
+        paths.discard(path)
+        if not paths:
+            del self._paths_by_name[name]
+            del self._tokens_by_name[name]
+            del self._trigram_counts[name]
+            for trigram in trigrams(name):
+                names = self._names_by_trigram[trigram]
+                names.discard(name)
+                if not names:
+                    del self._names_by_trigram[trigram]
+
+    def search(self, query: str, k: int = 5) -> list:
+        """
+        Return the k folders that best match the query.
+
+        Args:
+            query (str): Folder or project name as given by the user.
+            k (int): Maximum number of matches to return.
+
+        Returns:
+            list: FolderMatch objects ordered from best to worst.
+        """
+        normalized_query = normalize(query)
+        if not normalized_query:
+            return []
+
+        query_trigrams = trigrams(normalized_query)
+        query_tokens = set(normalized_query.split())
+        shared_counts = self._shared_trigram_counts(query_trigrams)
+
+        # Dice coefficient between the trigram sets of the query and each name.
+        trigram_scores = {
+            name: 2 * shared / (len(query_trigrams) + self._trigram_counts[name])
+            for name, shared in shared_counts.items()
+        }
+
+        name_scores = {}
+        for name in heapq.nlargest(
+            max(RESCORE_LIMIT, 4 * k), trigram_scores, key=trigram_scores.get
+        ):
+            tokens = self._tokens_by_name[name]
+            score = (
+                TRIGRAM_WEIGHT * trigram_scores[name]
+                + TOKEN_WEIGHT * len(query_tokens & tokens) / len(query_tokens)
+                + EDIT_WEIGHT * edit_similarity(normalized_query, name)
+                + SUBSTRING_WEIGHT * (normalized_query in name)
+            )
+            if score >= MIN_SCORE:
+                name_scores[name] = score
+
+        now = time.time_ns()
+        scored_paths = []
+        for name, name_score in name_scores.items():
+            for path in self._paths_by_name[name]:
+                depth = path.count(os.sep) - self.root_depth
+                age_days = max(now - self._mtimes[path], 0) / 86_400e9
+                recency = math.exp(-age_days * math.log(2) / RECENCY_HALF_LIFE_DAYS)
+                score = name_score - DEPTH_PENALTY * depth + RECENCY_BOOST * recency
+                scored_paths.append((score, path))
+
+        return [
+            FolderMatch(path=path, score=round(score, 4))
+            for score, path in heapq.nlargest(k, scored_paths)
+        ]
+
+    def _shared_trigram_counts(self, query_trigrams: set) -> Counter:
+        """
+        Count the query trigrams shared by every name that can plausibly match.
+
+        A name needs at least a third of the query trigrams to be a candidate, so
+        by the pigeonhole principle it must contain one of the
+        `len(query_trigrams) - required + 1` rarest ones; names only reachable
+        through the common trigrams are never counted.
+        """
+        postings = sorted(
+            (self._names_by_trigram.get(trigram, ()) for trigram in query_trigrams),
+            key=len,
+        )
+        required = max(1, math.ceil(len(postings) / 3))
+        rare, common = (
+            postings[: len(postings) - required + 1],
+            postings[len(postings) - required + 1 :],
+        )
+
+        counts = Counter()
+        for names in rare:
+            counts.update(names)
+        for names in common:
+            if len(names) < len(counts):
+                for name in names:
+                    if name in counts:
+                        counts[name] += 1
+            else:
+                for name in counts:
+                    if name in names:
+                        counts[name] += 1
+        return counts
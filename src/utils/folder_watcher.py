@@ -0,0 +1,290 @@
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from loguru import logger
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.utils.directory_index import is_skipped
+
+# inotify event flags, see inotify(7)
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_ONLYDIR
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class FolderWatcher(ABC):
+    """
+    Base class for background services that report folder creation and deletion
+    below a root directory.
+
+    Subclasses call `on_created` / `on_deleted` with absolute folder paths (a
+    rename is reported as a deletion followed by a creation) and `on_resync` when
+    events were lost and the caller should rescan.
+    """
+
+    def __init__(
+        self,
+        root_dir: Path,
+        on_created: Callable[[str], None],
+        on_deleted: Callable[[str], None],
+        on_resync: Callable[[], None],
+    ):
+        self.root_dir = str(root_dir)
+        self.on_created = on_created
+        self.on_deleted = on_deleted
+        self.on_resync = on_resync
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start watching in a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._run, name=type(self).__name__, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the watcher thread and wait for it to finish."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @abstractmethod
+    def _run(self) -> None:
+        """Watch until `stop` is called, reporting changes through the callbacks."""
+        pass
+
+
+class PollingFolderWatcher(FolderWatcher):
+    """
+    Portable watcher that periodically rescans and reports the difference.
+
+    Args:
+        scan: Callable returning the current set of folders, e.g. an incremental
+            refresh of the `DirectoryIndex`.
+        interval: Seconds between two scans.
+    """
+
+    def __init__(
+        self,
+        root_dir: Path,
+        on_created: Callable[[str], None],
+        on_deleted: Callable[[str], None],
+        on_resync: Callable[[], None],
+        scan: Callable[[], Iterable[str]],
+        interval: float = 5.0,
+    ):
+        super().__init__(root_dir, on_created, on_deleted, on_resync)
+        self.scan = scan
+        self.interval = interval
+
+    def _run(self) -> None:
+        known = set(self.scan())
+        while not self._stop_event.wait(self.interval):
+            try:
+                current = set(self.scan())
+            except Exception as e:
+                logger.warning(f"Polling {self.root_dir} failed: {e}")
+                continue
+
+            for path in known - current:
+                self.on_deleted(path)
+            for path in sorted(current - known):
+                self.on_created(path)
+            known = current
+
+
+class InotifyFolderWatcher(FolderWatcher):
+    """
+    Linux watcher built on inotify through a ctypes binding of libc.
+
+    inotify is not recursive, so one watch is registered per folder. Starting
+    raises OSError when inotify is unavailable or the watch limit
+    (`fs.inotify.max_user_watches`) is too low for the tree.
+    """
+
+    def __init__(
+        self,
+        root_dir: Path,
+        on_created: Callable[[str], None],
+        on_deleted: Callable[[str], None],
+        on_resync: Callable[[], None],
+        folders: Iterable[str],
+    ):
+        super().__init__(root_dir, on_created, on_deleted, on_resync)
+        self._libc = self._load_libc()
+        self._fd = -1
+        self._paths_by_wd: dict = {}
+        self._initial_folders = folders
+
+    @staticmethod
+    def _load_libc():
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("libc does not provide inotify")
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+
+    def start(self) -> None:
+        """Register watches for the root and all known folders, then start reading."""
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            error_number = ctypes.get_errno()
+            raise OSError(error_number, os.strerror(error_number))
+
+        try:
+            self._add_watch(self.root_dir)
+            for folder in self._initial_folders:
+                self._add_watch(folder)
+        except OSError:
+            os.close(self._fd)
+            raise
+        self._initial_folders = ()
+        super().start()
+
+    def _add_watch(self, path: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            error_number = ctypes.get_errno()
+            # The folder may already be gone again; only a full watch table is fatal.
+            if error_number in (errno.ENOENT, errno.ENOTDIR):
+                return
+            raise OSError(error_number, f"{os.strerror(error_number)}: {path}")
+        self._paths_by_wd[wd] = path
+
+    def _remove_watches(self, path: str) -> None:
+        prefix = path + os.sep
+        for wd, watched in list(self._paths_by_wd.items()):
+            if watched == path or watched.startswith(prefix):
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._paths_by_wd[wd]
+
+    def _created(self, path: str) -> None:
+        """Report a new folder and everything that was created inside it before the watch."""
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            try:
+                self._add_watch(current)
+            except OSError as e:
+                logger.warning(f"Cannot watch {current}: {e}")
+                self.on_resync()
+            self.on_created(current)
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False) and not is_skipped(
+                            entry.name
+                        ):
+                            stack.append(entry.path)
+            except OSError:
+                continue
+
+    def _run(self) -> None:
+        try:
+            while not self._stop_event.is_set():
+                readable, _, _ = select.select([self._fd], [], [], 0.5)
+                if not readable:
+                    continue
+                try:
+                    buffer = os.read(self._fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                self._handle_events(buffer)
+        finally:
+            os.close(self._fd)
+
+    def _handle_events(self, buffer: bytes) -> None:
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(buffer):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+            raw_name = buffer[
+                offset + EVENT_HEADER.size : offset + EVENT_HEADER.size + length
+            ]
+            offset += EVENT_HEADER.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                logger.warning("inotify queue overflowed, rescanning folders")
+                self.on_resync()
+                continue
+            if mask & IN_IGNORED:
+                self._paths_by_wd.pop(wd, None)
+                continue
+            if not mask & IN_ISDIR or wd not in self._paths_by_wd:
+                continue
+
+            name = os.fsdecode(raw_name.rstrip(b"\0"))
+            if is_skipped(name):
+                continue
+            path = os.path.join(self._paths_by_wd[wd], name)
+
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                self._created(path)
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                self._remove_watches(path)
+                self.on_deleted(path)
+
+
+def create_folder_watcher(
+    root_dir: Path,
+    folders: Iterable[str],
+    on_created: Callable[[str], None],
+    on_deleted: Callable[[str], None],
+    on_resync: Callable[[], None],
+    scan: Callable[[], Iterable[str]],
+    poll_interval: float = 5.0,
+) -> FolderWatcher:
+    """
+    Start the best available watcher for a root directory.
+
+    inotify is used when possible; otherwise the watcher falls back to polling
+    with `scan` every `poll_interval` seconds.
+
+    Returns:
+        FolderWatcher: The running watcher.
+    """
+    try:
+        watcher = InotifyFolderWatcher(
+            root_dir, on_created, on_deleted, on_resync, folders=folders
+        )
+        watcher.start()
+        logger.info(f"Watching {root_dir} with inotify")
+        return watcher
+    except OSError as e:
+        logger.warning(
+            f"inotify unavailable for {root_dir} ({e}), falling back to polling"
+        )
+
+    watcher = PollingFolderWatcher(
+        root_dir, on_created, on_deleted, on_resync, scan=scan, interval=poll_interval
+    )
+    watcher.start()
+    return watcher
@@ -0,0 +1,136 @@
+import os
+import re
+from typing import Optional
+
+
+def _translate(pattern: str) -> str:
+    """Translate the glob part of a gitignore pattern to a regular expression."""
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+            continue
+        if pattern.startswith("/**", i) and i + 3 == len(pattern):
+            regex += "/.*"
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+            continue
+        if char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                regex += re.escape(char)
+            else:
+                content = pattern[i + 1 : end].replace("\\", "\\\\")
+                if content.startswith("!"):
+                    content = "^" + content[1:]
+                regex += f"[{content}]"
+                i = end
+        elif char == "\\" and i + 1 < len(pattern):
+            i += 1
+            regex += re.escape(pattern[i])
+        else:
+            regex += re.escape(char)
+        i += 1
+    return regex
+
+
+class GitIgnore:
+    """
+    The patterns of a single .gitignore file, scoped to the folder that contains it.
+
+    Supports the common gitignore syntax: comments, negation (`!`), directory-only
+    patterns (trailing `/`), anchored patterns (leading or inner `/`) and `*`, `?`,
+    `[...]` and `**` wildcards.
+    """
+
+    def __init__(self, base_dir: str, lines: list):
+        self.base_dir = base_dir
+        # (compiled regex, negated, directory only), in file order
+        self.rules = []
+        for line in lines:
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            directory_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+
+            anchored = "/" in line
+            line = line.lstrip("/")
+            prefix = "" if anchored else "(?:.*/)?"
+            self.rules.append(
+                (re.compile(f"^{prefix}{_translate(line)}$"), negated, directory_only)
+            )
+
+    @classmethod
+    def from_directory(cls, directory: str) -> Optional["GitIgnore"]:
+        """
+        Load the .gitignore file of a directory.
+
+        Args:
+            directory (str): Folder that may contain a .gitignore file.
+
+        Returns:
+            Optional[GitIgnore]: The parsed patterns, or None if there is no file.
+        """
+        try:
+            with open(os.path.join(directory, ".gitignore"), errors="ignore") as file:
+                return cls(directory, file.readlines())
+        except OSError:
+            return None
+
+    def match(self, path: str, is_dir: bool) -> Optional[bool]:
+        """
+        Check a path against the patterns of this file.
+
+        Args:
+            path (str): Absolute path below `base_dir`.
+            is_dir (bool): Whether the path is a directory.
+
+        Returns:
+            Optional[bool]: True if ignored, False if explicitly re-included, None if
+                no pattern matches.
+        """
+        relative = path[len(self.base_dir) :].lstrip(os.sep).replace(os.sep, "/")
+        result = None
+        for regex, negated, directory_only in self.rules:
+            if directory_only and not is_dir:
+                continue
+            if regex.match(relative):
+                result = not negated
+        return result
+
+
+def is_ignored(gitignores: list, path: str, is_dir: bool) -> bool:
+    """
+    Check a path against all .gitignore files that apply to it.
+
+    Args:
+        gitignores (list): GitIgnore objects from the outermost to the innermost folder.
+        path (str): Absolute path to check.
+        is_dir (bool): Whether the path is a directory.
+
+    Returns:
+        bool: True if the last matching pattern ignores the path.
+    """
+    ignored = False
+    for gitignore in gitignores:
+        result = gitignore.match(path, is_dir)
+        if result is not None:
+            ignored = result
+    return ignored
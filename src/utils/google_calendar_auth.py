@@ -1,9 +1,11 @@
 import os
+import sys
+from pathlib import Path
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.utils.persistence import atomic_write_text, file_lock
+
+TOKEN_PATH = "google_credentials.json"
 
 # Scopes for google calendar API
 SCOPES = [
@@ -13,15 +15,26 @@ SCOPES = [
 
 
 def authenticate_calendar():
-    creds = None
-    if os.path.exists("google_credentials.json"):
-        creds = Credentials.from_authorized_user_file("google_credentials.json", SCOPES)
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)
-            creds = flow.run_local_server(port=0)
-        with open("google_credentials.json", "w") as token:
-            token.write(creds.to_json())
+    # The Google client libraries take about a second to import; only load them
+    # once the calendar is actually used.
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from googleapiclient.discovery import build
+
+    # Held while refreshing, so concurrent agents refresh the token once and
+    # the others read the new one.
+    with file_lock(TOKEN_PATH):
+        creds = None
+        if os.path.exists(TOKEN_PATH):
+            creds = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                flow = InstalledAppFlow.from_client_secrets_file(
+                    "credentials.json", SCOPES
+                )
+                creds = flow.run_local_server(port=0)
+            atomic_write_text(TOKEN_PATH, creds.to_json(), mode=0o600)
     return build("calendar", "v3", credentials=creds)
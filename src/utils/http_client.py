@@ -0,0 +1,255 @@
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.constants.directories import HTTP_CACHE_DIR
+from src.utils.list_store import normalize_key
+
+# Seconds to connect and to wait for the response of a lookup.
+DEFAULT_TIMEOUT = (3.05, 10)
+# Query parameters that never become part of a cache key, e.g. API keys.
+SECRET_PARAMS = frozenset({"apikey", "api_key", "key", "token"})
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_caches: dict = {}
+_caches_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session, creating it on first use.
+
+    The session keeps connections open between lookups and retries idempotent
+    requests with exponential backoff on connection errors, 429 and 5xx
+    responses, honouring Retry-After.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET", "HEAD"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=8, pool_maxsize=16, max_retries=retry
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def cache_key(url: str, params: Optional[dict] = None) -> str:
+    """
+    Key a lookup by its URL and normalized query.
+
+    Parameter names are sorted, empty values dropped and values compared
+    ignoring case and extra whitespace, so "Dune " and "dune" share an entry.
+    API keys are left out of the key.
+
+    Args:
+        url (str): The endpoint.
+        params (Optional[dict]): The query parameters.
+
+    Returns:
+        str: The SHA-1 of the normalized request.
+    """
+    query = {
+        name: normalize_key(value)
+        for name, value in (params or {}).items()
+        if name.lower() not in SECRET_PARAMS and value not in (None, "")
+    }
+    normalized = json.dumps([url.rstrip("/"), query], sort_keys=True)
+    return hashlib.sha1(normalized.encode()).hexdigest()
+
+
+class HttpCache:
+    """
+    An on-disk cache of JSON responses with a time to live per entry.
+
+    Entries are kept in one SQLite table with the validators the server sent
+    (ETag and Last-Modified). Once an entry expires, the next lookup asks the
+    server whether it changed; a 304 answer renews the entry without
+    downloading it again.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir or HTTP_CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            self.cache_dir / "responses.sqlite3", timeout=10, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                expires_at REAL NOT NULL
+            ) WITHOUT ROWID;
+            """
+        )
+        self.connection.commit()
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Return a cached entry, fresh or expired.
+
+        Returns:
+            Optional[dict]: `body`, `etag`, `last_modified` and whether it is
+                `fresh`, or None if nothing is cached.
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        body, etag, last_modified, expires_at = row
+        return {
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fresh": expires_at > time.time(),
+        }
+
+    def put(
+        self,
+        key: str,
+        url: str,
+        body: str,
+        ttl: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, body, etag, last_modified, expires_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, url, body, etag, last_modified, time.time() + ttl),
+            )
+            self.connection.commit()
+
+    def renew(self, key: str, ttl: float) -> None:
+        """Keep an entry for another `ttl` seconds, after the server said it is unchanged."""
+        with self._lock:
+            self.connection.execute(
+                "UPDATE responses SET expires_at = ? WHERE key = ?",
+                (time.time() + ttl, key),
+            )
+            self.connection.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.connection.execute("DELETE FROM responses")
+            self.connection.commit()
+
+
+def get_http_cache() -> HttpCache:
+    """
+    Return the process-wide HTTP response cache, opening it on first use.
+
+    Returns:
+        HttpCache: The cache in HTTP_CACHE_DIR.
+    """
+    key = str(HTTP_CACHE_DIR)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = HttpCache(HTTP_CACHE_DIR)
+        return _caches[key]
+
+
+def get_json(
+    url: str,
+    params: Optional[dict] = None,
+    ttl: float = 86400,
+    cache_if: Callable = lambda data: True,
+    timeout: tuple = DEFAULT_TIMEOUT,
+):
+    """
+    GET a JSON document through the shared session and the on-disk cache.
+
+    A fresh cached response is returned without a request. An expired one is
+    revalidated with its ETag or Last-Modified date, and still returned if the
+    server cannot be reached.
+
+    Args:
+        url (str): The endpoint.
+        params (Optional[dict]): The query parameters.
+        ttl (float): Seconds during which a response is reused without asking the server.
+        cache_if (Callable): Predicate on the decoded response deciding whether
+            it is stored, e.g. to leave out "not found" answers.
+        timeout (tuple): Connect and read timeouts in seconds.
+
+    Returns:
+        The decoded JSON response.
+
+    Raises:
+        requests.RequestException: If the request fails and nothing is cached.
+    """
+    cache = get_http_cache()
+    key = cache_key(url, params)
+    cached = cache.get(key)
+    if cached is not None and cached["fresh"]:
+        logger.debug(f"Reusing the cached response of {url}")
+        return json.loads(cached["body"])
+
+    headers = {}
+    if cached is not None:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        response = get_session().get(
+            url, params=params, headers=headers, timeout=timeout
+        )
+        if response.status_code == 304 and cached is not None:
+            cache.renew(key, ttl)
+            return json.loads(cached["body"])
+        response.raise_for_status()
+        data = response.json()
+    except requests.RequestException as e:
+        if cached is None:
+            raise
+        logger.warning(f"Using an expired cached response of {url}: {e}")
+        return json.loads(cached["body"])
+
+    if cache_if(data):
+        cache.put(
+            key,
+            url,
+            json.dumps(data),
+            ttl,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+    return data
@@ -0,0 +1,500 @@
+import json
+import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from loguru import logger
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.constants.directories import (
+    BOOK_DB_PATH,
+    BOOK_LIST_PATH,
+    MOVIE_DB_PATH,
+    MOVIE_LIST_PATH,
+)
+
+
+def normalize_key(value: Optional[str]) -> str:
+    """
+    Normalize a title or name for matching: case and extra whitespace are ignored.
+
+    Args:
+        value (Optional[str]): The title or name.
+
+    Returns:
+        str: The normalized value; empty for None.
+    """
+    return " ".join(str(value or "").split()).casefold()
+
+
+class ListStore:
+    """
+    An indexed SQLite store for a personal list split into sections, e.g. books
+    to read and books read.
+
+    Every entry is one row holding the entry as JSON, indexed on its section and
+    normalized title and creator (author or director). Adding, finding and moving
+    an entry are index lookups that write a single row, however long the list is.
+    The order of a section is the order in which entries were added to it.
+
+    On first use the store is filled from the JSON file the list used to be kept
+    in; that file is left untouched afterwards.
+
+    Args:
+        db_path: Path of the SQLite file.
+        sections: Names of the sections, e.g. ("to_read", "read").
+        key_fields: Entry fields identifying an entry within a section: the
+            title and, optionally, the creator.
+        legacy_json: JSON file with one list per section to import on first use.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        sections: tuple,
+        key_fields: tuple,
+        legacy_json: Optional[Path] = None,
+    ):
+        self.db_path = Path(db_path)
+        self.sections = tuple(sections)
+        self.title_field = key_fields[0]
+        self.creator_field = key_fields[1] if len(key_fields) > 1 else None
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # (version, entries) of the last `entries` call.
+        self._snapshot: tuple = (None, [])
+        # Agents of the daemon and of other processes may write at the same time;
+        # SQLite serializes the writers and `timeout` makes them wait their turn.
+        self.connection = sqlite3.connect(
+            self.db_path, timeout=10, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        if legacy_json is not None:
+            self._import_legacy_json(Path(legacy_json))
+
+    def _create_schema(self) -> None:
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                id INTEGER PRIMARY KEY,
+                section TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                title_key TEXT NOT NULL,
+                creator_key TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS entries_key
+                ON entries(title_key, creator_key, section, position);
+            CREATE INDEX IF NOT EXISTS entries_creator ON entries(creator_key);
+            CREATE INDEX IF NOT EXISTS entries_order ON entries(section, position);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+        self.connection.commit()
+
+    @contextmanager
+    def _write(self) -> Iterator[None]:
+        """
+        Run a read-modify-write in one transaction.
+
+        BEGIN IMMEDIATE takes the write lock up front, so a concurrent writer in
+        another process cannot slip in between a lookup and the write based on it.
+        """
+        with self._lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self.connection.rollback()
+                raise
+            self.connection.commit()
+
+    def _import_legacy_json(self, json_path: Path) -> None:
+        """Copy the entries of the old JSON file into an empty store, once."""
+        with self._write():
+            if self._get_meta("imported_from") is not None:
+                return
+            count = 0
+            if json_path.exists():
+                with open(json_path) as f:
+                    data = json.load(f)
+                for section in self.sections:
+                    for entry in data.get(section, []):
+                        self._insert(section, entry)
+                        count += 1
+                logger.info(
+                    f"Imported {count} entries from {json_path} into {self.db_path}"
+                )
+            self._set_meta("imported_from", str(json_path))
+            self._bump_version()
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def _bump_version(self) -> None:
+        # Read by `version`, e.g. for the response cache fingerprint.
+        self.connection.execute(
+            "INSERT INTO meta (key, value) VALUES ('version', '1') "
+            "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+        )
+
+    def _keys(self, entry: dict) -> tuple:
+        creator = entry.get(self.creator_field) if self.creator_field else None
+        return normalize_key(entry.get(self.title_field)), normalize_key(creator)
+
+    def _insert(self, section: str, entry: dict) -> None:
+        title_key, creator_key = self._keys(entry)
+        # MAX over the (section, position) index is a single lookup.
+        self.connection.execute(
+            "INSERT INTO entries (section, position, title_key, creator_key, data) "
+            "VALUES (?, (SELECT COALESCE(MAX(position), 0) + 1 FROM entries "
+            "WHERE section = ?), ?, ?, ?)",
+            (section, section, title_key, creator_key, json.dumps(entry)),
+        )
+
+    def _find_row(self, section: str, title: str, creator: Optional[str]):
+        creator_key = normalize_key(creator) if self.creator_field else ""
+        return self.connection.execute(
+            "SELECT id, data FROM entries "
+            "WHERE title_key = ? AND creator_key = ? AND section = ? "
+            "ORDER BY position LIMIT 1",
+            (normalize_key(title), creator_key, section),
+        ).fetchone()
+
+    def _check_section(self, section: str) -> None:
+        if section not in self.sections:
+            raise ValueError(
+                f"Unknown section {section!r}; expected one of {', '.join(self.sections)}"
+            )
+
+    def find(
+        self, section: str, title: str, creator: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        Look up an entry by its title (and creator) within a section.
+
+        Args:
+            section (str): The section to look in.
+            title (str): The title; matched ignoring case and extra whitespace.
+            creator (Optional[str]): The author or director, for lists keyed on it.
+
+        Returns:
+            Optional[dict]: The entry, or None if the section has no such entry.
+        """
+        self._check_section(section)
+        with self._lock:
+            row = self._find_row(section, title, creator)
+        return json.loads(row[1]) if row else None
+
+    def add(self, section: str, entry: dict) -> bool:
+        """
+        Append an entry to a section unless the section already has it.
+
+        Args:
+            section (str): The section to add to.
+            entry (dict): The entry, with at least the key fields.
+
+        Returns:
+            bool: False if an entry with the same title (and creator) was already there.
+        """
+        self._check_section(section)
+        creator = entry.get(self.creator_field) if self.creator_field else None
+        with self._write():
+            if self._find_row(section, entry[self.title_field], creator):
+                return False
+            self._insert(section, entry)
+            self._bump_version()
+        return True
+
+    def move(
+        self,
+        source: str,
+        target: str,
+        title: str,
+        creator: Optional[str] = None,
+        updates: Optional[dict] = None,
+    ) -> Optional[dict]:
+        """
+        Move an entry to the end of another section, updating some of its fields.
+
+        Args:
+            source (str): The section the entry is in.
+            target (str): The section to move it to.
+            title (str): The entry's title.
+            creator (Optional[str]): The entry's author or director, for lists keyed on it.
+            updates (Optional[dict]): Fields to set on the entry, e.g. a rating.
+
+        Returns:
+            Optional[dict]: The moved entry, or None if `source` has no such entry.
+        """
+        self._check_section(source)
+        self._check_section(target)
+        with self._write():
+            row = self._find_row(source, title, creator)
+            if row is None:
+                return None
+            entry = json.loads(row[1])
+            entry.update(updates or {})
+            self.connection.execute("DELETE FROM entries WHERE id = ?", (row[0],))
+            self._insert(target, entry)
+            self._bump_version()
+        return entry
+
+    def counts(self) -> dict:
+        """
+        Return the number of entries per section.
+
+        Returns:
+            dict: Section name -> number of entries.
+        """
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT section, COUNT(*) FROM entries GROUP BY section"
+            ).fetchall()
+        counts = dict.fromkeys(self.sections, 0)
+        counts.update(rows)
+        return counts
+
+    def load(self) -> dict:
+        """
+        Return all entries, in the shape of the old JSON file.
+
+        Returns:
+            dict: Section name -> list of entries, in the order they were added.
+        """
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT section, data FROM entries ORDER BY section, position"
+            ).fetchall()
+        data = {section: [] for section in self.sections}
+        for section, entry in rows:
+            data.setdefault(section, []).append(json.loads(entry))
+        return data
+
+    def entries(self) -> list:
+        """
+        Return all entries with their section, kept in memory until the store changes.
+
+        The list is shared between callers and must not be mutated.
+
+        Returns:
+            list: (section, entry) pairs, by section then in the order they were added.
+        """
+        with self._lock:
+            version = int(self._get_meta("version") or 0)
+            if self._snapshot[0] != version:
+                rows = self.connection.execute(
+                    "SELECT section, data FROM entries ORDER BY section, position"
+                ).fetchall()
+                order = {section: index for index, section in enumerate(self.sections)}
+                rows.sort(key=lambda row: order.get(row[0], len(order)))
+                entries = [(section, json.loads(data)) for section, data in rows]
+                self._snapshot = (version, entries)
+            return self._snapshot[1]
+
+    def query(
+        self,
+        section: Optional[str] = None,
+        contains: Optional[dict] = None,
+        min_rating: Optional[float] = None,
+        max_rating: Optional[float] = None,
+        date_fields: tuple = (),
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        sort: Optional[str] = None,
+    ) -> list:
+        """
+        Filter and sort the entries in memory.
+
+        Args:
+            section (Optional[str]): Only entries of this section.
+            contains (Optional[dict]): Field -> text the field must contain,
+                ignoring case, e.g. {"genre": "fantasy"}. None values are ignored.
+            min_rating (Optional[float]): Only entries rated at least this.
+            max_rating (Optional[float]): Only entries rated at most this.
+            date_fields (tuple): Fields holding an entry's date, the first one
+                set is used, e.g. ("read_date", "added_date").
+            date_from (Optional[str]): Only entries dated on or after this YYYY-MM-DD day.
+            date_to (Optional[str]): Only entries dated on or before this YYYY-MM-DD day.
+            sort (Optional[str]): Field to sort on, prefixed with "-" for descending
+                order. Entries without the field come last. By default entries
+                keep their list order.
+
+        Returns:
+            list: Copies of the matching entries, each with its section in `status`.
+        """
+        if section is not None:
+            self._check_section(section)
+        if (date_from or date_to) and not date_fields:
+            raise ValueError("Filtering on dates needs the date fields")
+        # Raises ValueError for anything but a YYYY-MM-DD date.
+        date_from = date_from and date.fromisoformat(date_from[:10]).isoformat()
+        date_to = date_to and date.fromisoformat(date_to[:10]).isoformat()
+        contains = {
+            field: normalize_key(text)
+            for field, text in (contains or {}).items()
+            if text is not None
+        }
+
+        selected = []
+        for entry_section, entry in self.entries():
+            if section is not None and entry_section != section:
+                continue
+            if any(
+                text not in normalize_key(entry.get(field))
+                for field, text in contains.items()
+            ):
+                continue
+            if min_rating is not None or max_rating is not None:
+                rating = entry.get("rating")
+                if not isinstance(rating, (int, float)):
+                    continue
+                if min_rating is not None and rating < min_rating:
+                    continue
+                if max_rating is not None and rating > max_rating:
+                    continue
+            if date_from or date_to:
+                day = next(
+                    (
+                        str(entry[field])[:10]
+                        for field in date_fields
+                        if entry.get(field)
+                    ),
+                    None,
+                )
+                if day is None:
+                    continue
+                if (date_from and day < date_from) or (date_to and day > date_to):
+                    continue
+            selected.append({"status": entry_section, **entry})
+
+        if sort:
+            field = sort.lstrip("-")
+            present = [entry for entry in selected if entry.get(field) is not None]
+            missing = [entry for entry in selected if entry.get(field) is None]
+            # Strings sort ignoring case, and after numbers if a field mixes both.
+            present.sort(
+                key=lambda entry: (
+                    isinstance(entry[field], str),
+                    normalize_key(entry[field])
+                    if isinstance(entry[field], str)
+                    else entry[field],
+                ),
+                reverse=sort.startswith("-"),
+            )
+            selected = present + missing
+        return selected
+
+    def version(self) -> int:
+        """
+        Return a number that changes with every write, also by other processes.
+
+        Returns:
+            int: The store's version.
+        """
+        with self._lock:
+            return int(self._get_meta("version") or 0)
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
+
+
+def format_entries(
+    header: str,
+    entries: list,
+    fields: Optional[List[str]] = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> str:
+    """
+    Render one page of entries compactly, one JSON object per line.
+
+    Args:
+        header (str): First line, e.g. the size of each section.
+        entries (list): The entries, e.g. as returned by `ListStore.query`.
+        fields (Optional[List[str]]): Only include these fields. Fields that
+            are not set are always left out.
+        limit (int): Number of entries on the page.
+        offset (int): Number of entries to skip.
+
+    Returns:
+        str: The header, a line saying which entries are shown, then the entries.
+    """
+    if limit < 1 or offset < 0:
+        raise ValueError("limit must be positive and offset must not be negative")
+    page = entries[offset : offset + limit]
+    lines = [header]
+    if not page:
+        lines.append(f"No entries to show ({len(entries)} matching).")
+    else:
+        shown = f"Showing {offset + 1}-{offset + len(page)} of {len(entries)} matching"
+        if offset + len(page) < len(entries):
+            shown += f"; use offset={offset + len(page)} for more"
+        lines.append(shown)
+    for entry in page:
+        if fields:
+            entry = {field: entry.get(field) for field in fields}
+        entry = {key: value for key, value in entry.items() if value is not None}
+        lines.append(json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
+    return "\n".join(lines)
+
+
+_stores: dict = {}
+_stores_lock = threading.Lock()
+
+
+def _get_store(db_path: Path, **kwargs) -> ListStore:
+    key = str(Path(db_path))
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = ListStore(db_path, **kwargs)
+        return _stores[key]
+
+
+def get_book_store() -> ListStore:
+    """
+    Return the process-wide store of the reading list, opening it on first use.
+
+    Returns:
+        ListStore: Books in the `to_read` and `read` sections, keyed on title and author.
+    """
+    return _get_store(
+        BOOK_DB_PATH,
+        sections=("to_read", "read"),
+        key_fields=("title", "author"),
+        legacy_json=BOOK_LIST_PATH,
+    )
+
+
+def get_movie_store() -> ListStore:
+    """
+    Return the process-wide store of the watchlist, opening it on first use.
+
+    Returns:
+        ListStore: Movies and shows in the `to_watch` and `watched` sections, keyed on title.
+    """
+    return _get_store(
+        MOVIE_DB_PATH,
+        sections=("to_watch", "watched"),
+        key_fields=("title",),
+        legacy_json=MOVIE_LIST_PATH,
+    )
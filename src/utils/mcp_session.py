@@ -0,0 +1,182 @@
+import atexit
+import threading
+import time
+from typing import Callable, Optional
+
+from loguru import logger
+
+# Restart backoff: 1 s, 2 s, 4 s, ... capped at MAX_RESTART_DELAY.
+INITIAL_RESTART_DELAY = 1.0
+MAX_RESTART_DELAY = 30.0
+MAX_START_ATTEMPTS = 3
+PING_TIMEOUT = 5.0
+
+
+class MCPSessionManager:
+    """
+    Keeps one MCP server session alive for the whole process.
+
+    The server subprocess is started on first use and reused by every query; its
+    tool list is fetched once per start. Before each use the session is checked
+    with an MCP ping, and a dead or unresponsive server is restarted with
+    exponential backoff. All sessions are stopped when the interpreter exits.
+
+    Args:
+        name: Name used in log messages.
+        transport_factory: Callable returning the MCP transport, as passed to MCPClient.
+    """
+
+    def __init__(self, name: str, transport_factory: Callable):
+        from strands.tools.mcp import MCPClient
+
+        self.name = name
+        self.client = MCPClient(transport_factory)
+        self._tools: Optional[list] = None
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._next_start_at = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._tools is not None and self.client._is_session_active()
+
+    def get_tools(self) -> list:
+        """
+        Return the tools of the MCP server, starting or restarting it if needed.
+
+        Returns:
+            list: MCPAgentTool objects bound to this session's client.
+
+        Raises:
+            MCPClientInitializationError: If the server could not be started.
+        """
+        with self._lock:
+            if not self._is_healthy():
+                self._restart()
+            return self._tools
+
+    def mark_failed(self) -> None:
+        """Stop the session after an error, so the next use starts a fresh server."""
+        with self._lock:
+            self._stop()
+
+    def close(self) -> None:
+        """Stop the server subprocess."""
+        with self._lock:
+            self._stop()
+
+    def _is_healthy(self) -> bool:
+        if not self.running:
+            return False
+        try:
+            # MCPClient has no public health check; a ping is a single round trip.
+            self.client._invoke_on_background_thread(
+                self.client._background_thread_session.send_ping()
+            ).result(timeout=PING_TIMEOUT)
+            return True
+        except Exception as e:
+            logger.warning(f"MCP server {self.name} is not responding: {e}")
+            return False
+
+    def _restart(self) -> None:
+        self._stop()
+        for attempt in range(1, MAX_START_ATTEMPTS + 1):
+            delay = self._next_start_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                started_at = time.monotonic()
+                self.client.start()
+                self._tools = list(self.client.list_tools_sync())
+                logger.info(
+                    f"Started MCP server {self.name} with {len(self._tools)} tools "
+                    f"in {time.monotonic() - started_at:.1f}s"
+                )
+                self._failures = 0
+                return
+            except Exception as e:
+                self._stop()
+                self._failures += 1
+                backoff = min(
+                    INITIAL_RESTART_DELAY * 2 ** (self._failures - 1), MAX_RESTART_DELAY
+                )
+                self._next_start_at = time.monotonic() + backoff
+                logger.error(
+                    f"Starting MCP server {self.name} failed "
+                    f"(attempt {attempt}/{MAX_START_ATTEMPTS}): {e}"
+                )
+                if attempt == MAX_START_ATTEMPTS:
+                    raise
+
+    def _stop(self) -> None:
+        self._tools = None
+        if not self.client._is_session_active():
+            return
+        try:
+            self.client.stop(None, None, None)
+        except Exception as e:
+            logger.warning(f"Stopping MCP server {self.name} failed: {e}")
+
+
+def is_mcp_failure(error: BaseException) -> bool:
+    """
+    Tell whether an error came from an MCP server or its transport.
+
+    The error and the exceptions it was raised from are checked, since the agent
+    event loop wraps what the tools raise.
+
+    Args:
+        error (BaseException): The error a query raised.
+
+    Returns:
+        bool: True for MCP protocol, client start-up and closed or broken stream
+            errors; False for anything else, e.g. a model error.
+    """
+    from anyio import BrokenResourceError, ClosedResourceError
+    from mcp.shared.exceptions import McpError
+    from strands.types.exceptions import MCPClientInitializationError
+
+    mcp_errors = (
+        McpError,
+        MCPClientInitializationError,
+        BrokenResourceError,
+        ClosedResourceError,
+    )
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, mcp_errors):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
+
+_sessions: dict = {}
+_sessions_lock = threading.Lock()
+
+
+def get_mcp_session(name: str, transport_factory: Callable) -> MCPSessionManager:
+    """
+    Return the process-wide session manager for an MCP server, creating it on first use.
+
+    Args:
+        name (str): Key and display name of the server, e.g. "github".
+        transport_factory (Callable): Callable returning the MCP transport; only used
+            when the manager is created.
+
+    Returns:
+        MCPSessionManager: The shared manager. The server starts on the first get_tools().
+    """
+    with _sessions_lock:
+        if name not in _sessions:
+            _sessions[name] = MCPSessionManager(name, transport_factory)
+        return _sessions[name]
+
+
+@atexit.register
+def close_mcp_sessions() -> None:
+    """Stop every MCP server started by this process."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+    for session in sessions:
+        session.close()
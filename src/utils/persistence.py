@@ -0,0 +1,280 @@
+import contextvars
+import fcntl
+import json
+import os
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from loguru import logger
+
+# Path -> lock serializing the threads of this process; flock covers other processes.
+_thread_locks: dict = {}
+_thread_locks_guard = threading.Lock()
+# Write batch of the current agent request, see `write_batch`.
+_write_batch: contextvars.ContextVar = contextvars.ContextVar(
+    "write_batch", default=None
+)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename: the new directory entry is only durable once the directory is synced."""
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write_text(path, text: str, mode: Optional[int] = None) -> None:
+    """
+    Replace a file's content so that readers and crashes never see a partial write.
+
+    The text goes to a temporary file in the same directory, which is fsynced and
+    renamed over `path`.
+
+    Args:
+        path: The file to write.
+        text (str): The new content.
+        mode (Optional[int]): Permissions of the file, e.g. 0o600 for secrets. By
+            default an existing file keeps its permissions.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if mode is None:
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+
+    fd, temp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_directory(path.parent)
+
+
+def atomic_write_json(
+    path, data, indent: Optional[int] = None, mode: Optional[int] = None
+) -> None:
+    """
+    Replace a JSON file atomically, see `atomic_write_text`.
+
+    Args:
+        path: The file to write.
+        data: The JSON-serializable document.
+        indent (Optional[int]): Passed to json.dumps.
+        mode (Optional[int]): Permissions of the file.
+    """
+    # Serialize first, so an unserializable document leaves the file untouched.
+    atomic_write_text(path, json.dumps(data, indent=indent), mode)
+
+
+@contextmanager
+def file_lock(path) -> Iterator[None]:
+    """
+    Hold an exclusive advisory lock on a file, across threads and processes.
+
+    The lock is taken on `<path>.lock`: the file itself is replaced on every
+    atomic write, so a lock on it would not outlive the write. Not reentrant.
+
+    Args:
+        path: The file to lock.
+    """
+    lock_path = Path(f"{path}.lock")
+    with _thread_locks_guard:
+        thread_lock = _thread_locks.setdefault(str(lock_path), threading.Lock())
+    with thread_lock:
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _stamp(path: Path) -> Optional[tuple]:
+    """Identify a version of a file; atomic writes always change the inode."""
+    try:
+        stats = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stats.st_ino, stats.st_mtime_ns, stats.st_size
+
+
+def _load(path: Path, default: Callable) -> tuple:
+    """Return (document, stamp) of a JSON file, or a new default document if it is missing."""
+    try:
+        with open(path) as file:
+            stamp = _stamp(path)
+            return json.load(file), stamp
+    except FileNotFoundError:
+        logger.warning(f"File {path} not found, starting a new one")
+        return default(), None
+
+
+class _PendingDocument:
+    """A JSON document changed during a write batch, not written yet."""
+
+    def __init__(self, data, stamp: Optional[tuple], default: Callable, indent):
+        self.data = data
+        self.stamp = stamp
+        self.default = default
+        self.indent = indent
+        self.mutations: list = []
+
+
+class WriteBatch:
+    """
+    Coalesces the JSON updates of one agent request into one write per file.
+
+    Each file is read once; updates are applied to the in-memory document and
+    recorded. On `flush` the file is written once. If another process wrote it
+    in the meantime, the recorded updates are applied again on top of its
+    current content, so neither side's changes are lost.
+    """
+
+    def __init__(self):
+        self._documents: dict = {}
+        self._lock = threading.Lock()
+
+    def _document(self, path: Path, default: Callable, indent) -> _PendingDocument:
+        document = self._documents.get(path)
+        if document is None:
+            with file_lock(path):
+                data, stamp = _load(path, default)
+            document = self._documents[path] = _PendingDocument(
+                data, stamp, default, indent
+            )
+        return document
+
+    def read(self, path: Path, default: Callable):
+        with self._lock:
+            document = self._document(path, default, None)
+            return json.loads(json.dumps(document.data))
+
+    def update(self, path: Path, mutate: Callable, default: Callable, indent):
+        with self._lock:
+            document = self._document(path, default, indent)
+            before = json.dumps(document.data)
+            result = mutate(document.data)
+            if json.dumps(document.data) != before:
+                document.mutations.append(mutate)
+            return result
+
+    def flush(self) -> None:
+        """Write every changed document once."""
+        with self._lock:
+            documents, self._documents = self._documents, {}
+        for path, document in documents.items():
+            if not document.mutations:
+                continue
+            try:
+                with file_lock(path):
+                    data, stamp = _load(path, document.default)
+                    if stamp != document.stamp:
+                        logger.info(f"{path} changed during the request, merging")
+                        for mutate in document.mutations:
+                            mutate(data)
+                    else:
+                        data = document.data
+                    atomic_write_json(path, data, document.indent)
+            except Exception as e:
+                logger.error(f"Could not write {path}: {e}")
+                raise
+
+
+@contextmanager
+def write_batch() -> Iterator[WriteBatch]:
+    """
+    Defer the `update_json` writes made inside the block to its end.
+
+    An agent request opens a batch, so several updates of the same file in one
+    turn (and in the sub-agents it queries) cost one read and one write. Nested
+    batches join the outermost one.
+
+    Yields:
+        WriteBatch: The batch the updates go to.
+    """
+    batch = _write_batch.get()
+    if batch is not None:
+        yield batch
+        return
+    batch = WriteBatch()
+    token = _write_batch.set(batch)
+    try:
+        yield batch
+    finally:
+        _write_batch.reset(token)
+        # Tools already reported their changes as done, so write them even if
+        # the request failed later on.
+        batch.flush()
+
+
+def read_json(path, default: Callable = list) -> Any:
+    """
+    Read a JSON document, including the updates pending in the current write batch.
+
+    Args:
+        path: The file to read.
+        default (Callable): Returns the document to use if the file does not exist.
+
+    Returns:
+        The document.
+    """
+    path = Path(path)
+    batch = _write_batch.get()
+    if batch is not None:
+        return batch.read(path, default)
+    return _load(path, default)[0]
+
+
+def update_json(
+    path, mutate: Callable, default: Callable = list, indent: Optional[int] = None
+) -> Any:
+    """
+    Read, change and atomically rewrite a JSON document while holding its file lock.
+
+    Inside a `write_batch` the write is deferred to the end of the batch.
+
+    Args:
+        path: The file to update.
+        mutate (Callable): Changes the document in place and returns a result;
+            the file is only written if the document changed. Inside a batch it
+            may be called again on a newer version of the document.
+        default (Callable): Returns the document to start from if the file does not exist.
+        indent (Optional[int]): Passed to json.dumps.
+
+    Returns:
+        The result of `mutate`.
+    """
+    path = Path(path)
+    batch = _write_batch.get()
+    if batch is not None:
+        return batch.update(path, mutate, default, indent)
+
+    with file_lock(path):
+        data, _ = _load(path, default)
+        before = json.dumps(data)
+        result = mutate(data)
+        if json.dumps(data) != before:
+            atomic_write_json(path, data, indent)
+    return result
@@ -0,0 +1,218 @@
+import math
+import os
+import re
+import subprocess
+from pathlib import Path
+
+# Files that usually are the best starting point for understanding a project.
+ENTRY_POINT_SCORES = {
+    "main.py": 5.0,
+    "__main__.py": 5.0,
+    "app.py": 4.0,
+    "cli.py": 3.0,
+    "manage.py": 3.0,
+    "server.py": 3.0,
+    "setup.py": 2.0,
+    "wsgi.py": 2.0,
+    "asgi.py": 2.0,
+}
+
+WORD_PATTERN = re.compile(r"\w+|[^\w\s]")
+GIT_ACTIVITY_SINCE = "90.days"
+MAX_SUBDIRECTORIES_SHOWN = 20
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of LLM tokens in a text without a remote tokenizer.
+
+    Words count as one token per four characters and every punctuation mark as one
+    token, which tracks BPE tokenizers closely for code and paths.
+
+    Args:
+        text (str): The text to measure.
+
+    Returns:
+        int: The estimated token count.
+    """
+    return sum(math.ceil(len(word) / 4) for word in WORD_PATTERN.findall(text))
+
+
+def git_activity(folder_path: Path) -> dict:
+    """
+    Count recent commits per file with a single `git log` call.
+
+    Args:
+        folder_path (Path): Folder inside a git work tree.
+
+    Returns:
+        dict: Absolute file path -> number of commits since GIT_ACTIVITY_SINCE.
+            Empty if the folder is not tracked by git or git is unavailable.
+    """
+    try:
+        result = subprocess.run(
+            [
+                "git",
+                "log",
+                f"--since={GIT_ACTIVITY_SINCE}",
+                "--name-only",
+                "--relative",
+                "--pretty=format:",
+            ],
+            cwd=folder_path,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return {}
+    if result.returncode != 0:
+        return {}
+
+    activity = {}
+    for line in result.stdout.splitlines():
+        if line:
+            path = os.path.join(str(folder_path), line)
+            activity[path] = activity.get(path, 0) + 1
+    return activity
+
+
+def rank_files(folder_path: Path, files: list) -> list:
+    """
+    Order files by how useful they are for getting to know the project.
+
+    Entry points, large files, recently changed files and shallow files rank first.
+
+    Args:
+        folder_path (Path): The project folder.
+        files (list): Absolute paths of the project files.
+
+    Returns:
+        list: The same paths, most important first.
+    """
+    activity = git_activity(folder_path)
+    root_depth = str(folder_path).rstrip(os.sep).count(os.sep)
+
+    def score(path: str) -> float:
+        name = os.path.basename(path)
+        depth = path.count(os.sep) - root_depth - 1
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+        return (
+            ENTRY_POINT_SCORES.get(name, 0.0)
+            + (0.5 if name == "__init__.py" and depth <= 1 else 0.0)
+            + math.log2(1 + size / 1024)
+            + 2 * math.log2(1 + activity.get(path, 0))
+            - 0.3 * depth
+        )
+
+    return sorted(files, key=lambda path: (-score(path), path))
+
+
+def _directory_stats(root: str, listing: dict) -> dict:
+    """Return directory -> (total file count, Python file count) including subdirectories."""
+    stats = {}
+
+    def visit(directory: str) -> tuple:
+        directory_names, file_names = listing.get(directory, ([], []))
+        total = len(file_names)
+        python = sum(name.endswith(".py") for name in file_names)
+        for name in directory_names:
+            child_total, child_python = visit(os.path.join(directory, name))
+            total += child_total
+            python += child_python
+        stats[directory] = (total, python)
+        return total, python
+
+    visit(root)
+    return stats
+
+
+def render_collapsed_tree(root: str, listing: dict, max_level: int) -> str:
+    """
+    Render only directories, each annotated with its file counts.
+
+    Args:
+        root (str): The project folder.
+        listing (dict): Directory -> (directory names, file names), as recorded by
+            DirectoryScanner.find_files.
+        max_level (int): Deepest directory level to show.
+
+    Returns:
+        str: The collapsed tree.
+    """
+    stats = _directory_stats(root, listing)
+
+    def label(directory: str) -> str:
+        total, python = stats[directory]
+        return f"{os.path.basename(directory)}/ ({total} files, {python} .py)"
+
+    lines = [label(root)]
+
+    def walk(directory: str, prefix: str, level: int) -> None:
+        children = [
+            os.path.join(directory, name)
+            for name in listing.get(directory, ([], []))[0]
+        ]
+        children.sort(key=lambda child: (-stats[child][0], child))
+        hidden = children[MAX_SUBDIRECTORIES_SHOWN:]
+        children = children[:MAX_SUBDIRECTORIES_SHOWN]
+
+        for position, child in enumerate(children):
+            last = position == len(children) - 1 and not hidden
+            lines.append(f"{prefix}{'└── ' if last else '├── '}{label(child)}")
+            if level < max_level:
+                walk(child, prefix + ("    " if last else "│   "), level + 1)
+        if hidden:
+            hidden_files = sum(stats[child][0] for child in hidden)
+            lines.append(
+                f"{prefix}└── ... {len(hidden)} more directories ({hidden_files} files)"
+            )
+
+    walk(root, "", 1)
+    return "\n".join(lines)
+
+
+def summarize_project(
+    folder_path: Path, files: list, listing: dict, token_budget: int
+) -> tuple:
+    """
+    Build a tree and file list for a project that fit into a token budget.
+
+    The deepest collapsed tree that fits into 40% of the budget is used, and the
+    rest of the budget is filled with the highest-ranked files.
+
+    Args:
+        folder_path (Path): The project folder.
+        files (list): Absolute paths of the project files.
+        listing (dict): Directory listing recorded by DirectoryScanner.find_files.
+        token_budget (int): Maximum estimated tokens for tree and files together.
+
+    Returns:
+        tuple: (tree structure, list of the files that fit into the budget).
+    """
+    root = str(folder_path)
+    tree_budget = int(token_budget * 0.4)
+
+    tree = render_collapsed_tree(root, listing, max_level=1)
+    tree_tokens = estimate_tokens(tree)
+    for level in range(2, 16):
+        deeper = render_collapsed_tree(root, listing, max_level=level)
+        deeper_tokens = estimate_tokens(deeper)
+        if deeper_tokens > tree_budget or deeper == tree:
+            break
+        tree, tree_tokens = deeper, deeper_tokens
+
+    remaining = token_budget - tree_tokens
+    selected = []
+    for path in rank_files(folder_path, files):
+        # Quotes and the separating comma of the JSON list cost about two tokens.
+        cost = estimate_tokens(path) + 2
+        if cost > remaining:
+            break
+        selected.append(path)
+        remaining -= cost
+
+    return tree, selected
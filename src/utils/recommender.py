@@ -0,0 +1,283 @@
+import re
+import sys
+import threading
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.utils.list_store import (
+    ListStore,
+    get_book_store,
+    get_movie_store,
+    normalize_key,
+)
+
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+_TAG_SEPARATORS = re.compile(r"[,/&]")
+_STOP_WORDS = frozenset(
+    "a all an and are as at be but by for from has i in is it its me my not of on or "
+    "so that the this to was very with".split()
+)
+
+
+def _words(text) -> list:
+    return [
+        word
+        for word in _WORD_PATTERN.findall(normalize_key(text))
+        if len(word) > 1 and word not in _STOP_WORDS
+    ]
+
+
+class ContentRecommender:
+    """
+    Ranks the unfinished entries of a list by their similarity to the entries the
+    user rated highly.
+
+    Every entry becomes a TF-IDF vector. Each value of a tag field (genre,
+    author, director, year) is one term, e.g. "author:andy weir" or
+    "year:2010s". Word fields (genre, title, notes) add one term per word. The
+    field weights make a shared author count more than a shared word in the notes.
+
+    The user's taste profile sums the vectors of the finished entries, each
+    weighted by (rating - 5) / 5. Entries rated below 5 push the profile away
+    from them, and unrated entries count a little. Unfinished entries are ranked
+    by cosine similarity to the profile.
+
+    Args:
+        entries (list): (section, entry) pairs, as returned by `ListStore.entries`.
+        candidate_section (str): Section to recommend from, e.g. "to_read".
+        history_section (str): Section with the finished entries, e.g. "read".
+        field_weights (dict): Entry field -> weight of the terms taken from it.
+        tag_fields (tuple): Fields whose values are terms; comma-separated
+            values are several terms.
+        word_fields (tuple): Fields whose words are terms.
+        creator_field (str): Field naming the author or director.
+    """
+
+    def __init__(
+        self,
+        entries: list,
+        candidate_section: str,
+        history_section: str,
+        field_weights: dict,
+        tag_fields: tuple,
+        word_fields: tuple,
+        creator_field: str,
+    ):
+        self.field_weights = field_weights
+        self.tag_fields = tag_fields
+        self.word_fields = word_fields
+        self.creator_field = creator_field
+        self.candidates = [e for section, e in entries if section == candidate_section]
+        self.history = [e for section, e in entries if section == history_section]
+
+        items = self.candidates + self.history
+        self.vocabulary: dict = {}
+        term_weights = [self._terms(entry) for entry in items]
+        for terms in term_weights:
+            for term in terms:
+                self.vocabulary.setdefault(term, len(self.vocabulary))
+        self.terms = list(self.vocabulary)
+
+        matrix = np.zeros((len(items), len(self.vocabulary)))
+        for row, terms in enumerate(term_weights):
+            for term, weight in terms.items():
+                matrix[row, self.vocabulary[term]] = weight
+        # Smoothed IDF: terms shared by every entry still count a little.
+        document_frequency = np.count_nonzero(matrix, axis=0)
+        matrix *= np.log((1 + len(items)) / (1 + document_frequency)) + 1
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms > 0, norms, 1)
+
+        self.candidate_vectors = matrix[: len(self.candidates)]
+        self.history_vectors = matrix[len(self.candidates) :]
+        self.history_weights = np.array(
+            [self._history_weight(entry) for entry in self.history]
+        )
+        self.profile = self.history_weights @ self.history_vectors
+        profile_norm = np.linalg.norm(self.profile)
+        if profile_norm > 0:
+            self.profile /= profile_norm
+
+    def _terms(self, entry: dict) -> dict:
+        """Return term -> weighted count for one entry."""
+        terms: dict = {}
+        for field, weight in self.field_weights.items():
+            value = entry.get(field)
+            if value is None or value == "":
+                continue
+            if field in self.tag_fields:
+                if isinstance(value, int):
+                    # A year becomes its decade.
+                    tags = [f"{value // 10 * 10}s"]
+                else:
+                    tags = _TAG_SEPARATORS.split(str(value))
+                for tag in filter(None, map(normalize_key, tags)):
+                    term = f"{field}:{tag}"
+                    terms[term] = terms.get(term, 0) + weight
+            if field in self.word_fields:
+                for word in _words(value):
+                    terms[word] = terms.get(word, 0) + weight
+        return terms
+
+    @staticmethod
+    def _history_weight(entry: dict) -> float:
+        rating = entry.get("rating")
+        if isinstance(rating, (int, float)):
+            return (rating - 5) / 5
+        return 0.2
+
+    def recommend(self, k: int = 3) -> List[dict]:
+        """
+        Return the k unfinished entries most similar to the user's taste.
+
+        Args:
+            k (int): Number of entries to return.
+
+        Returns:
+            List[dict]: The entries, best first. Each one holds `title`,
+                `creator`, `genre`, the similarity `score`, the finished entry it
+                is most `like` and the terms it `shares` with the taste profile.
+
+        Raises:
+            ValueError: If k is not positive.
+        """
+        if k < 1:
+            raise ValueError("k must be positive")
+        if not self.candidates or not self.profile.any():
+            return []
+        scores = self.candidate_vectors @ self.profile
+        liked = np.flatnonzero(self.history_weights > 0)
+
+        recommendations = []
+        for index in np.argsort(-scores, kind="stable")[:k]:
+            vector = self.candidate_vectors[index]
+            entry = self.candidates[index]
+            contributions = vector * self.profile
+            shared = []
+            for term in np.argsort(-contributions, kind="stable"):
+                if contributions[term] <= 0 or len(shared) == 3:
+                    break
+                # "genre:science fiction" is shown as "science fiction", and
+                # then its words are not repeated.
+                text = self.terms[term].partition(":")[2] or self.terms[term]
+                if not any(text in _words(other) for other in shared):
+                    shared.append(text)
+            like = None
+            if liked.size:
+                # Favour the entries rated highest among the similar ones.
+                similarities = (
+                    self.history_vectors[liked] @ vector
+                ) * self.history_weights[liked]
+                best = liked[int(np.argmax(similarities))]
+                if similarities.max() > 0:
+                    like = self.history[best]
+            recommendations.append(
+                {
+                    "title": entry.get("title"),
+                    "creator": entry.get(self.creator_field),
+                    "genre": entry.get("genre"),
+                    "score": round(float(scores[index]), 3),
+                    "like": like,
+                    "shares": shared,
+                }
+            )
+        return recommendations
+
+
+# Recommender per store, rebuilt when the store's version changes.
+_recommenders: dict = {}
+_recommenders_lock = threading.Lock()
+
+
+def _get_recommender(store: ListStore, **kwargs) -> ContentRecommender:
+    key = str(store.db_path)
+    version = store.version()
+    with _recommenders_lock:
+        cached = _recommenders.get(key)
+        if cached is None or cached[0] != version:
+            recommender = ContentRecommender(store.entries(), **kwargs)
+            _recommenders[key] = cached = (version, recommender)
+        return cached[1]
+
+
+def get_book_recommender() -> ContentRecommender:
+    """
+    Return the recommender of books to read, built from the current reading list.
+
+    Returns:
+        ContentRecommender: Ranks the `to_read` books by the books read.
+    """
+    return _get_recommender(
+        get_book_store(),
+        candidate_section="to_read",
+        history_section="read",
+        field_weights={"genre": 3.0, "author": 3.0, "title": 1.0, "notes": 0.5},
+        tag_fields=("genre", "author"),
+        word_fields=("genre", "title", "notes"),
+        creator_field="author",
+    )
+
+
+def get_movie_recommender() -> ContentRecommender:
+    """
+    Return the recommender of movies and shows to watch, built from the current watchlist.
+
+    Returns:
+        ContentRecommender: Ranks the `to_watch` titles by the titles watched.
+    """
+    return _get_recommender(
+        get_movie_store(),
+        candidate_section="to_watch",
+        history_section="watched",
+        field_weights={
+            "genre": 3.0,
+            "director": 3.0,
+            "year": 1.0,
+            "title": 1.0,
+            "notes": 0.5,
+        },
+        tag_fields=("genre", "director", "year"),
+        word_fields=("genre", "title", "notes"),
+        creator_field="director",
+    )
+
+
+def format_recommendations(
+    header: str, recommendations: List[dict], creator_label: str = "by"
+) -> str:
+    """
+    Render recommendations as a short numbered list.
+
+    Args:
+        header (str): First line.
+        recommendations (List[dict]): As returned by `ContentRecommender.recommend`.
+        creator_label (str): Words before the creator, e.g. "directed by".
+
+    Returns:
+        str: One line per recommendation, with why it was picked.
+    """
+    lines = [header]
+    for rank, item in enumerate(recommendations, start=1):
+        line = f"{rank}. {item['title']}"
+        if item["creator"]:
+            line += f" {creator_label} {item['creator']}"
+        if item["genre"]:
+            line += f" ({item['genre']})"
+        line += f", score {item['score']}"
+        like = item["like"]
+        if like:
+            rating = like.get("rating")
+            line += f"; like {like.get('title')}" + (
+                f" ({rating}/10)" if rating is not None else ""
+            )
+        if item["shares"]:
+            line += f"; shares {', '.join(item['shares'])}"
+        lines.append(line)
+    if not recommendations:
+        lines.append(
+            "Nothing to recommend: the list has no rated history or no candidates."
+        )
+    return "\n".join(lines)
@@ -0,0 +1,212 @@
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Optional
+
+from loguru import logger
+
+MAX_RESPONSE_CACHE_ENTRIES = 256
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def normalize_question(question: str) -> str:
+    """
+    Normalize a question for use as a cache key.
+
+    Case, punctuation and whitespace are ignored, so "What's on my calendar today?"
+    and "what's on my  calendar today" map to the same key.
+
+    Args:
+        question (str): The question as asked.
+
+    Returns:
+        str: The lowercased words of the question, separated by single spaces.
+    """
+    return " ".join(_WORD_PATTERN.findall(question.lower()))
+
+
+def data_fingerprint(paths: list) -> tuple:
+    """
+    Describe the current state of the files an answer was based on.
+
+    Args:
+        paths (list): Paths of the data files.
+
+    Returns:
+        tuple: (path, mtime_ns, size) per file; missing files are recorded as
+            (path, None, None), so creating them changes the fingerprint too.
+    """
+    fingerprint = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            fingerprint.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            fingerprint.append((str(path), None, None))
+    return tuple(fingerprint)
+
+
+def _cosine_similarity(left: Counter, right: Counter) -> float:
+    dot = sum(count * right[word] for word, count in left.items())
+    if not dot:
+        return 0.0
+    norm = math.sqrt(sum(c * c for c in left.values())) * math.sqrt(
+        sum(c * c for c in right.values())
+    )
+    return dot / norm
+
+
+class ResponseCache:
+    """
+    An in-memory LRU cache of agent answers with a per-entry TTL.
+
+    Entries are keyed on the agent name, the normalized question and a
+    fingerprint of the data the answer was based on, so an answer is never
+    served after its data changed. With a `similarity_threshold`, a question
+    without an exact match may also be answered by a cached question of the
+    same agent and fingerprint whose word-count vectors have at least that
+    cosine similarity.
+
+    Args:
+        max_entries: Number of answers kept before the least recently used are dropped.
+        similarity_threshold: Minimum similarity for a near match, or None for
+            exact matches only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = MAX_RESPONSE_CACHE_ENTRIES,
+        similarity_threshold: Optional[float] = None,
+    ):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        # (agent name, normalized question, fingerprint) -> (expires at, words, response)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, agent_name: str, question: str, fingerprint: tuple = ()):
+        """
+        Return the cached answer to a question, if there is a fresh one.
+
+        Args:
+            agent_name (str): Name of the agent that is asked.
+            question (str): The question as asked.
+            fingerprint (tuple): The current state of the agent's data sources.
+
+        Returns:
+            The cached response, or None.
+        """
+        normalized = normalize_question(question)
+        key = (agent_name, normalized, fingerprint)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                entry = None
+            if entry is None and self.similarity_threshold is not None:
+                key, entry = self._closest_entry(
+                    agent_name, Counter(normalized.split()), fingerprint, now
+                )
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        logger.info(f"Answering {agent_name} from the response cache: {question!r}")
+        return entry[2]
+
+    def _closest_entry(
+        self, agent_name: str, words: Counter, fingerprint: tuple, now: float
+    ) -> tuple:
+        best_key, best_entry, best_similarity = None, None, 0.0
+        for key, entry in self._entries.items():
+            if key[0] != agent_name or key[2] != fingerprint or entry[0] <= now:
+                continue
+            similarity = _cosine_similarity(words, entry[1])
+            if similarity > best_similarity:
+                best_key, best_entry, best_similarity = key, entry, similarity
+        if best_similarity < self.similarity_threshold:
+            return None, None
+        return best_key, best_entry
+
+    def put(
+        self,
+        agent_name: str,
+        question: str,
+        response,
+        ttl: float,
+        fingerprint: tuple = (),
+    ) -> None:
+        """
+        Store an answer.
+
+        Args:
+            agent_name (str): Name of the agent that answered.
+            question (str): The question as asked.
+            response: The answer to store.
+            ttl (float): Seconds during which the answer may be served.
+            fingerprint (tuple): The state of the agent's data sources before it answered.
+        """
+        normalized = normalize_question(question)
+        key = (agent_name, normalized, fingerprint)
+        entry = (time.monotonic() + ttl, Counter(normalized.split()), response)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, agent_name: Optional[str] = None) -> None:
+        """
+        Drop cached answers, e.g. after a tool changed data the fingerprint does not cover.
+
+        Args:
+            agent_name (Optional[str]): Only drop the answers of this agent. If None,
+                drop everything.
+        """
+        with self._lock:
+            if agent_name is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == agent_name]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache(
+    max_entries: int = MAX_RESPONSE_CACHE_ENTRIES,
+    similarity_threshold: Optional[float] = None,
+) -> ResponseCache:
+    """
+    Return the process-wide response cache, creating it on first use.
+
+    The settings of an existing cache are updated to the given values, so
+    configuration changes apply without losing the cached answers.
+
+    Args:
+        max_entries (int): See `ResponseCache`.
+        similarity_threshold (Optional[float]): See `ResponseCache`.
+
+    Returns:
+        ResponseCache: The shared cache.
+    """
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(max_entries, similarity_threshold)
+        _response_cache.max_entries = max_entries
+        _response_cache.similarity_threshold = similarity_threshold
+        return _response_cache
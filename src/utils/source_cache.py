@@ -0,0 +1,242 @@
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.constants.directories import CACHE_DIR, SOURCE_CACHE_MAX_BYTES
+
+
+def notebook_to_text(content: bytes) -> str:
+    """
+    Extract the code and markdown cells of a Jupyter notebook, dropping all outputs.
+
+    Cells are written in the percent format (`# %%` / `# %% [markdown]`), so the
+    result reads like a Python script and keeps the original cell order.
+
+    Args:
+        content (bytes): The raw .ipynb file.
+
+    Returns:
+        str: The cell sources.
+
+    Raises:
+        ValueError: If the content is not a valid notebook.
+    """
+    notebook = json.loads(content)
+    if not isinstance(notebook, dict):
+        raise ValueError("notebook is not a JSON object")
+
+    # nbformat 4 keeps the cells at the top level, nbformat 3 inside worksheets.
+    cells = notebook.get("cells")
+    if cells is None:
+        cells = [
+            cell
+            for worksheet in notebook.get("worksheets", [])
+            for cell in worksheet.get("cells", [])
+        ]
+
+    blocks = []
+    for cell in cells:
+        cell_type = cell.get("cell_type")
+        source = cell.get("source", cell.get("input", ""))
+        if isinstance(source, list):
+            source = "".join(source)
+        source = source.rstrip()
+        if cell_type == "code":
+            blocks.append(f"# %%\n{source}" if source else "# %%")
+        elif cell_type == "markdown" and source:
+            commented = "\n".join(
+                f"# {line}" if line else "#" for line in source.splitlines()
+            )
+            blocks.append(f"# %% [markdown]\n{commented}")
+    return "\n\n".join(blocks) + "\n"
+
+
+def extract_text(path: str, content: bytes) -> str:
+    """
+    Return the text of a source file as it should be shown to an agent.
+
+    Args:
+        path (str): The file path, used to detect notebooks.
+        content (bytes): The raw file content.
+
+    Returns:
+        str: Stripped notebook cells for .ipynb files, the decoded text otherwise.
+    """
+    if path.endswith(".ipynb"):
+        return notebook_to_text(content)
+    return content.decode("utf-8", errors="replace")
+
+
+class SourceCache:
+    """
+    A content-addressed on-disk cache of stripped source texts.
+
+    Texts are stored as `<cache_dir>/<sha1[:2]>/<sha1>.txt`, so identical files
+    share one entry and an entry never goes stale. A SQLite table remembers the
+    size, mtime and hash of every file served, so an unchanged file is answered
+    without reading it again. When the stored texts exceed `max_bytes`, the least
+    recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = SOURCE_CACHE_MAX_BYTES,
+    ):
+        self.cache_dir = Path(cache_dir or CACHE_DIR / "sources")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            self.cache_dir / "sources.sqlite3", check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha1 TEXT NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS entries (
+                sha1 TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS entries_last_access ON entries(last_access);
+            """
+        )
+        self.connection.commit()
+
+    def _entry_path(self, sha1: str) -> Path:
+        return self.cache_dir / sha1[:2] / f"{sha1}.txt"
+
+    def read(self, path: str) -> str:
+        """
+        Return the stripped text of a file, from the cache when possible.
+
+        Args:
+            path (str): Absolute path of the file.
+
+        Returns:
+            str: See `extract_text`.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If a notebook is not valid JSON.
+        """
+        path = str(path)
+        stat = os.stat(path)
+
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT sha1 FROM files WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (path, stat.st_size, stat.st_mtime_ns),
+            ).fetchone()
+        if row:
+            text = self._load(row[0])
+            if text is not None:
+                return text
+
+        with open(path, "rb") as file:
+            content = file.read()
+        sha1 = hashlib.sha1(content).hexdigest()
+
+        text = self._load(sha1)
+        if text is None:
+            text = extract_text(path, content)
+            self._store(sha1, text)
+
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, sha1) VALUES (?, ?, ?, ?)",
+                (path, stat.st_size, stat.st_mtime_ns, sha1),
+            )
+            self.connection.commit()
+        return text
+
+    def _load(self, sha1: str) -> Optional[str]:
+        """Read a cached text and mark it as recently used, or return None if it was evicted."""
+        try:
+            text = self._entry_path(sha1).read_text(encoding="utf-8")
+        except OSError:
+            return None
+        with self._lock:
+            self.connection.execute(
+                "UPDATE entries SET last_access = ? WHERE sha1 = ?", (time.time(), sha1)
+            )
+            self.connection.commit()
+        return text
+
+    def _store(self, sha1: str, text: str) -> None:
+        entry_path = self._entry_path(sha1)
+        entry_path.parent.mkdir(exist_ok=True)
+        data = text.encode("utf-8")
+        # Write to a temporary file first so a concurrent reader never sees half an entry.
+        temporary_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        temporary_path.write_bytes(data)
+        os.replace(temporary_path, entry_path)
+
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO entries (sha1, size, last_access) VALUES (?, ?, ?)",
+                (sha1, len(data), time.time()),
+            )
+            self._evict()
+            self.connection.commit()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits into `max_bytes`."""
+        total = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = []
+        for sha1, size in self.connection.execute(
+            "SELECT sha1, size FROM entries ORDER BY last_access"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._entry_path(sha1).unlink(missing_ok=True)
+            evicted.append((sha1,))
+            total -= size
+
+        self.connection.executemany("DELETE FROM entries WHERE sha1 = ?", evicted)
+        self.connection.executemany("DELETE FROM files WHERE sha1 = ?", evicted)
+        logger.info(f"Evicted {len(evicted)} entries from the source cache")
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self.connection.close()
+
+
+_source_cache: Optional[SourceCache] = None
+_source_cache_lock = threading.Lock()
+
+
+def get_source_cache() -> SourceCache:
+    """
+    Return the process-wide source cache, creating it on first use.
+
+    Returns:
+        SourceCache: The shared cache in CACHE_DIR/sources.
+    """
+    global _source_cache
+    with _source_cache_lock:
+        if _source_cache is None:
+            _source_cache = SourceCache()
+        return _source_cache
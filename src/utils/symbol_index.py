@@ -0,0 +1,360 @@
+import ast
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.constants.directories import CACHE_DIR
+
+# Only the first lines of a docstring are stored; the full text is one file_read away.
+DOCSTRING_MAX_LINES = 3
+
+
+def default_symbol_index_path(project_dir: Path) -> Path:
+    """
+    Return the location of the on-disk symbol index for a project.
+
+    Args:
+        project_dir (Path): The project folder that is being indexed.
+
+    Returns:
+        Path: Path to the SQLite file inside the Charon cache directory.
+    """
+    digest = hashlib.sha1(str(Path(project_dir).resolve()).encode()).hexdigest()[:16]
+    return CACHE_DIR / "symbol_index" / f"{digest}.sqlite3"
+
+
+def _short_docstring(node: ast.AST) -> str:
+    docstring = ast.get_docstring(node) or ""
+    return "\n".join(docstring.strip().splitlines()[:DOCSTRING_MAX_LINES])
+
+
+def _signature(node: ast.AST) -> str:
+    """Render the signature of a function or the bases of a class as source text."""
+    if isinstance(node, ast.ClassDef):
+        bases = [ast.unparse(base) for base in node.bases]
+        bases += [ast.unparse(keyword) for keyword in node.keywords]
+        return (
+            f"class {node.name}({', '.join(bases)})" if bases else f"class {node.name}"
+        )
+
+    prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+    returns = f" -> {ast.unparse(node.returns)}" if node.returns else ""
+    return f"{prefix} {node.name}({ast.unparse(node.args)}){returns}"
+
+
+def extract_symbols(source: str, module_name: str) -> list:
+    """
+    Extract the module, classes and functions defined in a Python source file.
+
+    Args:
+        source (str): The source code.
+        module_name (str): Name used for the module symbol and as qualified name prefix.
+
+    Returns:
+        list: (qualified_name, name, kind, signature, docstring, start_line, end_line)
+            tuples; kind is one of "module", "class", "function" and "method".
+
+    Raises:
+        SyntaxError: If the source cannot be parsed.
+    """
+    tree = ast.parse(source)
+    line_count = source.count("\n") + 1
+    symbols = [
+        (
+            module_name,
+            module_name,
+            "module",
+            "",
+            _short_docstring(tree),
+            1,
+            line_count,
+        )
+    ]
+
+    def visit(node: ast.AST, prefix: str, in_class: bool) -> None:
+        for child in ast.iter_child_nodes(node):
+            if not isinstance(
+                child, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+            ):
+                continue
+            is_class = isinstance(child, ast.ClassDef)
+            kind = "class" if is_class else "method" if in_class else "function"
+            qualified_name = f"{prefix}.{child.name}"
+            # Decorators belong to the definition when reading its source.
+            start_line = min(
+                [child.lineno]
+                + [decorator.lineno for decorator in child.decorator_list]
+            )
+            symbols.append(
+                (
+                    qualified_name,
+                    child.name,
+                    kind,
+                    _signature(child),
+                    _short_docstring(child),
+                    start_line,
+                    child.end_lineno or child.lineno,
+                )
+            )
+            # Nested functions are implementation details; classes and their methods are not.
+            if is_class:
+                visit(child, qualified_name, in_class=True)
+
+    visit(tree, module_name, in_class=False)
+    return symbols
+
+
+class SymbolIndex:
+    """
+    A persistent SQLite index of the symbols defined in the Python files of a project.
+
+    Every file is stored with its size, mtime and content hash. On refresh, files
+    whose size and mtime are unchanged are skipped without being read, and files
+    that were only touched (same hash) are not parsed again.
+    """
+
+    def __init__(self, project_dir: Path, index_path: Optional[Path] = None):
+        self.project_dir = str(Path(project_dir))
+        self.index_path = Path(index_path or default_symbol_index_path(project_dir))
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(self.index_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha1 TEXT NOT NULL,
+                error TEXT
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS symbols (
+                path TEXT NOT NULL,
+                qualified_name TEXT NOT NULL,
+                name TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                signature TEXT NOT NULL,
+                docstring TEXT NOT NULL,
+                start_line INTEGER NOT NULL,
+                end_line INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS symbols_path ON symbols(path);
+            CREATE INDEX IF NOT EXISTS symbols_name ON symbols(name COLLATE NOCASE);
+            """
+        )
+        self.connection.commit()
+
+    def module_name(self, file_path: str) -> str:
+        """
+        Return the dotted module name of a file relative to the project folder.
+
+        Args:
+            file_path (str): Absolute path of a Python file inside the project.
+
+        Returns:
+            str: e.g. `src.utils.config_loader` for `<project>/src/utils/config_loader.py`.
+        """
+        relative = os.path.relpath(file_path, self.project_dir)
+        module = os.path.splitext(relative)[0].replace(os.sep, ".")
+        return module.removesuffix(".__init__")
+
+    def refresh(self, files: list) -> int:
+        """
+        Bring the index up to date with the given files.
+
+        Files missing from the list are dropped from the index.
+
+        Args:
+            files (list): Absolute paths of all Python files in the project.
+
+        Returns:
+            int: Number of files that were parsed again.
+        """
+        with self._lock:
+            stored = {
+                path: (size, mtime_ns, sha1)
+                for path, size, mtime_ns, sha1 in self.connection.execute(
+                    "SELECT path, size, mtime_ns, sha1 FROM files"
+                )
+            }
+
+            parsed = 0
+            for path in files:
+                path = str(path)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                previous = stored.pop(path, None)
+                if previous and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                    continue
+
+                try:
+                    with open(path, "rb") as file:
+                        content = file.read()
+                except OSError:
+                    continue
+                sha1 = hashlib.sha1(content).hexdigest()
+                if previous and previous[2] == sha1:
+                    self.connection.execute(
+                        "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?",
+                        (stat.st_size, stat.st_mtime_ns, path),
+                    )
+                    continue
+
+                self._index_file(path, content, stat.st_size, stat.st_mtime_ns, sha1)
+                parsed += 1
+
+            for path in stored:
+                self._delete_file(path)
+
+            self.connection.commit()
+
+        if parsed:
+            logger.info(f"Indexed symbols of {parsed} files in {self.project_dir}")
+        return parsed
+
+    def _index_file(
+        self, path: str, content: bytes, size: int, mtime_ns: int, sha1: str
+    ) -> None:
+        self._delete_file(path)
+        error = None
+        try:
+            symbols = extract_symbols(
+                content.decode("utf-8", errors="replace"), self.module_name(path)
+            )
+        except (SyntaxError, ValueError, RecursionError) as e:
+            # Keep the file row so an unparsable file is not read again until it changes.
+            logger.warning(f"Could not parse {path}: {e}")
+            symbols = []
+            error = str(e)
+
+        self.connection.execute(
+            "INSERT INTO files (path, size, mtime_ns, sha1, error) VALUES (?, ?, ?, ?, ?)",
+            (path, size, mtime_ns, sha1, error),
+        )
+        self.connection.executemany(
+            "INSERT INTO symbols (path, qualified_name, name, kind, signature, docstring, "
+            "start_line, end_line) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(path, *symbol) for symbol in symbols],
+        )
+
+    def _delete_file(self, path: str) -> None:
+        self.connection.execute("DELETE FROM files WHERE path = ?", (path,))
+        self.connection.execute("DELETE FROM symbols WHERE path = ?", (path,))
+
+    def search(self, query: str, kind: Optional[str] = None, limit: int = 20) -> list:
+        """
+        Find symbols by name.
+
+        Exact name matches rank first, then prefix matches, then names or qualified
+        names containing the query; ties are broken by shorter qualified name.
+        Matching is case-insensitive, and a dotted query (`Scanner.find_files`) is
+        matched against the qualified name.
+
+        Args:
+            query (str): Symbol name or part of it.
+            kind (Optional[str]): Restrict to "module", "class", "function" or "method".
+            limit (int): Maximum number of results.
+
+        Returns:
+            list: Symbol rows as dicts, best match first.
+        """
+        query = query.strip()
+        if not query:
+            return []
+        pattern = query.lower().replace("\\", "\\\\")
+        pattern = pattern.replace("%", "\\%").replace("_", "\\_")
+        sql = (
+            "SELECT path, qualified_name, name, kind, signature, docstring, start_line, end_line, "
+            "CASE WHEN lower(name) = :query OR lower(qualified_name) = :query "
+            "OR lower(qualified_name) LIKE :suffix ESCAPE '\\' THEN 0 "
+            "WHEN lower(name) LIKE :prefix ESCAPE '\\' THEN 1 ELSE 2 END AS rank "
+            "FROM symbols WHERE (lower(name) LIKE :contains ESCAPE '\\' "
+            "OR lower(qualified_name) LIKE :contains ESCAPE '\\')"
+        )
+        parameters = {
+            "query": query.lower(),
+            "suffix": f"%.{pattern}",
+            "prefix": f"{pattern}%",
+            "contains": f"%{pattern}%",
+            "limit": limit,
+        }
+        if kind:
+            sql += " AND kind = :kind"
+            parameters["kind"] = kind
+        sql += " ORDER BY rank, length(qualified_name), qualified_name LIMIT :limit"
+
+        with self._lock:
+            rows = self.connection.execute(sql, parameters).fetchall()
+        return [self._as_dict(row) for row in rows]
+
+    def outline(self, file_path: str) -> list:
+        """
+        Return every indexed symbol of a file in source order.
+
+        Args:
+            file_path (str): Absolute path of the file.
+
+        Returns:
+            list: Symbol rows as dicts.
+        """
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT path, qualified_name, name, kind, signature, docstring, start_line, "
+                "end_line, 0 FROM symbols WHERE path = ? ORDER BY start_line, kind != 'module'",
+                (str(file_path),),
+            ).fetchall()
+        return [self._as_dict(row) for row in rows]
+
+    @staticmethod
+    def _as_dict(row: tuple) -> dict:
+        keys = (
+            "file_path",
+            "qualified_name",
+            "name",
+            "kind",
+            "signature",
+            "docstring",
+            "start_line",
+            "end_line",
+        )
+        return dict(zip(keys, row[:8]))
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self.connection.close()
+
+
+_symbol_indexes: dict = {}
+_symbol_indexes_lock = threading.Lock()
+
+
+def get_symbol_index(project_dir: Path) -> SymbolIndex:
+    """
+    Return the process-wide symbol index of a project, opening it on first use.
+
+    Args:
+        project_dir (Path): The project folder.
+
+    Returns:
+        SymbolIndex: The (not yet refreshed) index.
+    """
+    key = str(Path(project_dir))
+    with _symbol_indexes_lock:
+        if key not in _symbol_indexes:
+            _symbol_indexes[key] = SymbolIndex(project_dir)
+        return _symbol_indexes[key]
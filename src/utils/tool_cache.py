@@ -0,0 +1,297 @@
+import contextvars
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from loguru import logger
+
+MAX_PROCESS_CACHE_ENTRIES = 1024
+
+# Cache of the request that is currently being answered, set by `request_scope`.
+# Tools run in tasks and worker threads that copy the context, and sub-agents are
+# queried on the same event loop, so the whole orchestrator -> sub-agent chain of
+# one request shares it.
+_request_cache: contextvars.ContextVar = contextvars.ContextVar(
+    "request_tool_cache", default=None
+)
+
+
+class ToolResultCache:
+    """
+    A thread-safe LRU cache of tool results with a per-entry TTL.
+
+    Every entry remembers the resources its tool reads, so a write tool can drop
+    exactly the results it made stale.
+    """
+
+    def __init__(self, max_entries: int = MAX_PROCESS_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        # (tool name, arguments) -> (expires at, resources, result)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> tuple:
+        """
+        Look up a result.
+
+        Args:
+            key (tuple): The (tool name, arguments) key.
+
+        Returns:
+            tuple: (True, result) for a fresh entry, (False, None) otherwise.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, entry[2]
+
+    def put(self, key: tuple, result, ttl: float, resources: frozenset) -> None:
+        """
+        Store a result.
+
+        Args:
+            key (tuple): The (tool name, arguments) key.
+            result: The value returned by the tool.
+            ttl (float): Seconds during which the result may be reused.
+            resources (frozenset): Names of the resources the tool read.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, resources, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, resources: Optional[frozenset] = None) -> None:
+        """
+        Drop the results that depend on any of the given resources.
+
+        Args:
+            resources (Optional[frozenset]): Resource names. If None, drop everything.
+        """
+        with self._lock:
+            if resources is None:
+                self._entries.clear()
+                return
+            stale = [
+                key
+                for key, (_, entry_resources, _) in self._entries.items()
+                if entry_resources & resources
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_process_cache = ToolResultCache()
+
+
+def get_process_tool_cache() -> ToolResultCache:
+    """
+    Return the cache of results shared by all requests of this process.
+
+    Returns:
+        ToolResultCache: The process-wide cache.
+    """
+    return _process_cache
+
+
+@contextmanager
+def request_scope() -> Iterator[ToolResultCache]:
+    """
+    Give the code inside the `with` block a request-scoped tool cache.
+
+    Nested scopes reuse the outer cache, so sub-agents share the results of the
+    request they were queried for.
+
+    Yields:
+        ToolResultCache: The cache of the current request.
+    """
+    cache = _request_cache.get()
+    if cache is not None:
+        yield cache
+        return
+    cache = ToolResultCache()
+    token = _request_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _request_cache.reset(token)
+
+
+def is_not_error(result) -> bool:
+    """
+    Tell whether a tool result is worth caching.
+
+    The tools report failures as text starting with "Error", either directly or
+    as the only element of a list.
+
+    Args:
+        result: The value returned by a tool.
+
+    Returns:
+        bool: False for error messages, True otherwise.
+    """
+    if isinstance(result, list) and len(result) == 1:
+        result = result[0]
+    return not (isinstance(result, str) and result.startswith("Error"))
+
+
+def is_found(result) -> bool:
+    """
+    Tell whether a search tool result holds matches.
+
+    The search tools report matches as text starting with "Found matches:";
+    "not found" answers and errors are left out, so the next call asks again.
+
+    Args:
+        result: The value returned by a search tool.
+
+    Returns:
+        bool: True for matches, False otherwise.
+    """
+    return isinstance(result, str) and result.startswith("Found matches:")
+
+
+def _arguments_key(signature: inspect.Signature, args: tuple, kwargs: dict) -> str:
+    """Serialize call arguments, so calls that only differ in spelling share a key."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return json.dumps(bound.arguments, sort_keys=True, default=repr)
+
+
+def memoize(
+    ttl: float,
+    scope: str = "process",
+    resources: tuple = (),
+    cache_if: Callable = is_not_error,
+) -> Callable:
+    """
+    Cache the results of a tool function. Apply it below `@tool`.
+
+    Results are keyed on the function and its arguments (after defaults are
+    applied). Cached results are returned as-is, so they must not be mutated by
+    callers.
+
+    Args:
+        ttl (float): Seconds during which a result is reused.
+        scope (str): "process" to share results across requests, "request" to
+            only reuse them within the current `request_scope`. Outside of a
+            request scope, request-scoped tools are not cached.
+        resources (tuple): Names of the data the tool reads; see `invalidates`.
+        cache_if (Callable): Predicate deciding whether a result is stored.
+
+    Returns:
+        Callable: The decorator.
+    """
+    if scope not in ("process", "request"):
+        raise ValueError(f"Unknown tool cache scope: {scope}")
+    resources = frozenset(resources)
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        def lookup(args, kwargs) -> tuple:
+            cache = _process_cache if scope == "process" else _request_cache.get()
+            if cache is None:
+                return None, None, False, None
+            key = (name, _arguments_key(signature, args, kwargs))
+            found, result = cache.get(key)
+            if found:
+                logger.debug(f"Reusing the cached result of {func.__name__}")
+            return cache, key, found, result
+
+        def store(cache, key, result) -> None:
+            if cache is not None and cache_if(result):
+                cache.put(key, result, ttl, resources)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache, key, found, result = lookup(args, kwargs)
+                if found:
+                    return result
+                result = await func(*args, **kwargs)
+                store(cache, key, result)
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache, key, found, result = lookup(args, kwargs)
+            if found:
+                return result
+            result = func(*args, **kwargs)
+            store(cache, key, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_resources(*resources: str) -> None:
+    """
+    Drop every cached result that depends on one of the given resources.
+
+    Args:
+        *resources (str): Resource names, as passed to `memoize`.
+    """
+    resources = frozenset(resources)
+    _process_cache.invalidate(resources)
+    request_cache = _request_cache.get()
+    if request_cache is not None:
+        request_cache.invalidate(resources)
+
+
+def invalidates(*resources: str) -> Callable:
+    """
+    Mark a tool function as changing the given resources. Apply it below `@tool`.
+
+    After every call, successful or not, the cached results of the tools
+    reading those resources are dropped from the process cache and from the
+    cache of the current request.
+
+    Args:
+        *resources (str): Resource names, as passed to `memoize`.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    invalidate_resources(*resources)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                invalidate_resources(*resources)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,328 @@
+import json
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+from loguru import logger
+from opentelemetry import context, trace
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.trace import Span, SpanKind, Status, StatusCode
+
+MAX_QUESTION_ATTRIBUTE_LENGTH = 200
+
+_tracer = trace.get_tracer("charon")
+_setup_lock = threading.Lock()
+_telemetry = None
+
+
+def tracing_enabled() -> bool:
+    """Return whether `setup_tracing` installed an exporter in this process."""
+    return _telemetry is not None
+
+
+def setup_tracing(tracing_config) -> None:
+    """
+    Install the OpenTelemetry tracer provider and exporter, once per process.
+
+    strands already records spans for agent invocations, event loop cycles,
+    model calls (with token usage) and tool calls. On top of that this
+    instruments outgoing HTTP requests made with `requests` and `httplib2`
+    (used by the Google API client).
+
+    Args:
+        tracing_config (TracingConfig): The `tracing` section of the project config.
+            Nothing happens if it is disabled.
+    """
+    global _telemetry
+    if not tracing_config.enabled or _telemetry is not None:
+        return
+
+    with _setup_lock:
+        if _telemetry is not None:
+            return
+        from strands.telemetry import StrandsTelemetry
+
+        telemetry = StrandsTelemetry()
+        if tracing_config.exporter == "console":
+            telemetry.setup_console_exporter()
+        elif tracing_config.exporter == "otlp":
+            try:
+                telemetry.setup_otlp_exporter()
+            except ImportError as e:
+                logger.error(f"OTLP export needs opentelemetry-exporter-otlp: {e}")
+        else:
+            path = Path(tracing_config.trace_file)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            exporter = ConsoleSpanExporter(
+                out=open(path, "a", buffering=1),
+                formatter=lambda span: span.to_json(indent=None) + "\n",
+            )
+            telemetry.tracer_provider.add_span_processor(BatchSpanProcessor(exporter))
+            logger.info(f"Writing traces to {path}")
+
+        instrument_requests()
+        instrument_httplib2()
+        _telemetry = telemetry
+
+
+def start_query_span(agent_name: str, question: str) -> Span:
+    """
+    Start the span of one agent query. The caller makes it current and ends it.
+
+    Args:
+        agent_name (str): Class name of the agent.
+        question (str): The question asked.
+
+    Returns:
+        Span: The started span, a child of the current span.
+    """
+    return _tracer.start_span(
+        f"charon.query {agent_name}",
+        attributes={
+            "charon.agent": agent_name,
+            "charon.question": question[:MAX_QUESTION_ATTRIBUTE_LENGTH],
+        },
+    )
+
+
+class ToolSpanHooks:
+    """
+    Make a span current while each tool call runs.
+
+    strands records a span per tool call but does not make it current, so work
+    done inside a tool (sub-agent queries, HTTP requests) would attach to the
+    agent span. These spans give that work the tool call as its parent.
+
+    Implements the strands `HookProvider` protocol; strands is only imported
+    once an agent registers the hooks, so importing this module stays cheap.
+    """
+
+    def __init__(self, agent_name: str):
+        self.agent_name = agent_name
+        # tool use ID -> (span, context token)
+        self._spans: dict = {}
+
+    def register_hooks(self, registry, **kwargs) -> None:
+        from strands.experimental.hooks import (
+            AfterToolInvocationEvent,
+            BeforeToolInvocationEvent,
+        )
+
+        registry.add_callback(BeforeToolInvocationEvent, self._start)
+        registry.add_callback(AfterToolInvocationEvent, self._end)
+
+    def _start(self, event) -> None:
+        name = event.tool_use["name"]
+        span = _tracer.start_span(
+            f"charon.tool {name}",
+            attributes={
+                "charon.agent": self.agent_name,
+                "gen_ai.tool.name": name,
+                "gen_ai.tool.call.id": event.tool_use["toolUseId"],
+            },
+        )
+        # Both hooks run in the task of the tool call, and sync tools run in a
+        # thread that copies its context, so the span is current for the tool.
+        token = context.attach(trace.set_span_in_context(span))
+        self._spans[event.tool_use["toolUseId"]] = (span, token)
+
+    def _end(self, event) -> None:
+        span, token = self._spans.pop(event.tool_use["toolUseId"], (None, None))
+        if span is None:
+            return
+        context.detach(token)
+        status = event.result.get("status")
+        span.set_attribute("charon.tool.status", status)
+        if event.exception is not None:
+            span.record_exception(event.exception)
+        if status == "error":
+            span.set_status(Status(StatusCode.ERROR))
+        span.end()
+
+
+def instrument_model(model):
+    """
+    Record the time to first token on the model call spans of strands.
+
+    The model's `stream` method is replaced on the instance; strands iterates it
+    while its model call span is current.
+
+    Args:
+        model: A strands Model.
+
+    Returns:
+        The same model.
+    """
+    if getattr(model, "_charon_traced", False):
+        return model
+    stream = model.stream
+
+    async def traced_stream(*args, **kwargs):
+        span = trace.get_current_span()
+        started_at = time.perf_counter()
+        waiting = True
+        async for event in stream(*args, **kwargs):
+            if waiting and "contentBlockDelta" in event:
+                span.set_attribute(
+                    "gen_ai.server.time_to_first_token",
+                    time.perf_counter() - started_at,
+                )
+                waiting = False
+            yield event
+
+    model.stream = traced_stream
+    model._charon_traced = True
+    return model
+
+
+def _url_attributes(method: str, url: str) -> dict:
+    # The query string may contain API keys (e.g. OMDB), so it is not recorded.
+    parts = urlsplit(url)
+    return {
+        "http.request.method": method,
+        "server.address": parts.hostname or "",
+        "url.full": f"{parts.scheme}://{parts.netloc}{parts.path}",
+    }
+
+
+def instrument_requests() -> None:
+    """Record a client span for every request sent with the `requests` library."""
+    import requests
+
+    if getattr(requests.Session.send, "_charon_traced", False):
+        return
+    send = requests.Session.send
+
+    def traced_send(self, request, **kwargs):
+        with _tracer.start_as_current_span(
+            f"HTTP {request.method}",
+            kind=SpanKind.CLIENT,
+            attributes=_url_attributes(request.method, request.url),
+        ) as span:
+            response = send(self, request, **kwargs)
+            span.set_attribute("http.response.status_code", response.status_code)
+            if response.status_code >= 400:
+                span.set_status(Status(StatusCode.ERROR))
+            return response
+
+    traced_send._charon_traced = True
+    requests.Session.send = traced_send
+
+
+def instrument_httplib2() -> None:
+    """Record a client span for every request sent with `httplib2`, if it is installed."""
+    try:
+        import httplib2
+    except ImportError:
+        return
+
+    if getattr(httplib2.Http.request, "_charon_traced", False):
+        return
+    request = httplib2.Http.request
+
+    def traced_request(self, uri, method="GET", *args, **kwargs):
+        with _tracer.start_as_current_span(
+            f"HTTP {method}",
+            kind=SpanKind.CLIENT,
+            attributes=_url_attributes(method, uri),
+        ) as span:
+            response, content = request(self, uri, method, *args, **kwargs)
+            span.set_attribute("http.response.status_code", response.status)
+            if response.status >= 400:
+                span.set_status(Status(StatusCode.ERROR))
+            return response, content
+
+    traced_request._charon_traced = True
+    httplib2.Http.request = traced_request
+
+
+def load_spans(trace_file: str) -> list:
+    """
+    Read the spans written by the file exporter.
+
+    Args:
+        trace_file (str): Path of the JSON lines trace file.
+
+    Returns:
+        list: One dict per span, as produced by `ReadableSpan.to_json`.
+    """
+    spans = []
+    with open(trace_file) as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                spans.append(json.loads(line))
+    return spans
+
+
+def _duration_ms(span: dict) -> float:
+    start = datetime.fromisoformat(span["start_time"])
+    end = datetime.fromisoformat(span["end_time"])
+    return (end - start).total_seconds() * 1000
+
+
+def format_trace_report(spans: list, last: Optional[int] = 1) -> str:
+    """
+    Render traces as indented span trees with durations, tokens and time to first token.
+
+    Each trace ends with the model tokens per agent, so the hop that dominates
+    latency and cost stands out.
+
+    Args:
+        spans (list): Spans as returned by `load_spans`.
+        last (Optional[int]): Only report the most recent traces; all if None.
+
+    Returns:
+        str: The report.
+    """
+    traces = defaultdict(list)
+    for span in spans:
+        traces[span["context"]["trace_id"]].append(span)
+    ordered = sorted(traces.values(), key=lambda t: min(s["start_time"] for s in t))
+    if last is not None:
+        ordered = ordered[-last:]
+
+    lines = []
+    for trace_spans in ordered:
+        by_id = {span["context"]["span_id"]: span for span in trace_spans}
+        children = defaultdict(list)
+        roots = []
+        for span in sorted(trace_spans, key=lambda s: s["start_time"]):
+            if span.get("parent_id") in by_id:
+                children[span["parent_id"]].append(span)
+            else:
+                roots.append(span)
+
+        tokens = defaultdict(lambda: [0, 0])
+
+        def render(span, depth, agent):
+            attributes = span.get("attributes", {})
+            agent = attributes.get("charon.agent", agent)
+            line = f"{'  ' * depth}{span['name']}  {_duration_ms(span):.0f} ms"
+            if span["name"] == "chat" and "gen_ai.usage.input_tokens" in attributes:
+                input_tokens = attributes["gen_ai.usage.input_tokens"]
+                output_tokens = attributes["gen_ai.usage.output_tokens"]
+                tokens[agent][0] += input_tokens
+                tokens[agent][1] += output_tokens
+                line += f"  tokens {input_tokens} in / {output_tokens} out"
+            if "gen_ai.server.time_to_first_token" in attributes:
+                line += f"  first token {attributes['gen_ai.server.time_to_first_token'] * 1000:.0f} ms"
+            if span.get("status", {}).get("status_code") == "ERROR":
+                line += "  ERROR"
+            lines.append(line)
+            for child in children[span["context"]["span_id"]]:
+                render(child, depth + 1, agent)
+
+        lines.append(f"Trace {trace_spans[0]['context']['trace_id']}")
+        for root in roots:
+            render(root, 1, "")
+        for agent, (input_tokens, output_tokens) in tokens.items():
+            lines.append(
+                f"  {agent or 'unknown agent'}: {input_tokens} input / {output_tokens} output tokens"
+            )
+        lines.append("")
+    return "\n".join(lines)
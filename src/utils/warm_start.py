@@ -0,0 +1,34 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable
+
+
+def build_in_background(factory: Callable, *args, **kwargs) -> Future:
+    """
+    Call `factory` on a daemon thread and return a future for its result.
+
+    Creating an agent imports strands and the model client (litellm alone takes
+    seconds), so the interactive pipelines start building their agent while the
+    user types the first question instead of before showing the prompt. The
+    thread is a daemon, so quitting right away does not wait for it.
+
+    Args:
+        factory (Callable): Called with `args` and `kwargs`, e.g. an agent class.
+
+    Returns:
+        Future: Resolves to the return value of `factory`, or raises its exception.
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(factory(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(
+        target=run, name=f"build-{getattr(factory, '__name__', 'object')}", daemon=True
+    ).start()
+    return future
@@ -1,10 +1,11 @@
-from googleapiclient.discovery import build
 import os
 
 
 class YouTubeMonitor:
     def __init__(self):
         """Initialize the YouTube API client with the API key."""
+        from googleapiclient.discovery import build
+
         api_key = os.getenv("YOUTUBE_API_KEY")
         self.youtube = build("youtube", "v3", developerKey=api_key)
 
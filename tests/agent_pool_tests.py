@@ -0,0 +1,72 @@
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.agents.agent import AgentAbstract
+from src.agents.agent_pool import AgentPool
+
+CONFIG = SimpleNamespace(
+    files_agent=SimpleNamespace(
+        model=SimpleNamespace(model_id="openrouter/openrouter/horizon-beta")
+    ),
+    tracing=SimpleNamespace(enabled=False),
+)
+
+
+class EchoAgent(AgentAbstract):
+    """Minimal agent without tools, used to exercise the pool."""
+
+    def __init__(self):
+        super().__init__(config=CONFIG)
+
+    def get_agent_config(self):
+        return self.config.files_agent
+
+    def get_prompt(self):
+        return "You echo the question."
+
+    def get_tools(self):
+        return []
+
+
+def test_pool_reuses_reset_agents_and_shares_models():
+    """A released agent is handed out again with an empty conversation."""
+    pool = AgentPool()
+    with pool.agent(EchoAgent) as first:
+        first.agent.messages.append({"role": "user", "content": [{"text": "hi"}]})
+        first.agent.state.set("topic", "movies")
+
+    with pool.agent(EchoAgent) as second:
+        assert second is first
+        assert second.agent.messages == []
+        assert second.agent.state.get("topic") is None
+
+    assert EchoAgent().model is first.model
+
+
+def test_concurrent_requests_get_separate_agents():
+    """Agents in use are never handed to a second caller."""
+    pool = AgentPool(max_idle=1)
+    in_use = [pool.acquire(EchoAgent) for _ in range(2)]
+    assert in_use[0] is not in_use[1]
+
+    barrier = threading.Barrier(2)
+    borrowed = []
+
+    def borrow():
+        with pool.agent(EchoAgent) as agent:
+            borrowed.append(agent)
+            barrier.wait(timeout=5)
+
+    for agent in in_use:
+        pool.release(agent)
+    threads = [threading.Thread(target=borrow) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert borrowed[0] is not borrowed[1]
+    assert len(pool._idle[EchoAgent]) == 1
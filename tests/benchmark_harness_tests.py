@@ -0,0 +1,31 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.run_benchmarks import load_scenarios, run_scenario
+
+
+def test_scenario_replays_offline():
+    """A scenario runs against the recorded fixtures and reports its tool calls and tokens."""
+    (scenario,) = load_scenarios(["books_next_read"])
+
+    result = run_scenario(scenario, repeats=1, warm=False)
+
+    assert result["tool_calls"] == {
+        "BookAgent": {"get_book_lists": 1, "search_book": 1}
+    }
+    usage = [turn["usage"] for turn in scenario["turns"]["BookAgent"]]
+    assert result["tokens"]["BookAgent"] == {
+        "input": sum(u["inputTokens"] for u in usage),
+        "output": sum(u["outputTokens"] for u in usage),
+    }
+    assert result["http_requests"] == 1
+    assert result["wall_time_s"]["min"] > 0
+
+
+def test_warm_runs_count_only_the_last_run_requests():
+    """With --warm the lookup of the first run is cached and later runs make no requests."""
+    (scenario,) = load_scenarios(["books_next_read"])
+
+    assert run_scenario(scenario, repeats=1, warm=True)["http_requests"] == 1
+    assert run_scenario(scenario, repeats=3, warm=True)["http_requests"] == 0
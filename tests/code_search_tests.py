@@ -0,0 +1,74 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils.code_search import CodeSearchIndex, required_literals
+from src.utils.source_cache import SourceCache
+
+
+def test_required_literals_only_keeps_mandatory_runs():
+    """Optional, grouped and alternated parts of a regex are never required."""
+    assert required_literals(r"def\s+find_files\(", regex=True) == [
+        "def",
+        "find_files(",
+    ]
+    assert required_literals(r"colou?r_name", regex=True) == ["colo", "r_name"]
+    assert required_literals(r"foo(bar)?bazz", regex=True) == ["foo", "bazz"]
+    assert required_literals(r"load|save", regex=True) == []
+    assert required_literals("a.b(c)", regex=False) == ["a.b(c)"]
+
+
+def test_required_literals_skip_escape_arguments_and_inline_flags():
+    """Code points, group references and inline flags never yield bogus literals."""
+    assert required_literals(r"\x41BCD", regex=True) == ["BCD"]
+    assert required_literals(r"\u0041bcd\N{DIGIT ONE}xyz", regex=True) == [
+        "bcd",
+        "xyz",
+    ]
+    assert required_literals(r"(abc)\1def\0123ghi", regex=True) == ["def", "ghi"]
+    assert required_literals(r"(?x) foo bar", regex=True) == []
+    assert required_literals(r"(?i:load)_config", regex=True) == []
+
+
+def test_regex_search_agrees_with_re_search(tmp_path):
+    """The literal prefilter never hides a file that re.search matches."""
+    project = tmp_path / "project"
+    project.mkdir()
+    source = project / "letters.py"
+    source.write_text("LETTERS = 'ABCD'\nname = 'foobar'\n")
+
+    index = CodeSearchIndex(
+        project, tmp_path / "code.sqlite3", SourceCache(tmp_path / "sources")
+    )
+    index.refresh([str(source)])
+    assert index.search(r"\x41BCD", regex=True, case_sensitive=True)[1] == 1
+    assert index.search(r"(?x) foo bar", regex=True, case_sensitive=True)[1] == 1
+
+
+def test_search_returns_line_numbers_and_follows_changes(tmp_path):
+    """Only candidate files are scanned, and edited or deleted files are re-indexed."""
+    project = tmp_path / "project"
+    project.mkdir()
+    loader, scanner = project / "loader.py", project / "scanner.py"
+    loader.write_text("import yaml\n\n\ndef load_config(path):\n    return path\n")
+    scanner.write_text("from loader import load_config\n\nconfig = load_config('x')\n")
+
+    index = CodeSearchIndex(
+        project, tmp_path / "code.sqlite3", SourceCache(tmp_path / "sources")
+    )
+    assert index.refresh([str(loader), str(scanner)]) == 2
+
+    matches, total, scanned = index.search("import yaml")
+    assert (matches, total, scanned) == ([(str(loader), 1, "import yaml")], 1, 1)
+
+    matches, total, _ = index.search(r"LOAD_CONFIG\(", regex=True)
+    assert [(path, line) for path, line, _ in matches] == [
+        (str(loader), 4),
+        (str(scanner), 3),
+    ]
+    assert index.search("LOAD_CONFIG", case_sensitive=True)[1] == 0
+
+    scanner.write_text("import yaml\n")
+    assert index.refresh([str(scanner)]) == 1
+    assert index.search("import yaml")[0] == [(str(scanner), 1, "import yaml")]
+    assert index.search("load_config")[1] == 0
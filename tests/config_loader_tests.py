@@ -0,0 +1,84 @@
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils import config_loader
+from src.utils.config_loader import (
+    clear_config_cache,
+    load_config,
+    stop_watching_config,
+    watch_config,
+)
+
+CONFIG_FILE = Path(__file__).parent.parent / "config" / "project-config.yaml"
+
+
+def _touch_later(path: Path) -> None:
+    """Move the mtime forward, so the change is visible even on coarse file systems."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_config_is_validated_and_cached(tmp_path, monkeypatch):
+    """The YAML keys map onto Config and repeated loads return the cached object."""
+    config_path = tmp_path / "config.yaml"
+    shutil.copy(CONFIG_FILE, config_path)
+    clear_config_cache()
+
+    config = load_config(str(config_path))
+    assert config.recommender_agent.youtube_directory == "data/youtube_channels.json"
+    assert config.recommender_agent.substack_directory == (
+        "data/substack_newsletters.json"
+    )
+    assert load_config(str(config_path)) is config
+
+    # After the recheck interval a changed file is parsed again.
+    monkeypatch.setattr(config_loader, "CONFIG_RECHECK_INTERVAL", 0)
+    config_path.write_text(
+        config_path.read_text().replace("response_token_budget: 2000", "") + "\n"
+    )
+    _touch_later(config_path)
+    reloaded = load_config(str(config_path))
+    assert reloaded is not config
+    # Keys missing from the file fall back to the schema defaults.
+    assert reloaded.files_agent.response_token_budget == 2000
+    assert "response_token_budget" not in config_path.read_text()
+
+    # A broken edit keeps the last valid config.
+    config_path.write_text("files_agent: [")
+    _touch_later(config_path)
+    assert load_config(str(config_path)) is reloaded
+    clear_config_cache()
+
+
+def test_watched_config_is_reloaded_until_the_watcher_stops(tmp_path):
+    """An edit shows up in load_config without waiting for the recheck interval."""
+    config_path = tmp_path / "config.yaml"
+    shutil.copy(CONFIG_FILE, config_path)
+    clear_config_cache()
+
+    watcher = watch_config(str(config_path), interval=0.01)
+    try:
+        assert watch_config(str(config_path)) is watcher
+        assert load_config(str(config_path)).files_agent.response_token_budget == 2000
+
+        config_path.write_text(
+            config_path.read_text().replace(
+                "response_token_budget: 2000", "response_token_budget: 1234"
+            )
+        )
+        _touch_later(config_path)
+        deadline = time.monotonic() + 5
+        while (
+            load_config(str(config_path)).files_agent.response_token_budget != 1234
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+        assert load_config(str(config_path)).files_agent.response_token_budget == 1234
+    finally:
+        stop_watching_config(str(config_path))
+    assert not watcher.running
+    clear_config_cache()
@@ -0,0 +1,74 @@
+import sys
+import threading
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils.daemon import CharonDaemon, SessionStore
+from src.utils.daemon_client import request_daemon
+from tests.stream_query_tests import make_agent_class
+
+
+def count_questions(messages):
+    questions = sum(1 for message in messages if message["role"] == "user")
+    return [{"text": f"Question {questions}"}]
+
+
+Counter = make_agent_class(
+    "Counter", "openrouter/test-daemon-counter", count_questions, []
+)
+
+
+def test_daemon_streams_answers_and_keeps_sessions(tmp_path):
+    """Queries stream over the socket; a session keeps its conversation until reset."""
+    socket_path = tmp_path / "charon.sock"
+    daemon = CharonDaemon(socket_path, agents={"counter": Counter})
+    assert socket_path.stat().st_mode & 0o777 == 0o600
+    threading.Thread(target=daemon.serve_forever, daemon=True).start()
+
+    def ask(**request):
+        return list(request_daemon({"op": "query", **request}, socket_path))
+
+    try:
+        events = ask(agent="counter", question="Hi")
+        assert "".join(e["text"] for e in events if e["type"] == "text").strip() == (
+            "Question 1"
+        )
+        assert events[-1]["type"] == "result"
+
+        ask(agent="counter", question="Hi", session="s1")
+        events = ask(agent="counter", question="Again", session="s1")
+        assert events[-1]["text"].strip() == "Question 2"
+        # Without a session every query starts a new conversation.
+        assert ask(agent="counter", question="Hi")[-1]["text"].strip() == "Question 1"
+
+        assert list(request_daemon({"op": "reset", "session": "s1"}, socket_path)) == [
+            {"type": "ok", "closed": 1}
+        ]
+        events = ask(agent="counter", question="Hi", session="s1")
+        assert events[-1]["text"].strip() == "Question 1"
+
+        assert ask(agent="nope", question="Hi")[0]["type"] == "error"
+        assert list(request_daemon({"op": "ping"}, socket_path))[0]["agents"] == [
+            "counter"
+        ]
+    finally:
+        daemon.shutdown()
+        daemon.server_close()
+    assert not socket_path.exists()
+
+
+class PooledAgent:
+    def reset(self):
+        pass
+
+
+def test_checkout_reopens_a_session_evicted_before_its_lock_was_taken():
+    """An evicted session's agent goes back to the pool and is never queried again."""
+    store = SessionStore(max_sessions=1, idle_timeout=3600)
+    evicted = store.get("a", PooledAgent)
+    store.get("b", PooledAgent)
+    assert evicted.closed
+
+    with store.checkout("a", PooledAgent) as session:
+        assert session is not evicted and not session.closed
+        assert session.lock.locked()
@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils.directory_index import DirectoryIndex
+from src.utils.directory_scanning import DirectoryScanner
+
+
+def make_tree(root: Path, folders: list) -> None:
+    for folder in folders:
+        (root / folder).mkdir(parents=True, exist_ok=True)
+
+
+def test_index_matches_full_walk(tmp_path):
+    """The built index contains the same folders as a full walk, skip rules included."""
+    root = tmp_path / "root"
+    make_tree(root, ["alpha/src", "alpha/.git/objects", "beta/data/raw", "beta/docs"])
+
+    index = DirectoryIndex(root, index_path=tmp_path / "index.sqlite3")
+    index.refresh()
+
+    scanner = DirectoryScanner(root, use_index=False)
+    assert sorted(index.subfolders()) == sorted(scanner.subfolders)
+
+
+def test_incremental_refresh_picks_up_changes(tmp_path):
+    """Created, deleted and renamed folders are reflected after a refresh."""
+    root = tmp_path / "root"
+    make_tree(root, ["alpha/src/pkg", "beta/docs", "gamma"])
+
+    index = DirectoryIndex(root, index_path=tmp_path / "index.sqlite3")
+    index.refresh()
+
+    make_tree(root, ["alpha/src/pkg/new_module/deep", "delta/tests"])
+    (root / "beta" / "docs").rmdir()
+    (root / "gamma").rename(root / "gamma-renamed")
+    index.refresh()
+
+    scanner = DirectoryScanner(root, use_index=False)
+    assert sorted(index.subfolders()) == sorted(scanner.subfolders)
+    assert str(root / "gamma") not in index.subfolders()
+
+
+def test_refresh_respects_max_age(tmp_path):
+    """A refresh within max_age seconds leaves the index untouched."""
+    root = tmp_path / "root"
+    make_tree(root, ["alpha"])
+
+    index = DirectoryIndex(root, index_path=tmp_path / "index.sqlite3")
+    index.refresh()
+    make_tree(root, ["beta"])
+    index.refresh(max_age=3600)
+
+    assert index.subfolders() == [str(root / "alpha")]
@@ -0,0 +1,102 @@
+import sys
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils.directory_scanning import DirectoryScanner
+
+
+def touch(root: Path, *paths: str) -> None:
+    for path in paths:
+        file = root / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text("")
+
+
+def test_find_files_prunes_skipped_and_ignored(tmp_path):
+    """Skipped folders, hidden folders and git-ignored paths are left out."""
+    project = tmp_path / "project"
+    touch(
+        project,
+        "main.py",
+        "pkg/core.py",
+        "pkg/analysis.ipynb",
+        "pkg/readme.md",
+        ".venv/lib/site.py",
+        "node_modules/tool/index.py",
+        "generated/out.py",
+        "pkg/secret_settings.py",
+        "pkg/nested/keep.py",
+        "pkg/nested/skip.py",
+    )
+    (project / ".gitignore").write_text("node_modules/\n/generated\n*_settings.py\n")
+    (project / "pkg" / "nested" / ".gitignore").write_text("*.py\n!keep.py\n")
+
+    scanner = DirectoryScanner(tmp_path, use_index=False)
+    files = scanner.find_files(project)
+
+    assert files == sorted(
+        str(project / path)
+        for path in [
+            "main.py",
+            "pkg/core.py",
+            "pkg/analysis.ipynb",
+            "pkg/nested/keep.py",
+        ]
+    )
+
+
+def test_find_files_without_gitignore(tmp_path):
+    """Ignored files are returned when .gitignore handling is turned off."""
+    project = tmp_path / "project"
+    touch(project, "main.py", "generated/out.py")
+    (project / ".gitignore").write_text("generated/\n")
+
+    scanner = DirectoryScanner(tmp_path, use_index=False)
+
+    assert scanner.find_files(project, respect_gitignore=False, max_workers=1) == [
+        str(project / "generated" / "out.py"),
+        str(project / "main.py"),
+    ]
+
+
+def test_tree_structure_reuses_scan_and_truncates(tmp_path):
+    """The tree applies the skip rules and stops at the configured limits."""
+    project = tmp_path / "project"
+    touch(project, "main.py", "pkg/core.py", "pkg/sub/deep.py", ".venv/site.py")
+    (project / ".gitignore").write_text("build.log\n")
+    touch(project, "build.log")
+
+    scanner = DirectoryScanner(tmp_path, use_index=False)
+    listing = {}
+    scanner.find_files(project, listing=listing)
+
+    # The listing filled by find_files is reused: the folder is not listed again.
+    with mock.patch("os.scandir", side_effect=AssertionError("listed again")):
+        tree = scanner.generate_tree_structure(project, listing=listing)
+    assert tree == scanner.generate_tree_structure(project)
+    assert tree == "\n".join(
+        [
+            "project",
+            "├── .gitignore",
+            "├── main.py",
+            "└── pkg",
+            "    ├── core.py",
+            "    └── sub",
+            "        └── deep.py",
+            "",
+            "2 directories, 4 files",
+        ]
+    )
+
+    shallow = scanner.generate_tree_structure(project, max_depth=1)
+    assert "└── pkg/ [...]" in shallow
+    assert "core.py" not in shallow
+
+    truncated = list(scanner.iter_tree_lines(project, max_entries=2))
+    assert truncated[:4] == [
+        "project",
+        "├── .gitignore",
+        "├── main.py",
+        "... (truncated)",
+    ]
@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils.folder_matching import FolderMatcher
+
+
+def build_matcher(paths: list) -> FolderMatcher:
+    matcher = FolderMatcher(Path("/home/user"))
+    for path in paths:
+        matcher.add(path)
+    return matcher
+
+
+def test_best_match_ranks_first():
+    """The closest name wins over earlier partial substring hits."""
+    matcher = build_matcher(
+        [
+            "/home/user/charon-old-notes",
+            "/home/user/code/project-charon",
+            "/home/user/code/project-athena",
+        ]
+    )
+
+    matches = matcher.search("project charon", k=3)
+
+    assert matches[0].path == "/home/user/code/project-charon"
+    assert "/home/user/code/project-athena" in [m.path for m in matches]
+
+
+def test_typos_and_separators_still_match():
+    """Edit distance and normalization tolerate typos and different separators."""
+    matcher = build_matcher(["/home/user/CleanEnergy_Dashboard", "/home/user/notes"])
+
+    assert matcher.search("clean energy dashbord")[0].path == (
+        "/home/user/CleanEnergy_Dashboard"
+    )
+
+
+def test_no_match_returns_empty_list():
+    """Unrelated queries return nothing instead of an arbitrary folder."""
+    matcher = build_matcher(["/home/user/alpha", "/home/user/beta"])
+
+    assert matcher.search("zzzz") == []
+    assert build_matcher([]).search("anything") == []
+
+
+def test_remove_drops_folder():
+    """Removed folders are no longer returned."""
+    matcher = build_matcher(["/home/user/charon", "/home/user/other/charon"])
+    matcher.remove("/home/user/charon")
+
+    assert [m.path for m in matcher.search("charon")] == ["/home/user/other/charon"]
+
+
+def test_unknown_mtime_gets_no_recency_boost():
+    """A folder with mtime 0 ranks below the same folder seen just now."""
+    matcher = FolderMatcher(Path("/home/user"))
+    matcher.add("/home/user/a/charon", 0)
+    matcher.add("/home/user/b/charon")
+
+    old, new = sorted(matcher.search("charon"), key=lambda m: m.path)
+    assert new.score - old.score > 0.04
+
+
+def test_large_k_rescores_enough_candidates():
+    """More than RESCORE_LIMIT matches are returned when k asks for them."""
+    matcher = build_matcher([f"/home/user/charon-{i:02d}" for i in range(30)])
+
+    assert len(matcher.search("charon", k=25)) == 25
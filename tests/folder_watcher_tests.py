@@ -0,0 +1,61 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils.directory_scanning import DirectoryScanner
+from src.utils.folder_watcher import InotifyFolderWatcher, PollingFolderWatcher
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_watcher_keeps_subfolders_current(tmp_path):
+    """Created, renamed and deleted folders reach the scanner without a rescan."""
+    root = tmp_path / "root"
+    (root / "alpha").mkdir(parents=True)
+
+    scanner = DirectoryScanner(root, use_index=False)
+    watcher = scanner.start_watching(poll_interval=0.1)
+    try:
+        (root / "beta" / "src").mkdir(parents=True)
+        assert wait_for(lambda: str(root / "beta" / "src") in scanner.subfolders)
+
+        (root / "beta").rename(root / "gamma")
+        assert wait_for(lambda: str(root / "gamma" / "src") in scanner.subfolders)
+        assert wait_for(lambda: str(root / "beta") not in scanner.subfolders)
+
+        (root / "alpha").rmdir()
+        assert wait_for(lambda: str(root / "alpha") not in scanner.subfolders)
+        assert isinstance(watcher, (InotifyFolderWatcher, PollingFolderWatcher))
+    finally:
+        scanner.stop_watching()
+
+
+def test_polling_watcher_reports_differences(tmp_path):
+    """The polling fallback reports the difference between two scans."""
+    folders = {"/a", "/b"}
+    created, deleted = [], []
+
+    watcher = PollingFolderWatcher(
+        tmp_path,
+        on_created=created.append,
+        on_deleted=deleted.append,
+        on_resync=lambda: None,
+        scan=lambda: set(folders),
+        interval=0.05,
+    )
+    watcher.start()
+    try:
+        time.sleep(0.1)
+        folders.discard("/a")
+        folders.add("/c")
+        assert wait_for(lambda: created == ["/c"] and deleted == ["/a"])
+    finally:
+        watcher.stop()
@@ -0,0 +1,91 @@
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils import http_client
+from src.utils.http_client import cache_key, get_json
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Fails the first request with 503, then serves a document with an ETag."""
+
+    requests: list = []
+
+    def do_GET(self):
+        self.requests.append((self.path, self.headers.get("If-None-Match")))
+        if len(self.requests) == 1:
+            self.send_response(503)
+            self.end_headers()
+        elif self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+        else:
+            body = json.dumps({"numFound": 1}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_retries_caches_and_revalidates(tmp_path):
+    """A 503 is retried, repeat lookups stay on disk, expired ones are revalidated."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/search.json"
+
+    with (
+        mock.patch.dict(http_client._caches, clear=True),
+        mock.patch.object(http_client, "HTTP_CACHE_DIR", tmp_path),
+    ):
+        try:
+            assert get_json(url, {"title": "Dune", "apikey": "a"}, ttl=60) == {
+                "numFound": 1
+            }
+            assert len(FlakyHandler.requests) == 2
+
+            # Same normalized query, another API key: answered from disk.
+            assert get_json(url, {"title": " DUNE", "apikey": "b"}, ttl=60)
+            assert len(FlakyHandler.requests) == 2
+
+            # An expired entry is revalidated; the 304 keeps the cached body.
+            http_client.get_http_cache().renew(cache_key(url, {"title": "Dune"}), -1)
+            assert get_json(url, {"title": "Dune"}) == {"numFound": 1}
+            assert FlakyHandler.requests[-1][1] == '"v1"'
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # The server is gone: the expired entry is still served.
+        http_client.get_http_cache().renew(cache_key(url, {"title": "Dune"}), -1)
+        assert get_json(url, {"title": "Dune"}, timeout=(0.5, 0.5)) == {"numFound": 1}
+    assert cache_key(url, {"title": "Dune", "year": ""}) == cache_key(
+        url + "/", {"title": "dune"}
+    )
+
+
+def test_only_found_lookups_are_reused():
+    """A "not found" search asks again next time; a match is reused."""
+    from src.tools import books_tools
+    from src.utils.tool_cache import get_process_tool_cache
+
+    get_process_tool_cache().invalidate()
+    with mock.patch.object(
+        books_tools, "get_json", return_value={"numFound": 0}
+    ) as lookup:
+        assert "not found" in books_tools.search_book(title="Nowhere Book")
+        assert "not found" in books_tools.search_book(title="Nowhere Book")
+        assert lookup.call_count == 2
+
+        lookup.return_value = {"numFound": 1}
+        assert books_tools.search_book(title="Dune").startswith("Found matches:")
+        assert books_tools.search_book(title="Dune").startswith("Found matches:")
+        assert lookup.call_count == 3
@@ -0,0 +1,126 @@
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils.list_store import ListStore, format_entries
+
+
+def make_store(tmp_path, legacy=None):
+    legacy_json = tmp_path / "book_list.json"
+    if legacy is not None:
+        legacy_json.write_text(json.dumps(legacy))
+    return ListStore(
+        tmp_path / "books.sqlite3",
+        sections=("to_read", "read"),
+        key_fields=("title", "author"),
+        legacy_json=legacy_json,
+    )
+
+
+def test_legacy_json_is_imported_once(tmp_path):
+    """The old JSON list fills an empty store on first use only."""
+    legacy = {
+        "to_read": [{"title": "Dune", "author": "Frank Herbert", "pages": 412}],
+        "read": [{"title": "Emma", "author": "Jane Austen", "rating": 8}],
+    }
+    store = make_store(tmp_path, legacy)
+    assert store.load() == legacy
+    store.close()
+
+    (tmp_path / "book_list.json").write_text(json.dumps({"to_read": [], "read": []}))
+    assert make_store(tmp_path).load() == legacy
+
+
+def test_add_and_move_match_titles_loosely(tmp_path):
+    """Entries are matched ignoring case and spacing, and moved to the end of a section."""
+    store = make_store(tmp_path, {"to_read": [], "read": []})
+    version = store.version()
+
+    assert store.add("to_read", {"title": "Dune", "author": "Frank Herbert"})
+    assert store.add("to_read", {"title": "Sapiens", "author": "Yuval Noah Harari"})
+    assert not store.add("to_read", {"title": " dune", "author": "FRANK  herbert"})
+    assert store.version() == version + 2
+
+    moved = store.move("to_read", "read", "DUNE", "frank herbert", {"rating": 9})
+    assert moved == {"title": "Dune", "author": "Frank Herbert", "rating": 9}
+    assert store.move("to_read", "read", "Dune", "Frank Herbert") is None
+    assert store.counts() == {"to_read": 1, "read": 1}
+    assert store.find("read", "dune", "Frank Herbert")["rating"] == 9
+    assert store.find("read", "Dune", "Someone Else") is None
+
+
+def test_concurrent_adds_from_two_connections(tmp_path):
+    """Writers in different connections never add the same entry twice."""
+    stores = [make_store(tmp_path, {"to_read": [], "read": []}) for _ in range(2)]
+
+    def add(index):
+        return stores[index % 2].add(
+            "to_read", {"title": f"Book {index // 4}", "author": "A"}
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        added = list(executor.map(add, range(40)))
+
+    assert sum(added) == 10
+    assert stores[0].counts()["to_read"] == 10
+
+
+def test_query_filters_sorts_and_pages(tmp_path):
+    """Queries are answered from memory and rendered one compact entry per line."""
+    store = make_store(
+        tmp_path,
+        {
+            "to_read": [
+                {"title": "Elantris", "author": "Brandon Sanderson", "genre": "Fantasy"}
+            ],
+            "read": [
+                {
+                    "title": "Mistborn",
+                    "author": "Brandon Sanderson",
+                    "genre": "Epic Fantasy",
+                    "rating": 9,
+                    "read_date": "2025-08-05",
+                },
+                {
+                    "title": "Emma",
+                    "author": "Jane Austen",
+                    "genre": "Classic",
+                    "rating": 7,
+                    "read_date": "2023-02-01",
+                },
+                {
+                    "title": "Dune",
+                    "author": "Frank Herbert",
+                    "genre": "Science Fiction",
+                    "rating": 10,
+                    "read_date": "2024-06-01",
+                },
+            ],
+        },
+    )
+    dates = ("read_date", "added_date")
+
+    fantasy = store.query(contains={"genre": "FANTASY", "author": None})
+    assert [book["title"] for book in fantasy] == ["Elantris", "Mistborn"]
+    assert fantasy[0]["status"] == "to_read"
+    recent = store.query(
+        "read", date_fields=dates, date_from="2024-01-01", sort="-rating"
+    )
+    assert [book["title"] for book in recent] == ["Dune", "Mistborn"]
+    assert [book["title"] for book in store.query(max_rating=8)] == ["Emma"]
+    assert store.entries() is store.entries()
+
+    text = format_entries(
+        "BOOKS", store.query(sort="title"), ["title", "rating"], limit=2, offset=1
+    )
+    assert text.splitlines() == [
+        "BOOKS",
+        "Showing 2-3 of 4 matching; use offset=3 for more",
+        '{"title":"Elantris"}',
+        '{"title":"Emma","rating":7}',
+    ]
+
+    store.add("to_read", {"title": "Warbreaker", "author": "Brandon Sanderson"})
+    assert len(store.query(contains={"author": "sanderson"})) == 3
@@ -0,0 +1,80 @@
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+from mcp import StdioServerParameters, stdio_client
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils import mcp_session
+from src.utils.mcp_session import MCPSessionManager
+
+SERVER = """
+import os
+from mcp.server.fastmcp import FastMCP
+
+server = FastMCP("pid")
+
+
+@server.tool()
+def pid() -> str:
+    return str(os.getpid())
+
+
+server.run()
+"""
+
+
+def _server_pid(session: MCPSessionManager) -> int:
+    result = session.client.call_tool_sync("pid-call", "pid", {})
+    return int(result["content"][0]["text"])
+
+
+def test_session_is_reused_and_restarted_after_a_crash(tmp_path, monkeypatch):
+    """The server process survives between uses and comes back after being killed."""
+    monkeypatch.setattr(mcp_session, "INITIAL_RESTART_DELAY", 0.01)
+    script = tmp_path / "server.py"
+    script.write_text(SERVER)
+    session = MCPSessionManager(
+        "pid",
+        lambda: stdio_client(
+            StdioServerParameters(command=sys.executable, args=[str(script)])
+        ),
+    )
+    try:
+        tools = session.get_tools()
+        assert [tool.tool_name for tool in tools] == ["pid"]
+        first_pid = _server_pid(session)
+        assert session.get_tools() is tools
+        assert _server_pid(session) == first_pid
+
+        os.kill(first_pid, signal.SIGKILL)
+        time.sleep(0.2)
+        session.get_tools()
+        assert _server_pid(session) != first_pid
+    finally:
+        session.close()
+    assert not session.running
+
+
+def test_only_mcp_errors_stop_the_github_session():
+    """A model error leaves the shared server running; an MCP error restarts it."""
+    from anyio import ClosedResourceError
+    from strands.types.exceptions import EventLoopException, ModelThrottledException
+
+    from src.agents.github_agent import GitHubAgent
+
+    agent = GitHubAgent.__new__(GitHubAgent)
+    agent.github_session = mock.Mock()
+
+    agent._query_failed(ModelThrottledException("slow down"))
+    agent._query_failed(ValueError("bad tool input"))
+    agent.github_session.mark_failed.assert_not_called()
+
+    try:
+        raise EventLoopException(ClosedResourceError()) from ClosedResourceError()
+    except EventLoopException as e:
+        agent._query_failed(e)
+    agent.github_session.mark_failed.assert_called_once()
@@ -0,0 +1,90 @@
+import json
+import multiprocessing
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils import persistence
+from src.utils.persistence import (
+    atomic_write_json,
+    read_json,
+    update_json,
+    write_batch,
+)
+
+
+def append(value):
+    def mutate(items):
+        items.append(value)
+        return len(items)
+
+    return mutate
+
+
+def add_values(path, values):
+    for value in values:
+        update_json(path, append(value))
+
+
+def test_failed_write_keeps_the_old_file(tmp_path):
+    """A write that fails halfway leaves the previous content and no temporary files."""
+    path = tmp_path / "channels.json"
+    atomic_write_json(path, [{"url": "note"}])
+    path.chmod(0o640)
+
+    with pytest.raises(TypeError):
+        atomic_write_json(path, [object()])
+    with mock.patch.object(persistence.os, "replace", side_effect=OSError("disk")):
+        with pytest.raises(OSError):
+            atomic_write_json(path, [])
+
+    assert json.loads(path.read_text()) == [{"url": "note"}]
+    atomic_write_json(path, [])
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["channels.json"]
+
+
+def test_concurrent_updates_are_not_lost(tmp_path):
+    """Threads and processes updating the same file all keep their changes."""
+    path = tmp_path / "newsletters.json"
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: update_json(path, append(i)), range(40)))
+
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(
+            target=add_values, args=(path, range(100 + 20 * i, 120 + 20 * i))
+        )
+        for i in range(3)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert sorted(read_json(path)) == list(range(40)) + list(range(100, 160))
+
+
+def test_batch_writes_once_and_merges_outside_changes(tmp_path):
+    """Updates in a batch are written together, on top of changes made meanwhile."""
+    path = tmp_path / "channels.json"
+    atomic_write_json(path, ["a"])
+
+    with mock.patch.object(
+        persistence, "atomic_write_json", wraps=persistence.atomic_write_json
+    ) as write:
+        with write_batch():
+            update_json(path, append("b"))
+            with write_batch():
+                update_json(path, append("c"))
+            assert read_json(path) == ["a", "b", "c"]
+            assert json.loads(path.read_text()) == ["a"]
+            # Another process adds an entry before the request ends.
+            atomic_write_json(path, ["a", "x"])
+        assert write.call_count == 1
+
+    assert read_json(path) == ["a", "x", "b", "c"]
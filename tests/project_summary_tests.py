@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils.directory_scanning import DirectoryScanner
+from src.utils.project_summary import estimate_tokens, summarize_project
+
+
+def test_summary_stays_within_budget_and_keeps_entry_points(tmp_path):
+    """Large projects are cut down to the budget, entry points first."""
+    project = tmp_path / "project"
+    for package in range(30):
+        for module in range(20):
+            path = project / f"package_{package}" / f"module_{module}.py"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+    (project / "main.py").write_text("print('hello')\n")
+
+    scanner = DirectoryScanner(tmp_path, use_index=False)
+    listing = {}
+    files = scanner.find_files(project, listing=listing)
+    tree, selected = summarize_project(project, files, listing, 500)
+
+    assert selected[0] == str(project / "main.py")
+    assert 0 < len(selected) < len(files)
+    assert estimate_tokens(tree) + sum(estimate_tokens(p) + 2 for p in selected) <= 500
+    assert "project/ (601 files, 601 .py)" in tree
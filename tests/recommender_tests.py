@@ -0,0 +1,107 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils.recommender import ContentRecommender, format_recommendations
+
+
+def make_recommender(entries):
+    return ContentRecommender(
+        entries,
+        candidate_section="to_read",
+        history_section="read",
+        field_weights={"genre": 3.0, "author": 3.0, "title": 1.0, "notes": 0.5},
+        tag_fields=("genre", "author"),
+        word_fields=("genre", "title", "notes"),
+        creator_field="author",
+    )
+
+
+def test_ranks_candidates_by_highly_rated_history():
+    """Books like the ones rated highly come first, books like the disliked ones last."""
+    recommender = make_recommender(
+        [
+            (
+                "to_read",
+                {
+                    "title": "Pride and Prejudice",
+                    "author": "Jane Austen",
+                    "genre": "Classic",
+                },
+            ),
+            (
+                "to_read",
+                {
+                    "title": "Elantris",
+                    "author": "Brandon Sanderson",
+                    "genre": "Fantasy",
+                },
+            ),
+            (
+                "to_read",
+                {
+                    "title": "Project Hail Mary",
+                    "author": "Andy Weir",
+                    "genre": "Science Fiction",
+                },
+            ),
+            (
+                "read",
+                {
+                    "title": "Mistborn",
+                    "author": "Brandon Sanderson",
+                    "genre": "Fantasy",
+                    "rating": 10,
+                },
+            ),
+            (
+                "read",
+                {
+                    "title": "The Martian",
+                    "author": "Andy Weir",
+                    "genre": "Science Fiction",
+                    "rating": 8,
+                },
+            ),
+            (
+                "read",
+                {
+                    "title": "Emma",
+                    "author": "Jane Austen",
+                    "genre": "Classic",
+                    "rating": 2,
+                },
+            ),
+        ]
+    )
+
+    ranked = recommender.recommend(k=3)
+    assert [book["title"] for book in ranked] == [
+        "Elantris",
+        "Project Hail Mary",
+        "Pride and Prejudice",
+    ]
+    assert ranked[0]["like"]["title"] == "Mistborn"
+    assert set(ranked[0]["shares"]) == {"fantasy", "brandon sanderson"}
+    assert ranked[2]["score"] < 0
+
+    text = format_recommendations("BOOKS", ranked[:1])
+    assert text.splitlines()[1].startswith(
+        "1. Elantris by Brandon Sanderson (Fantasy), score"
+    )
+
+
+def test_nothing_to_recommend_without_history():
+    recommender = make_recommender([("to_read", {"title": "Elantris"})])
+    assert recommender.recommend() == []
+    assert "Nothing to recommend" in format_recommendations("BOOKS", [])
+
+
+def test_rejects_non_positive_k():
+    recommender = make_recommender(
+        [("to_read", {"title": "Elantris"}), ("read", {"title": "Emma", "rating": 9})]
+    )
+    with pytest.raises(ValueError):
+        recommender.recommend(k=-1)
@@ -0,0 +1,146 @@
+import sys
+import time
+from pathlib import Path
+
+from strands import tool
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils.response_cache import (
+    ResponseCache,
+    data_fingerprint,
+    get_response_cache,
+    normalize_question,
+)
+from tests.stream_query_tests import make_agent_class
+
+model_calls = []
+
+
+def test_normalized_questions_share_an_entry():
+    """Case, punctuation and spacing do not matter."""
+    cache = ResponseCache()
+    cache.put("BookAgent", "What should I read next?", "Dune", ttl=60)
+
+    assert normalize_question("What's on  my calendar?") == "what s on my calendar"
+    assert cache.get("BookAgent", "what should i read next") == "Dune"
+    assert cache.get("MoviesAgent", "what should i read next") is None
+
+
+def test_entries_expire_and_least_recently_used_are_evicted():
+    """Answers are dropped after their TTL and once the cache is full."""
+    cache = ResponseCache(max_entries=2)
+    cache.put("BookAgent", "expired", "old", ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("BookAgent", "expired") is None
+
+    cache.put("BookAgent", "first", 1, ttl=60)
+    cache.put("BookAgent", "second", 2, ttl=60)
+    cache.get("BookAgent", "first")
+    cache.put("BookAgent", "third", 3, ttl=60)
+
+    assert cache.get("BookAgent", "second") is None
+    assert cache.get("BookAgent", "first") == 1
+    assert cache.get("BookAgent", "third") == 3
+
+
+def test_changed_data_sources_miss(tmp_path):
+    """An answer is not served after the file it was based on changed."""
+    book_list = tmp_path / "book_list.json"
+    book_list.write_text('{"read": []}')
+    cache = ResponseCache()
+    cache.put(
+        "BookAgent", "what did I read", "nothing", 60, data_fingerprint([book_list])
+    )
+
+    book_list.write_text('{"read": ["Dune"]}')
+
+    assert (
+        cache.get("BookAgent", "what did I read", data_fingerprint([book_list])) is None
+    )
+
+
+def test_similar_questions_hit_only_with_a_threshold():
+    """Near matches are reused only when a similarity threshold is configured."""
+    cache = ResponseCache()
+    cache.put("CalendarAgent", "what is on my calendar today", "Dentist", ttl=60)
+    assert cache.get("CalendarAgent", "what's on my calendar today please") is None
+
+    cache.similarity_threshold = 0.75
+    assert cache.get("CalendarAgent", "what's on my calendar today please") == "Dentist"
+    assert cache.get("CalendarAgent", "who is playing tonight") is None
+
+
+@tool
+def read_list() -> str:
+    """Read the list."""
+    return "Dune"
+
+
+@tool
+def add_to_list(title: str) -> str:
+    """
+    Add a title to the list.
+
+    Args:
+        title: The title.
+    """
+    return "added"
+
+
+def answer_with(tool_name):
+    def script(messages):
+        model_calls.append(tool_name)
+        if "toolResult" in messages[-1]["content"][0]:
+            return [{"text": "Done"}]
+        return [{"id": f"call-{len(model_calls)}", "name": tool_name, "input": {}}]
+
+    return script
+
+
+class ReadingAgent(
+    make_agent_class(
+        "ReadingAgent",
+        "openrouter/test-reading-agent",
+        answer_with("read_list"),
+        [read_list],
+    )
+):
+    response_cache_ttl = 60
+    cacheable_tools = frozenset({"read_list"})
+
+
+class WritingAgent(
+    make_agent_class(
+        "WritingAgent",
+        "openrouter/test-writing-agent",
+        answer_with("add_to_list"),
+        [add_to_list],
+    )
+):
+    response_cache_ttl = 60
+    cacheable_tools = frozenset({"read_list"})
+
+
+def test_repeated_questions_skip_the_model():
+    """A fresh agent answers a repeated read-only question without calling the model."""
+    get_response_cache().invalidate()
+    model_calls.clear()
+
+    first = ReadingAgent().query("What is on the list?")
+    calls = len(model_calls)
+    second = ReadingAgent().query("what is on the list")
+
+    assert str(second) == str(first)
+    assert len(model_calls) == calls
+
+
+def test_answers_of_write_tools_are_not_cached():
+    """An answer that called a tool outside cacheable_tools is computed every time."""
+    get_response_cache().invalidate()
+    model_calls.clear()
+
+    WritingAgent().query("Add Dune")
+    calls = len(model_calls)
+    WritingAgent().query("Add Dune")
+
+    assert len(model_calls) == 2 * calls
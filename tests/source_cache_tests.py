@@ -0,0 +1,58 @@
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils.source_cache import SourceCache, notebook_to_text
+
+NOTEBOOK = {
+    "nbformat": 4,
+    "metadata": {"kernelspec": {"name": "python3"}},
+    "cells": [
+        {"cell_type": "markdown", "source": ["# Analysis\n", "\n", "Load data."]},
+        {
+            "cell_type": "code",
+            "source": ["import pandas as pd\n", "df = pd.read_csv('data.csv')"],
+            "outputs": [{"data": {"image/png": "iVBORw0KGgo" * 10_000}}],
+        },
+        {"cell_type": "raw", "source": "ignored"},
+    ],
+}
+
+
+def test_notebook_text_keeps_cells_and_drops_outputs():
+    """Only code and markdown cell sources survive, in order."""
+    text = notebook_to_text(json.dumps(NOTEBOOK).encode())
+    assert text == (
+        "# %% [markdown]\n# # Analysis\n#\n# Load data.\n\n"
+        "# %%\nimport pandas as pd\ndf = pd.read_csv('data.csv')\n"
+    )
+
+
+def test_cache_serves_unchanged_files_and_evicts_least_recently_used(tmp_path):
+    """Unchanged files are answered from the cache, and old entries are evicted first."""
+    cache = SourceCache(tmp_path / "cache", max_bytes=250)
+    notebook = tmp_path / "analysis.ipynb"
+    notebook.write_text(json.dumps(NOTEBOOK))
+    text = cache.read(str(notebook))
+
+    # A served file is not parsed again while its size and mtime are unchanged.
+    entry = next((tmp_path / "cache").glob("*/*.txt"))
+    entry.write_text("cached")
+    assert cache.read(str(notebook)) == "cached"
+    entry.write_text(text)
+
+    first, second = tmp_path / "first.py", tmp_path / "second.py"
+    first.write_text("a = 1\n" * 20)
+    second.write_text("b = 2\n" * 20)
+    cache.read(str(first))
+    cache.read(str(notebook))
+    cache.read(str(second))
+
+    # The notebook was used after first.py, so first.py is evicted to make room.
+    first_entry = hashlib.sha1(first.read_bytes()).hexdigest()
+    assert not list((tmp_path / "cache").glob(f"*/{first_entry}.txt"))
+    assert len(list((tmp_path / "cache").glob("*/*.txt"))) == 2
+    assert cache.read(str(notebook)) == text
+    assert cache.read(str(first)) == "a = 1\n" * 20
@@ -0,0 +1,60 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent
+
+# Imported once an agent is created, not when a pipeline starts.
+DEFERRED_MODULES = {
+    "strands",
+    "litellm",
+    "boto3",
+    "mcp",
+    "googleapiclient",
+    "google_auth_oauthlib",
+    "substack_api",
+}
+# Import budget of a pipeline module, excluding interpreter startup.
+IMPORT_BUDGET_US = 1_000_000
+
+
+def import_times(module: str) -> dict:
+    """Import `module` in a fresh interpreter and return cumulative import time per module."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    times = {}
+    for line in output.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| +(\S+)", line)
+        if match:
+            times[match.group(2)] = int(match.group(1))
+    return times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "src.pipelines.running_book_agent",
+        "src.pipelines.running_calendar_agent",
+        "src.pipelines.running_files_agent",
+        "src.pipelines.running_github_agent",
+        "src.pipelines.running_home_agent",
+        "src.pipelines.running_movie_agent",
+        "src.pipelines.running_recommender_agent",
+        "src.pipelines.running_task_agent",
+    ],
+)
+def test_pipelines_start_without_loading_agent_dependencies(module):
+    """Starting a pipeline imports neither strands nor model, Google or MCP clients."""
+    times = import_times(module)
+
+    loaded = {name.split(".")[0] for name in times}
+    assert not loaded & DEFERRED_MODULES
+    assert times[module] < IMPORT_BUDGET_US
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from strands import tool
+from strands.models.model import Model
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.agents.agent import AgentAbstract
+from src.agents.agent_pool import query_sub_agent
+
+
+class ScriptedModel(Model):
+    """Model that answers every turn with the blocks returned by `script`."""
+
+    def __init__(self, script):
+        self.script = script
+
+    def update_config(self, **model_config):
+        pass
+
+    def get_config(self):
+        return {}
+
+    async def structured_output(self, output_model, prompt, **kwargs):
+        raise NotImplementedError
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        blocks = self.script(messages)
+        yield {"messageStart": {"role": "assistant"}}
+        for block in blocks:
+            if "text" in block:
+                for word in block["text"].split(" "):
+                    yield {"contentBlockDelta": {"delta": {"text": word + " "}}}
+            else:
+                start = {"toolUseId": block["id"], "name": block["name"]}
+                yield {"contentBlockStart": {"start": {"toolUse": start}}}
+                delta = {"toolUse": {"input": json.dumps(block["input"])}}
+                yield {"contentBlockDelta": {"delta": delta}}
+            yield {"contentBlockStop": {}}
+        uses_tools = any("name" in block for block in blocks)
+        yield {"messageStop": {"stopReason": "tool_use" if uses_tools else "end_turn"}}
+
+
+def make_agent_class(name, model_id, script, tools):
+    def get_agent_config(self):
+        return SimpleNamespace(model=SimpleNamespace(model_id=model_id))
+
+    return type(
+        name,
+        (AgentAbstract,),
+        {
+            "get_agent_config": get_agent_config,
+            "get_prompt": lambda self: "",
+            "get_tools": lambda self: tools,
+            "_initialize_model": lambda self: ScriptedModel(script),
+        },
+    )
+
+
+SubAgent = make_agent_class(
+    "SubAgent",
+    "openrouter/test-sub-agent",
+    lambda messages: [{"text": "Dune is a good read"}],
+    [],
+)
+
+
+@tool
+async def ask_sub_agent(question: str) -> str:
+    """
+    Ask the sub-agent.
+
+    Args:
+        question: The question.
+    """
+    return str(await query_sub_agent(SubAgent, question, 2, 5))
+
+
+def orchestrator_script(messages):
+    if len(messages) == 1:
+        return [
+            {"id": "call-1", "name": "ask_sub_agent", "input": {"question": "book?"}}
+        ]
+    return [{"text": "Read Dune tonight"}]
+
+
+Orchestrator = make_agent_class(
+    "Orchestrator",
+    "openrouter/test-orchestrator",
+    orchestrator_script,
+    [ask_sub_agent],
+)
+
+
+def test_stream_query_forwards_sub_agent_events():
+    """Sub-agent tokens arrive in the orchestrator's stream before its own answer."""
+
+    async def collect():
+        return [event async for event in Orchestrator().stream_query("evening?")]
+
+    events = asyncio.run(collect())
+    summary = [
+        (event["agent"], event["depth"], event["type"])
+        for event in events
+        if event["type"] != "text"
+    ]
+    assert summary == [
+        ("Orchestrator", 0, "tool_use"),
+        ("SubAgent", 1, "result"),
+        ("Orchestrator", 0, "tool_result"),
+        ("Orchestrator", 0, "result"),
+    ]
+
+    texts = [(e["agent"], e["text"]) for e in events if e["type"] == "text"]
+    assert "".join(text for agent, text in texts if agent == "SubAgent") == (
+        "Dune is a good read "
+    )
+    assert texts[0] == ("SubAgent", "Dune ")
+    assert str(events[-1]["result"]).strip() == "Read Dune tonight"
+
+
+def test_query_still_returns_the_whole_result():
+    """The synchronous API is unchanged."""
+    assert str(Orchestrator().query("evening?")).strip() == "Read Dune tonight"
@@ -0,0 +1,61 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.agents.agent_pool import query_sub_agent
+
+running = []
+peak = []
+
+
+class SlowAgent:
+    """Stands in for a sub-agent whose model call takes a while."""
+
+    delay = 0.2
+
+    async def query_async(self, question: str):
+        running.append(question)
+        peak.append(len(running))
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            running.remove(question)
+        return f"answer to {question}"
+
+    def reset(self):
+        pass
+
+
+class StuckAgent(SlowAgent):
+    delay = 10
+
+
+def test_independent_sub_agents_run_in_parallel_up_to_the_cap():
+    """Three sub-agent calls with a cap of two take two rounds, not three."""
+    peak.clear()
+
+    async def turn():
+        return await asyncio.gather(
+            *(query_sub_agent(SlowAgent, f"q{i}", 2, 5) for i in range(3))
+        )
+
+    started = time.perf_counter()
+    answers = asyncio.run(turn())
+    elapsed = time.perf_counter() - started
+
+    assert answers == ["answer to q0", "answer to q1", "answer to q2"]
+    # The peak proves the cap and the parallelism; no upper bound on wall time,
+    # which would flake on a loaded machine.
+    assert max(peak) == 2
+    assert elapsed >= 2 * SlowAgent.delay
+
+
+def test_sub_agent_timeout():
+    """A sub-agent that does not answer in time is cancelled."""
+    with pytest.raises(TimeoutError, match="StuckAgent did not answer within 0.1"):
+        asyncio.run(query_sub_agent(StuckAgent, "q", 2, 0.1))
+    assert running == []
@@ -0,0 +1,71 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils.symbol_index import SymbolIndex
+
+SOURCE = '''"""Scanner module."""
+
+
+class DirectoryScanner:
+    """Scans directories."""
+
+    @staticmethod
+    def find_files(folder: str, extensions: tuple = (".py",)) -> list:
+        return []
+
+
+async def find_folder(name):
+    def helper():
+        pass
+'''
+
+
+def test_symbols_are_indexed_with_signatures_and_line_ranges(tmp_path):
+    """Classes, methods and functions get qualified names, signatures and line ranges."""
+    project = tmp_path / "project"
+    (project / "utils").mkdir(parents=True)
+    path = project / "utils" / "scanning.py"
+    path.write_text(SOURCE)
+
+    index = SymbolIndex(project, tmp_path / "symbols.sqlite3")
+    assert index.refresh([str(path)]) == 1
+
+    method = index.search("DirectoryScanner.find_files")[0]
+    assert method["qualified_name"] == "utils.scanning.DirectoryScanner.find_files"
+    assert method["kind"] == "method"
+    assert method["signature"] == (
+        "def find_files(folder: str, extensions: tuple=('.py',)) -> list"
+    )
+    assert (method["start_line"], method["end_line"]) == (7, 9)
+
+    names = [symbol["qualified_name"] for symbol in index.outline(str(path))]
+    assert names == [
+        "utils.scanning",
+        "utils.scanning.DirectoryScanner",
+        "utils.scanning.DirectoryScanner.find_files",
+        "utils.scanning.find_folder",
+    ]
+    assert [s["name"] for s in index.search("find", kind="function")] == ["find_folder"]
+
+
+def test_refresh_only_parses_changed_files(tmp_path):
+    """Unchanged and merely touched files are not parsed again, deleted files are dropped."""
+    project = tmp_path / "project"
+    project.mkdir()
+    first, second = project / "first.py", project / "second.py"
+    first.write_text("def alpha():\n    pass\n")
+    second.write_text("def beta():\n    pass\n")
+
+    index = SymbolIndex(project, tmp_path / "symbols.sqlite3")
+    assert index.refresh([str(first), str(second)]) == 2
+    assert index.refresh([str(first), str(second)]) == 0
+
+    first.write_text("def alpha():\n    pass\n")  # same content, new mtime
+    second.write_text("def gamma():\n    pass\n")
+    assert index.refresh([str(first), str(second)]) == 1
+    assert index.search("beta") == []
+    assert index.search("gamma")[0]["file_path"] == str(second)
+
+    assert index.refresh([str(second)]) == 0
+    assert index.search("alpha") == []
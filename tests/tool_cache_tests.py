@@ -0,0 +1,91 @@
+import asyncio
+import sys
+from pathlib import Path
+
+from strands import tool
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils.tool_cache import (
+    get_process_tool_cache,
+    invalidates,
+    memoize,
+    request_scope,
+)
+
+calls = []
+reading_list = ["Dune"]
+
+
+@tool
+@memoize(ttl=60, resources=("books",))
+def get_reading_list(status: str = "to_read") -> list:
+    """
+    Get the reading list.
+
+    Args:
+        status: The list to return.
+    """
+    calls.append(status)
+    return list(reading_list)
+
+
+@tool
+@invalidates("books")
+def add_book(title: str) -> str:
+    """
+    Add a book.
+
+    Args:
+        title: The title.
+    """
+    reading_list.append(title)
+    return f"Added {title}"
+
+
+@tool
+@memoize(ttl=60, scope="request")
+async def get_events(duration: str = "") -> str:
+    """
+    Get the events.
+
+    Args:
+        duration: Days to look ahead.
+    """
+    calls.append(duration)
+    return "Dentist" if duration != "error" else "Error: calendar is offline"
+
+
+def test_results_are_reused_until_a_write_tool_invalidates_them():
+    """Equal calls hit the cache, also with defaults spelled out, until the resource changes."""
+    get_process_tool_cache().invalidate()
+    calls.clear()
+
+    assert get_reading_list() == ["Dune"]
+    assert get_reading_list(status="to_read") == ["Dune"]
+    assert calls == ["to_read"]
+
+    add_book(title="Hyperion")
+
+    assert get_reading_list() == ["Dune", "Hyperion"]
+    assert calls == ["to_read", "to_read"]
+
+
+def test_request_scoped_results_live_for_one_request():
+    """Request-scoped tools share results inside a request scope only; errors are not cached."""
+    calls.clear()
+
+    async def request():
+        with request_scope():
+            await get_events(duration="1")
+            # Sub-agents run their tools in tasks that copy the context.
+            await asyncio.gather(get_events("1"), get_events(duration="1"))
+            await get_events("error")
+            await get_events("error")
+
+    asyncio.run(request())
+    asyncio.run(request())
+    asyncio.run(get_events("1"))
+
+    assert calls == ["1", "error", "error", "1", "error", "error", "1"]
+    # The tool spec is still built from the original signature.
+    assert get_events.tool_spec["inputSchema"]["json"]["properties"]["duration"]
@@ -0,0 +1,104 @@
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+import requests
+from opentelemetry import trace
+from strands import tool
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.agents.agent_pool import query_sub_agent
+from src.schemas.config_schema import TracingConfig
+from src.utils.tracing import format_trace_report, load_spans, setup_tracing
+from tests.stream_query_tests import make_agent_class
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+server = HTTPServer(("127.0.0.1", 0), OkHandler)
+
+
+@tool
+def fetch() -> str:
+    """Fetch the page."""
+    url = f"http://127.0.0.1:{server.server_port}/page?apikey=secret"
+    return requests.get(url, timeout=5).text
+
+
+@tool
+async def ask_helper(question: str) -> str:
+    """
+    Ask the helper agent.
+
+    Args:
+        question: The question.
+    """
+    return str(await query_sub_agent(Helper, question, 2, 5))
+
+
+def call_once(tool_name):
+    def script(messages):
+        if "toolResult" in messages[-1]["content"][0]:
+            return [{"text": "Done"}]
+        return [
+            {"id": f"{tool_name}-call", "name": tool_name, "input": {"question": "?"}}
+        ]
+
+    return script
+
+
+Helper = make_agent_class(
+    "Helper", "openrouter/test-traced-helper", call_once("fetch"), [fetch]
+)
+Orchestrator = make_agent_class(
+    "Orchestrator",
+    "openrouter/test-traced-orchestrator",
+    call_once("ask_helper"),
+    [ask_helper],
+)
+
+
+def test_sub_agent_spans_nest_under_the_calling_tool(tmp_path):
+    """Query, tool, model and HTTP spans form one tree across the agent hop."""
+    trace_file = tmp_path / "traces.jsonl"
+    setup_tracing(TracingConfig(enabled=True, trace_file=str(trace_file)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    Orchestrator().query("Ask the helper")
+    trace.get_tracer_provider().force_flush()
+    server.shutdown()
+
+    spans = load_spans(trace_file)
+    by_id = {span["context"]["span_id"]: span for span in spans}
+
+    def ancestors(span):
+        names = []
+        while span.get("parent_id") in by_id:
+            span = by_id[span["parent_id"]]
+            names.append(span["name"])
+        return names
+
+    helper_query = next(s for s in spans if s["name"] == "charon.query Helper")
+    assert ancestors(helper_query)[:1] == ["charon.tool ask_helper"]
+    assert "charon.query Orchestrator" in ancestors(helper_query)
+
+    http = next(s for s in spans if s["name"] == "HTTP GET")
+    assert ancestors(http)[0] == "charon.tool fetch"
+    assert "apikey" not in http["attributes"]["url.full"]
+    assert http["attributes"]["http.response.status_code"] == 200
+
+    chats = [s for s in spans if s["name"] == "chat"]
+    assert len(chats) == 4
+    assert all("gen_ai.server.time_to_first_token" in s["attributes"] for s in chats)
+
+    report = format_trace_report(spans)
+    assert "charon.query Helper" in report